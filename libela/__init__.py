@@ -6,5 +6,7 @@ __version__ = metadata.version("libela")
 
 # Public sub-packages
 from . import hyperelastic
+from . import viscoelastic
+from . import multiphysics
 
-__all__ = ["hyperelastic"]
\ No newline at end of file
+__all__ = ["hyperelastic", "viscoelastic", "multiphysics"]
\ No newline at end of file
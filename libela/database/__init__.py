@@ -0,0 +1,22 @@
+"""
+Database sub-package
+====================
+Indexed on-disk storage of fitted material parameters and ingestion of
+raw test data.
+"""
+
+# --- Re-export core symbols ------------------------------------
+from .store import (
+    material_store,
+    source_hash,
+)
+from .ingest import (
+    read_test_data,
+    iter_test_data,
+    unit_factor,
+)
+
+__all__ = [
+    "material_store", "source_hash",
+    "read_test_data", "iter_test_data", "unit_factor"
+]
@@ -0,0 +1,296 @@
+"""
+Test-data ingestion
+===================
+
+Stream raw testing-machine exports into stretch / stress arrays.
+
+Exports are read in chunks — CSV through NumPy's C parser on blocks of
+lines, raw binary through :class:`numpy.memmap` slices — so files much
+larger than memory pass through with a fixed footprint. Each chunk is
+
+1. converted to SI with vectorized unit factors,
+2. turned into stretch :math:`\\lambda = 1 + \\Delta l / L_0` and nominal
+   stress :math:`F / A_0` (or true stress :math:`\\lambda F / A_0`,
+   assuming incompressibility),
+3. thinned: repeated samples are dropped and dense segments are reduced to
+   at most one point per stretch bin of width ``min_spacing`` (bins are
+   tracked along the load path, so loading/unloading cycles are kept).
+
+:func:`read_test_data` returns contiguous float64 arrays ready for
+:meth:`~libela.hyperelastic.operations.operations.stress`, the fitters and
+the store; :func:`iter_test_data` yields the same per chunk, e.g. for
+:class:`~libela.hyperelastic.online.online_fitter`.
+
+Public API
+----------
+read_test_data    — load a whole export
+iter_test_data    — stream an export chunk by chunk
+unit_factor       — SI scale factor of a unit string
+
+Notes
+-----
+Supported units: force N, kN, mN, lbf; length m, cm, mm, um, in; area m^2,
+cm^2, mm^2, in^2; stress Pa, kPa, MPa, GPa, psi; time s, ms, min, h. The
+output stress unit defaults to MPa.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+_UNITS = {
+    'force': {'N': 1.0, 'kN': 1e3, 'mN': 1e-3, 'lbf': 4.4482216152605},
+    'length': {'m': 1.0, 'cm': 1e-2, 'mm': 1e-3, 'um': 1e-6, 'in': 0.0254},
+    'area': {'m^2': 1.0, 'cm^2': 1e-4, 'mm^2': 1e-6, 'in^2': 0.0254**2},
+    'stress': {'Pa': 1.0, 'kPa': 1e3, 'MPa': 1e6, 'GPa': 1e9, 'psi': 6894.757293168},
+    'time': {'s': 1.0, 'ms': 1e-3, 'min': 60.0, 'h': 3600.0},
+}
+_QUANTITY = {'force': 'force', 'displacement': 'length', 'stress': 'stress', 'time': 'time',
+             'gauge_length': 'length', 'area': 'area'}
+_DEFAULT_UNITS = {'force': 'N', 'displacement': 'mm', 'gauge_length': 'mm', 'area': 'mm^2',
+                  'stress': 'MPa', 'time': 's'}
+
+
+def unit_factor(unit: str, quantity: str) -> float:
+    """
+    Return the factor converting `unit` to SI.
+
+    Parameters
+    ----------
+    unit : str
+        Unit string, e.g. 'kN' or 'mm^2'.
+    quantity : {'force', 'length', 'area', 'stress', 'time'}
+        Physical quantity.
+
+    Returns
+    -------
+    float
+        SI value of one `unit`.
+    """
+    try:
+        return _UNITS[quantity][unit]
+    except KeyError:
+        raise ValueError(f"Unknown {quantity} unit: {unit!r}. "
+                         f"Supported: {sorted(_UNITS.get(quantity, {}))}") from None
+
+
+def iter_test_data(path: str | os.PathLike,
+                   *,
+                   columns: dict,
+                   gauge_length: float | None = None,
+                   area: float | None = None,
+                   units: dict | None = None,
+                   stress_measure: str = 'nominal',
+                   stress_unit: str = 'MPa',
+                   min_spacing: float = 0.0,
+                   file_format: str = 'csv',
+                   delimiter: str = ',',
+                   skiprows: int = 0,
+                   n_columns: int | None = None,
+                   dtype=np.float32,
+                   chunk_size: int = 1_000_000):
+    """
+    Stream a raw export as ``(stretch, stress, time)`` chunks.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        CSV (optionally with one header line) or headerless binary file.
+    columns : dict
+        Role → column name (CSV header) or index. Roles are 'force' and
+        'displacement' (needs `gauge_length` and `area`), or 'stretch' /
+        'engineering' and 'stress' for already reduced data; 'time' is optional.
+    gauge_length : float, optional
+        Initial gauge length L₀ (in ``units['gauge_length']``).
+    area : float, optional
+        Initial cross-section A₀ (in ``units['area']``).
+    units : dict, optional
+        Role → unit string; defaults N, mm, mm, mm^2, MPa, s.
+    stress_measure : {'nominal', 'true'}, optional
+        Output stress measure (nominal = first Piola–Kirchhoff, true =
+        Cauchy under incompressibility). Default is 'nominal'.
+    stress_unit : str, optional
+        Output stress unit. Default is 'MPa'.
+    min_spacing : float, optional
+        Stretch bin width for downsampling dense segments; 0 only drops
+        exact repeats. Default is 0.
+    file_format : {'csv', 'binary'}, optional
+        Input format. Default is 'csv'.
+    delimiter : str, optional
+        CSV delimiter. Default is ','.
+    skiprows : int, optional
+        CSV lines to skip before the header / data. Default is 0.
+    n_columns : int, optional
+        Number of columns of a binary file (required for 'binary').
+    dtype : numpy dtype, optional
+        Element type of a binary file. Default is float32.
+    chunk_size : int, optional
+        Rows per chunk. Default is 1 000 000.
+
+    Yields
+    ------
+    tuple of np.ndarray
+        ``(stretch, stress, time)`` float64 arrays of the kept rows; `time`
+        is None without a 'time' column.
+    """
+    if stress_measure not in ('nominal', 'true'):
+        raise ValueError("Invalid stress_measure. Use 'nominal' or 'true'.")
+    units = {**_DEFAULT_UNITS, **(units or {})}
+    stress_scale = 1.0 / unit_factor(stress_unit, 'stress')
+    raw = 'force' in columns
+    if raw:
+        if 'displacement' not in columns or gauge_length is None or area is None:
+            raise ValueError("force data needs a 'displacement' column, gauge_length and area.")
+        L0 = gauge_length * unit_factor(units['gauge_length'], 'length')
+        A0 = area * unit_factor(units['area'], 'area')
+        displacement_scale = unit_factor(units['displacement'], 'length') / L0
+        force_scale = unit_factor(units['force'], 'force') / A0 * stress_scale
+    elif 'stress' not in columns or not ({'stretch', 'engineering'} & set(columns)):
+        raise ValueError("columns need 'force' and 'displacement', or 'stretch'/'engineering' and 'stress'.")
+    else:
+        input_stress_scale = unit_factor(units['stress'], 'stress') * stress_scale
+    time_scale = unit_factor(units['time'], 'time')
+
+    if file_format == 'csv':
+        blocks, header = _csv_blocks(path, delimiter, skiprows, chunk_size)
+    elif file_format == 'binary':
+        if n_columns is None:
+            raise ValueError("binary files need n_columns.")
+        blocks, header = _binary_blocks(path, n_columns, dtype, chunk_size), None
+    else:
+        raise ValueError("Invalid file_format. Use 'csv' or 'binary'.")
+    index = {role: _column_index(col, header) for role, col in columns.items()}
+
+    last = None
+    for block in blocks:
+        if raw:
+            stretch = 1.0 + block[:, index['displacement']] * displacement_scale
+            stress = block[:, index['force']] * force_scale
+        else:
+            stretch = block[:, index['stretch']] if 'stretch' in index \
+                else 1.0 + block[:, index['engineering']]
+            stress = block[:, index['stress']] * input_stress_scale
+        if stress_measure == 'true':
+            stress = stress * stretch
+        time = block[:, index['time']] * time_scale if 'time' in index else None
+
+        keep, last = _thin(stretch, stress, min_spacing, last)
+        yield (np.ascontiguousarray(stretch[keep], dtype=np.float64),
+               np.ascontiguousarray(stress[keep], dtype=np.float64),
+               None if time is None else np.ascontiguousarray(time[keep], dtype=np.float64))
+
+
+def read_test_data(path: str | os.PathLike, **kwargs) -> dict:
+    """
+    Load a raw export as contiguous stretch / stress arrays.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        CSV or binary export.
+    **kwargs
+        Options of :func:`iter_test_data`.
+
+    Returns
+    -------
+    dict
+        ``'stretch'``, ``'stress'`` (float64, C-contiguous), ``'time'``
+        (or None), ``'stress_type'`` ('piola' for nominal, 'cauchy' for true
+        stress, as expected by ``stress_type=`` arguments) and ``'stress_unit'``.
+
+    Examples
+    --------
+    >>> data = read_test_data("ut_run12.csv", columns={"force": "Force", "displacement": "Ext"},
+    ...                       gauge_length=25.0, area=4.0, units={"force": "kN"}, min_spacing=1e-3)
+    >>> fit = online_fitter(yeoh(), [0.1, 0, 0], stress_type=data["stress_type"])
+    >>> fit.update(data["stretch"], data["stress"])
+    """
+    chunks = list(iter_test_data(path, **kwargs))
+    has_time = bool(chunks) and chunks[0][2] is not None
+    return {'stretch': np.concatenate([c[0] for c in chunks]) if chunks else np.empty(0),
+            'stress': np.concatenate([c[1] for c in chunks]) if chunks else np.empty(0),
+            'time': np.concatenate([c[2] for c in chunks]) if has_time else None,
+            'stress_type': 'cauchy' if kwargs.get('stress_measure') == 'true' else 'piola',
+            'stress_unit': kwargs.get('stress_unit', 'MPa')}
+
+
+# --------------------------------------------------------------------------
+# helper functions
+# --------------------------------------------------------------------------
+
+def _csv_blocks(path, delimiter, skiprows, chunk_size):
+    """Header names (or None) and a generator of ``(rows, cols)`` float blocks."""
+    fh = open(path, 'r', encoding='utf-8', errors='replace')
+    for _ in range(skiprows):
+        fh.readline()
+    first = fh.readline()
+    header = None
+    try:
+        [float(x) for x in first.split(delimiter)]
+        pending = [first]
+    except ValueError:
+        header = [name.strip().strip('"') for name in first.split(delimiter)]
+        pending = []
+
+    def blocks():
+        with fh:
+            lines = pending
+            while True:
+                while len(lines) < chunk_size:
+                    line = fh.readline()
+                    if not line:
+                        break
+                    if line.strip():
+                        lines.append(line)
+                if not lines:
+                    return
+                yield np.atleast_2d(np.loadtxt(lines, delimiter=delimiter, dtype=np.float64))
+                if len(lines) < chunk_size:
+                    return
+                lines = []
+    return blocks(), header
+
+
+def _binary_blocks(path, n_columns, dtype, chunk_size):
+    """Generator of ``(rows, cols)`` float blocks from a headerless binary file."""
+    data = np.memmap(path, dtype=dtype, mode='r')
+    if data.size % n_columns:
+        raise ValueError(f"File size is not a multiple of {n_columns} columns.")
+    data = data.reshape(-1, n_columns)
+    for start in range(0, data.shape[0], chunk_size):
+        yield np.asarray(data[start:start + chunk_size], dtype=np.float64)
+
+
+def _column_index(column, header):
+    """Column index from a name (needs a header) or an integer."""
+    if isinstance(column, (int, np.integer)):
+        return int(column)
+    if header is None or column not in header:
+        raise ValueError(f"Column {column!r} not found in header {header}.")
+    return header.index(column)
+
+
+def _thin(stretch, stress, min_spacing, last):
+    """
+    Mask of rows to keep, and the state carried to the next chunk.
+
+    Drops repeats of the previous (stretch, stress) sample and, with
+    ``min_spacing > 0``, all but the first sample of each run of rows in the
+    same stretch bin.
+    """
+    if stretch.size == 0:
+        return np.zeros(0, dtype=bool), last
+    if min_spacing > 0:
+        key = np.floor(stretch / min_spacing)
+        previous = np.concatenate(([np.nan if last is None else last], key[:-1]))
+        keep = key != previous
+        state = key[-1]
+    else:
+        prev_stretch = np.concatenate(([np.nan if last is None else last[0]], stretch[:-1]))
+        prev_stress = np.concatenate(([np.nan if last is None else last[1]], stress[:-1]))
+        keep = (stretch != prev_stretch) | (stress != prev_stress)
+        state = (stretch[-1], stress[-1])
+    keep &= np.isfinite(stretch) & np.isfinite(stress)
+    return keep, state
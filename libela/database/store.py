@@ -0,0 +1,560 @@
+"""
+Material-parameter store
+========================
+
+Indexed, on-disk database of fitted material parameters.
+
+A store is a directory holding
+
+* ``index.sqlite`` — one row per parameter set (model, compound,
+  temperature, fit metadata, source-data hash) plus one row per model
+  (import path, compressibility, constructor options and parameter
+  ordering), with SQL indexes on model, compound and temperature;
+* ``params/<model>.f64`` — the parameter sets of each model as one
+  append-only, row-major float64 array, opened with :class:`numpy.memmap`.
+
+Queries run against the SQLite indexes and return row numbers into the
+per-model arrays, so thousands of parameter sets load as a single array and
+go straight into :meth:`~libela.hyperelastic.operations.operations.stress_batch`.
+
+Public API
+----------
+material_store    — open or create a store
+source_hash       — SHA-256 fingerprint of raw test data
+
+Notes
+-----
+* Only the standard library (``sqlite3``, ``json``, ``hashlib``) and NumPy are
+  required.
+* Parameter order is the model's
+  :meth:`~libela.hyperelastic.operations.operations.model_param_symbols`
+  order at the time the model was first stored; it is checked on every insert.
+* :meth:`material_store.load_model` rebuilds models from their stored
+  constructor options: ``compressible``, hgo ``families``/``dispersion``,
+  composite terms (recursively) and numeric models whose energy function is
+  importable by module path. Models with different options get different
+  keys.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import sqlite3
+
+import numpy as np
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS models (
+    model        TEXT PRIMARY KEY,
+    class_path   TEXT NOT NULL,
+    compressible INTEGER NOT NULL,
+    param_names  TEXT NOT NULL,
+    n_rows       INTEGER NOT NULL DEFAULT 0,
+    spec         TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS materials (
+    id           INTEGER PRIMARY KEY,
+    model        TEXT NOT NULL REFERENCES models(model),
+    row          INTEGER NOT NULL,
+    compound     TEXT,
+    temperature  REAL,
+    metadata     TEXT,
+    source_hash  TEXT,
+    created      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_materials_model ON materials(model, compound, temperature);
+CREATE INDEX IF NOT EXISTS idx_materials_compound ON materials(compound, temperature);
+CREATE INDEX IF NOT EXISTS idx_materials_temperature ON materials(temperature);
+CREATE INDEX IF NOT EXISTS idx_materials_hash ON materials(source_hash);
+"""
+
+
+class material_store:
+    """
+    Indexed store of fitted material parameters.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Store directory; created if missing.
+
+    Examples
+    --------
+    >>> from libela.hyperelastic import yeoh
+    >>> store = material_store("materials.db")
+    >>> store.add(yeoh(), [0.5, 0.01, 0.001], compound="NR-40", temperature=296.0)
+    >>> ids = store.query(model=yeoh(), compound="NR-40")
+    >>> sigma = store.stress(ids, lam)     # (len(ids), len(lam))
+    """
+    def __init__(self, path: str | os.PathLike):
+        """
+        Open (or create) a store.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Store directory.
+        """
+        self.path = os.fspath(path)
+        os.makedirs(os.path.join(self.path, "params"), exist_ok=True)
+        self.connection = sqlite3.connect(os.path.join(self.path, "index.sqlite"))
+        self.connection.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the SQLite connection."""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---- writing -------------------------------------------------------
+
+    def add(self,
+            model,
+            params: list[float],
+            *,
+            compound: str | None = None,
+            temperature: float | None = None,
+            metadata: dict | None = None,
+            source_data=None) -> int:
+        """
+        Store one fitted parameter set.
+
+        Parameters
+        ----------
+        model : operations
+            Model instance the parameters belong to.
+        params : list of float
+            Parameters in the model's parameter order.
+        compound : str, optional
+            Compound or material name.
+        temperature : float, optional
+            Test temperature.
+        metadata : dict, optional
+            JSON-serializable fit metadata (cost, optimizer, protocol, …).
+        source_data : array_like or tuple of array_like, optional
+            Raw data the parameters were fitted to; only its
+            :func:`source_hash` is stored.
+
+        Returns
+        -------
+        int
+            Record id.
+        """
+        return int(self.add_many(model, np.atleast_2d(np.asarray(params, dtype=float)),
+                                 compound=compound,
+                                 temperature=None if temperature is None else [temperature],
+                                 metadata=None if metadata is None else [metadata],
+                                 source_data=None if source_data is None else [source_data])[0])
+
+    def add_many(self,
+                 model,
+                 params: np.ndarray,
+                 *,
+                 compound=None,
+                 temperature=None,
+                 metadata: list[dict] | None = None,
+                 source_data: list | None = None) -> np.ndarray:
+        """
+        Store many parameter sets of one model in a single transaction.
+
+        Parameters
+        ----------
+        model : operations
+            Model instance.
+        params : array_like
+            Parameter sets, shape ``(N_sets, N_params)``.
+        compound : str or sequence of str, optional
+            One compound for all sets, or one per set.
+        temperature : float or array_like, optional
+            One temperature for all sets, or one per set.
+        metadata : list of dict, optional
+            Fit metadata per set.
+        source_data : list, optional
+            Raw data per set, hashed with :func:`source_hash`.
+
+        Returns
+        -------
+        np.ndarray
+            Record ids, shape ``(N_sets,)``.
+        """
+        params = np.ascontiguousarray(params, dtype=np.float64)
+        n_sets = params.shape[0]
+        key = self._register(model, params.shape[1])
+
+        compounds = _per_set(compound, n_sets)
+        temperatures = _per_set(temperature, n_sets)
+        metadata = metadata if metadata is not None else [None] * n_sets
+        hashes = ([None] * n_sets if source_data is None
+                  else [source_hash(*d) if isinstance(d, tuple) else source_hash(d) for d in source_data])
+
+        with self.connection:
+            (first_row,) = self.connection.execute(
+                "SELECT n_rows FROM models WHERE model = ?", (key,)).fetchone()
+            with open(self._param_file(key), "ab") as fh:
+                fh.truncate(first_row * params.shape[1] * params.itemsize)  # drop rows of a failed insert
+                fh.write(params.tobytes())
+            created = datetime.datetime.now(datetime.timezone.utc).isoformat()
+            self.connection.executemany(
+                "INSERT INTO materials (model, row, compound, temperature, metadata, source_hash, created) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(key, first_row + i, compounds[i],
+                  None if temperatures[i] is None else float(temperatures[i]),
+                  None if metadata[i] is None else json.dumps(metadata[i]),
+                  hashes[i], created) for i in range(n_sets)])
+            self.connection.execute("UPDATE models SET n_rows = ? WHERE model = ?",
+                                    (first_row + n_sets, key))
+            (last_id,) = self.connection.execute(
+                "SELECT MAX(id) FROM materials WHERE model = ?", (key,)).fetchone()
+        return np.arange(last_id - n_sets + 1, last_id + 1)
+
+    # ---- queries -------------------------------------------------------
+
+    def query(self,
+              *,
+              model=None,
+              compound: str | None = None,
+              temperature=None,
+              source_hash: str | None = None) -> np.ndarray:
+        """
+        Return the ids of matching records, using the SQL indexes.
+
+        Parameters
+        ----------
+        model : operations or str, optional
+            Model instance or model key.
+        compound : str, optional
+            Compound name.
+        temperature : float or tuple of float, optional
+            Exact temperature, or an inclusive ``(low, high)`` range.
+        source_hash : str, optional
+            Source-data hash.
+
+        Returns
+        -------
+        np.ndarray
+            Matching record ids in insertion order.
+        """
+        clauses, values = [], []
+        if model is not None:
+            clauses.append("model = ?")
+            values.append(model if isinstance(model, str) else _model_key(model))
+        if compound is not None:
+            clauses.append("compound = ?")
+            values.append(compound)
+        if temperature is not None:
+            if np.ndim(temperature) == 0:
+                clauses.append("temperature = ?")
+                values.append(float(temperature))
+            else:
+                clauses.append("temperature BETWEEN ? AND ?")
+                values.extend(float(t) for t in temperature)
+        if source_hash is not None:
+            clauses.append("source_hash = ?")
+            values.append(source_hash)
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        rows = self.connection.execute(f"SELECT id FROM materials{where} ORDER BY id", values)
+        return np.array([r[0] for r in rows], dtype=np.int64)
+
+    def records(self, ids) -> list[dict]:
+        """
+        Return the metadata of the given records.
+
+        Parameters
+        ----------
+        ids : array_like of int
+            Record ids.
+
+        Returns
+        -------
+        list of dict
+            One dictionary per id with model, compound, temperature,
+            metadata, source hash and creation time.
+        """
+        out = []
+        for record_id in np.atleast_1d(ids):
+            row = self.connection.execute(
+                "SELECT id, model, compound, temperature, metadata, source_hash, created "
+                "FROM materials WHERE id = ?", (int(record_id),)).fetchone()
+            if row is None:
+                raise KeyError(f"No record with id {record_id}.")
+            out.append({"id": row[0], "model": row[1], "compound": row[2],
+                        "temperature": row[3],
+                        "metadata": None if row[4] is None else json.loads(row[4]),
+                        "source_hash": row[5], "created": row[6]})
+        return out
+
+    def models(self) -> dict:
+        """
+        Return the registered models.
+
+        Returns
+        -------
+        dict
+            Model key → ``{'class_path', 'compressible', 'param_names', 'n_rows',
+            'spec'}``, where ``spec`` holds the constructor options.
+        """
+        rows = self.connection.execute(
+            "SELECT model, class_path, compressible, param_names, n_rows, spec FROM models")
+        return {r[0]: {"class_path": r[1], "compressible": bool(r[2]),
+                       "param_names": json.loads(r[3]), "n_rows": r[4],
+                       "spec": json.loads(r[5])} for r in rows}
+
+    # ---- loading -------------------------------------------------------
+
+    def load_params(self, ids=None, *, model=None) -> np.ndarray:
+        """
+        Load parameter sets as one array.
+
+        With `model` only, the model's whole parameter file is returned as a
+        read-only :class:`numpy.memmap` without copying.
+
+        Parameters
+        ----------
+        ids : array_like of int, optional
+            Record ids, all of the same model.
+        model : operations or str, optional
+            Model instance or key; required when `ids` is omitted.
+
+        Returns
+        -------
+        np.ndarray
+            Parameters, shape ``(N_sets, N_params)``.
+        """
+        if ids is None:
+            if model is None:
+                raise ValueError("Provide ids or model.")
+            return self._memmap(model if isinstance(model, str) else _model_key(model))
+        key, rows = self._rows(ids)
+        return np.asarray(self._memmap(key)[rows])
+
+    def load_model(self, ids=None, *, model: str | None = None):
+        """
+        Re-create the model instance for stored records.
+
+        Parameters
+        ----------
+        ids : array_like of int, optional
+            Record ids, all of the same model.
+        model : str, optional
+            Model key, as an alternative to `ids`.
+
+        Returns
+        -------
+        operations
+            A fresh model instance, built with the stored constructor options.
+
+        Raises
+        ------
+        ValueError
+            For numeric models whose energy function is not importable
+            (lambdas, local functions); pass the model to :meth:`stress`
+            instead.
+        """
+        key = model if ids is None else self._rows(ids)[0]
+        return _build_model(self.models()[key]["spec"])
+
+    def stress(self,
+               ids,
+               strain: np.ndarray | float,
+               *,
+               model=None,
+               protocol: str | None = None,
+               stress_type: str | None = None,
+               strain_type: str | None = None):
+        """
+        Evaluate the stress of many stored parameter sets in one batched call.
+
+        Parameters
+        ----------
+        ids : array_like of int
+            Record ids, all of the same model.
+        strain : array_like or float
+            Strain shared by all parameter sets.
+        model : operations, optional
+            Model instance to evaluate with (reusing its cached kernels).
+            Default re-creates the stored model class.
+        protocol, stress_type, strain_type : str, optional
+            As in :meth:`~libela.hyperelastic.operations.operations.stress`.
+
+        Returns
+        -------
+        np.ndarray or tuple of np.ndarray
+            Stress of shape ``(len(ids),) + strain.shape``.
+        """
+        model = model if model is not None else self.load_model(ids)
+        return model.stress_batch(strain, self.load_params(ids),
+                                  protocol=protocol,
+                                  stress_type=stress_type,
+                                  strain_type=strain_type)
+
+    # ---- internals -----------------------------------------------------
+
+    def _register(self, model, n_params):
+        key = _model_key(model)
+        names = [s.name for s in model.model_param_symbols()]
+        if len(names) != n_params:
+            raise ValueError(f"{key} has {len(names)} parameters {names}, got {n_params}.")
+        row = self.connection.execute(
+            "SELECT param_names FROM models WHERE model = ?", (key,)).fetchone()
+        if row is None:
+            spec = _model_spec(model)
+            with self.connection:
+                self.connection.execute(
+                    "INSERT INTO models (model, class_path, compressible, param_names, spec) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, spec["class_path"], int(bool(getattr(model, "compressible", False))),
+                     json.dumps(names), json.dumps(spec)))
+        elif json.loads(row[0]) != names:
+            raise ValueError(f"Parameter order of {key} changed: stored {row[0]}, model {names}.")
+        return key
+
+    def _rows(self, ids):
+        ids = np.atleast_1d(np.asarray(ids, dtype=np.int64))
+        placeholders = ",".join("?" * ids.size)
+        found = {r[0]: (r[1], r[2]) for r in self.connection.execute(
+            f"SELECT id, model, row FROM materials WHERE id IN ({placeholders})",
+            [int(i) for i in ids])}
+        missing = [int(i) for i in ids if int(i) not in found]
+        if missing:
+            raise KeyError(f"No records with ids {missing}.")
+        keys, rows = zip(*(found[int(i)] for i in ids))
+        if len(set(keys)) != 1:
+            raise ValueError("All ids must belong to the same model.")
+        return keys[0], np.array(rows, dtype=np.int64)
+
+    def _param_file(self, key):
+        return os.path.join(self.path, "params", f"{key}.f64")
+
+    def _memmap(self, key):
+        info = self.models().get(key)
+        if info is None:
+            raise KeyError(f"Unknown model {key}.")
+        shape = (info["n_rows"], len(info["param_names"]))
+        if shape[0] == 0:
+            return np.empty(shape)
+        return np.memmap(self._param_file(key), dtype=np.float64, mode="r", shape=shape)
+
+
+# --------------------------------------------------------------------------
+# helper functions
+# --------------------------------------------------------------------------
+
+def source_hash(*arrays) -> str:
+    """
+    Return a SHA-256 fingerprint of raw test data.
+
+    Dtype, shape and contents of every array enter the hash, so identical
+    data give identical hashes regardless of memory layout.
+
+    Parameters
+    ----------
+    *arrays : array_like
+        Data arrays, e.g. ``(strain, stress)``.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+    for a in arrays:
+        a = np.ascontiguousarray(a)
+        digest.update(f"{a.dtype.str}{a.shape}".encode())
+        digest.update(a.tobytes())
+    return digest.hexdigest()
+
+
+def _model_key(model):
+    """
+    Storage key of a model instance, e.g. ``neohookean`` or ``neohookean-compressible``.
+
+    Models with constructor options besides ``compressible`` (hgo variants,
+    composites, numeric models) get a hash of their spec appended.
+    """
+    key = type(model).__name__
+    if getattr(model, "compressible", False):
+        key = f"{key}-compressible"
+    spec = _model_spec(model)
+    if "terms" in spec or set(spec["options"]) - {"compressible"}:
+        digest = hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()
+        key = f"{key}-{digest[:10]}"
+    return key
+
+
+def _model_spec(model):
+    """JSON-serializable class path and constructor options of a model instance."""
+    from libela.hyperelastic.composite import composite_model, _original
+    from libela.hyperelastic.numeric import numeric_model
+
+    if _original(model) is not model:            # re-wrapped by the rebuilt composite
+        return _model_spec(_original(model))
+    cls = type(model)
+    spec = {"class_path": f"{cls.__module__}:{cls.__qualname__}"}
+    if isinstance(model, composite_model):
+        spec["terms"] = [{"model": _model_spec(t.model), "scale": t.scale, "params": t.params}
+                         for t in model.terms]
+    elif isinstance(model, numeric_model):
+        spec["options"] = {"energy_fn": _callable_path(model.energy_fn),
+                           "param_names": [s.name for s in model.model_param_symbols()],
+                           "compressible": bool(model.compressible),
+                           "derivative": model.derivative}
+    else:
+        parameters = inspect.signature(cls.__init__).parameters.values()
+        spec["options"] = {p.name: getattr(model, p.name) for p in parameters
+                           if p.kind is inspect.Parameter.KEYWORD_ONLY and hasattr(model, p.name)}
+    return spec
+
+
+def _build_model(spec):
+    """Instantiate a model from :func:`_model_spec` output."""
+    cls = _import(spec["class_path"])
+    if "terms" in spec:
+        from libela.hyperelastic.composite import term
+        return cls(*(term(_build_model(t["model"]), t["scale"], t["params"]) for t in spec["terms"]))
+    options = dict(spec["options"])
+    if "energy_fn" in options:
+        path = options.pop("energy_fn")
+        if path is None:
+            raise ValueError("The stored numeric model's energy function is not importable; "
+                             "pass the model instance explicitly.")
+        return cls(_import(path), options.pop("param_names"), **options)
+    return cls(**options)
+
+
+def _callable_path(fn):
+    """``module:qualname`` of an importable function, else None."""
+    path = f"{getattr(fn, '__module__', None)}:{getattr(fn, '__qualname__', '<unknown>')}"
+    if "<" in path:
+        return None
+    try:
+        return path if _import(path) is fn else None
+    except (ImportError, AttributeError):
+        return None
+
+
+def _import(path):
+    """Object named by a ``module:qualname`` path."""
+    module_name, _, qualname = path.partition(":")
+    obj = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def _per_set(value, n_sets):
+    """Broadcast a scalar (or None) to a per-set list."""
+    if value is None or isinstance(value, str) or np.ndim(value) == 0:
+        return [value] * n_sets
+    value = list(value)
+    if len(value) != n_sets:
+        raise ValueError("Per-set values must have one entry per parameter set.")
+    return value
@@ -11,7 +11,11 @@ from .hyperelastic import (
     klosnersegal,
     yeoh,
     polynomial,
+    hgo,
+    volumetric,
 )
+from .numeric import numeric_model
+from .composite import composite_model, term
 from . import operations as ops        # module alias, not symbol
 # Convenience aliases
 neo_hookean       = neohookean
@@ -19,6 +23,7 @@ neo_hookean_comp  = neohookean(compressible=True)
 mooney_rivlin     = mooneyrivlin
 
 __all__ = [
-    "neohookean", "mooneyrivlin", "klosnersegal", "yeoh", "polynomial",
+    "neohookean", "mooneyrivlin", "klosnersegal", "yeoh", "polynomial", "hgo", "volumetric",
+    "numeric_model", "composite_model", "term",
     "ops", "neo_hookean", "neo_hookean_comp", "mooney_rivlin"
 ]
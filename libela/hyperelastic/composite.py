@@ -0,0 +1,414 @@
+"""
+composite.py
+============
+
+Strain energies composed from independent terms.
+
+A :class:`composite_model` is a weighted sum of existing models,
+
+.. math::
+
+   W(I_1, I_2, J;\\ \\theta) = \\sum_i c_i\\, W_i(I_1, I_2, J;\\ \\theta_i),
+
+where each θᵢ is a subset of the composite parameters θ. Parameters are
+merged by name: terms whose (optionally renamed) parameters have the same
+name share one composite parameter, in order of first appearance.
+Stress, pressure elimination and stress-measure changes are all linear in
+*W*, so every kernel of the composite — stress, tangent, parameter
+Jacobian, energy — is assembled from the compiled kernels of its terms. The
+terms compile and cache their kernels on their own instances, so model
+instances reused across composites are derived only once.
+
+Composites are built with :class:`term` / :class:`composite_model` or with
+the operators of :class:`~libela.hyperelastic.operations.operations`::
+
+    yeoh() + 0.5 * mooneyrivlin() + volumetric()
+
+Public API
+----------
+composite_model    — weighted sum of energy terms
+term               — one scaled, optionally renamed term
+
+Notes
+-----
+* A composite is compressible if any term is (e.g. a
+  :class:`~libela.hyperelastic.hyperelastic.volumetric` penalty); its
+  incompressible terms then form the isochoric part of the energy, evaluated
+  on the isochoric invariants :math:`\\bar I_1 = J^{-2/3} I_1`,
+  :math:`\\bar I_2 = J^{-4/3} I_2` (and :math:`\\bar I_4 = J^{-2/3} I_4`), so
+  the composite is stress-free in the reference state.
+* Merging by name means ``yeoh() + mooneyrivlin()`` has a single ``a_c10``
+  (the two C10 terms add up); rename with :class:`term` to keep them apart.
+* :meth:`~libela.hyperelastic.operations.operations.energy` of a composite is
+  the symbolic sum of its terms (not available when a term is a
+  :class:`~libela.hyperelastic.numeric.numeric_model`); the kernels never
+  use it.
+"""
+
+from __future__ import annotations
+
+import sympy as sp
+
+from .operations import operations, I1_sym, I2_sym, I4_sym, I6_sym, J_sym
+
+
+class term:
+    """
+    One scaled term of a :class:`composite_model`.
+
+    Parameters
+    ----------
+    model : operations
+        Hyperelastic model supplying the energy.
+    scale : float, optional
+        Constant factor cᵢ. Default is 1.
+    params : dict, optional
+        Renaming of the model's parameters, ``{model name: composite name}``.
+        Parameters are merged by name: terms whose (renamed) parameters
+        share a name share that composite parameter.
+
+    Examples
+    --------
+    >>> w = composite_model(term(neohookean(), params={"a_mu": "mu_1"}),
+    ...                     term(neohookean(), scale=0.5, params={"a_mu": "mu_2"}))
+    >>> w.model_param_symbols()
+    [mu_1, mu_2]
+    """
+    def __init__(self, model: operations, scale: float = 1.0, params: dict | None = None):
+        """
+        Initialize a term.
+
+        Parameters
+        ----------
+        model : operations
+            Hyperelastic model.
+        scale : float, optional
+            Constant factor. Default is 1.
+        params : dict, optional
+            Parameter renaming.
+        """
+        if not isinstance(model, operations):
+            raise ValueError("A term needs an operations model.")
+        self.model = model
+        self.scale = float(scale)
+        self.params = dict(params or {})
+        names = {s.name for s in model.model_param_symbols()}
+        unknown = set(self.params) - names
+        if unknown:
+            raise ValueError(f"Unknown parameters {sorted(unknown)}; the model has {sorted(names)}.")
+
+    def names(self) -> list[str]:
+        """Composite names of the model parameters, in model order."""
+        return [self.params.get(s.name, s.name) for s in self.model.model_param_symbols()]
+
+    def __repr__(self):
+        return f"term({self.model.__class__.__name__}, scale={self.scale}, params={self.params})"
+
+
+class composite_model(operations):
+    """
+    Weighted sum of strain-energy terms with shared parameters.
+
+    Inherits from
+    -------------
+    operations
+
+    Parameters
+    ----------
+    *terms : operations, term or composite_model
+        Terms of the sum; bare models enter with scale 1 and nested
+        composites are flattened. If any term is compressible, so is the
+        composite, and its incompressible terms are evaluated on the
+        isochoric invariants.
+
+    Notes
+    -----
+    Composite parameters are the union of the term parameter names, in order
+    of first appearance; equal names are one shared parameter. Use
+    :class:`term` renaming to keep equally named parameters separate.
+
+    Examples
+    --------
+    >>> w = yeoh() + 0.5 * mooneyrivlin() + volumetric()
+    >>> [s.name for s in w.model_param_symbols()]      # a_c10 shared by yeoh and mooneyrivlin
+    ['a_c10', 'b_c20', 'c_c20', 'b_c01', 'a_K']
+    >>> w2 = yeoh() + term(mooneyrivlin(), scale=0.5, params={"a_c10": "c10_mr"}) + volumetric()
+    >>> sigma = w2.stress(lam, params)
+    """
+    def __init__(self, *terms):
+        """
+        Initialize a composite model.
+
+        Parameters
+        ----------
+        *terms : operations, term or composite_model
+            Terms of the sum.
+        """
+        flat = []
+        for item in terms:
+            if isinstance(item, composite_model):
+                flat.extend(item.terms)
+            elif isinstance(item, term) and isinstance(item.model, composite_model):
+                for t in item.model.terms:
+                    renames = {s.name: item.params.get(n, n)
+                               for s, n in zip(t.model.model_param_symbols(), t.names())}
+                    flat.append(term(t.model, item.scale * t.scale, renames))
+            elif isinstance(item, term):
+                flat.append(item)
+            elif isinstance(item, operations):
+                flat.append(term(item))
+            else:
+                raise ValueError(f"Cannot add {type(item).__name__} to a composite model.")
+        if not flat:
+            raise ValueError("A composite model needs at least one term.")
+        self.compressible = any(getattr(t.model, 'compressible', False) for t in flat)
+        if self.compressible:
+            flat = [t if getattr(t.model, 'compressible', False)
+                    else term(_compressible(t.model), t.scale, t.params) for t in flat]
+
+        self.terms = flat
+        super().__init__()
+        names = []
+        for t in self.terms:
+            names.extend(n for n in t.names() if n not in names)
+        self.param_symbols_list = [sp.Symbol(n) for n in names]
+        # composite parameter index of every term parameter
+        self._index = [tuple(names.index(n) for n in t.names()) for t in self.terms]
+
+    def __repr__(self):
+        return " + ".join(f"{t.scale:g}*{_name(t.model)}" for t in self.terms)
+
+    def energy(self):
+        """
+        Return the symbolic sum of the term energies.
+
+        Returns
+        -------
+        sympy.Expr
+            :math:`\\sum_i c_i W_i` in the composite parameter symbols.
+        """
+        total = 0
+        for t in self.terms:
+            renames = {s: sp.Symbol(n) for s, n in zip(t.model.model_param_symbols(), t.names())}
+            total += t.scale * t.model.energy().subs(renames, simultaneous=True)
+        return total
+
+    def linear_in_params(self, protocol: str = 'uniaxial', stress_type: str = 'cauchy') -> bool:
+        """
+        Return whether every term is linear in its parameters.
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measure. Default is 'cauchy'.
+
+        Returns
+        -------
+        bool
+            True if all terms are linear in their parameters.
+        """
+        return all(t.model.linear_in_params(protocol, stress_type) for t in self.terms)
+
+    def stress_kernel(self, protocol: str = 'uniaxial', stress_type: str = 'cauchy'):
+        """
+        Return the stress function assembled from the term kernels.
+
+        Same calling convention as
+        :meth:`~libela.hyperelastic.operations.operations.stress_kernel`.
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measure. Default is 'cauchy'.
+
+        Returns
+        -------
+        function or tuple of functions
+            ``f(lamda, *params)``, or ``(f11, f22)`` of ``(lamda1, lamda2, *params)``.
+        """
+        return self._assembled(('stress', protocol, stress_type),
+                               lambda m: m.stress_kernel(protocol, stress_type), _n_stretch(protocol))
+
+    def tangent_kernel(self, protocol: str = 'uniaxial', stress_type: str = 'cauchy'):
+        """
+        Return the tangent function assembled from the term kernels.
+
+        Same calling convention as
+        :meth:`~libela.hyperelastic.operations.operations.tangent_kernel`.
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measure. Default is 'cauchy'.
+
+        Returns
+        -------
+        function or tuple of functions
+            ``dσ/dλ (lamda, *params)``, or the four biaxial derivatives.
+        """
+        return self._assembled(('tangent', protocol, stress_type),
+                               lambda m: m.tangent_kernel(protocol, stress_type), _n_stretch(protocol))
+
+    def energy_kernel(self, protocol: str = 'uniaxial'):
+        """
+        Return the strain-energy density assembled from the term kernels.
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+
+        Returns
+        -------
+        function
+            ``W(lamda, *params)``, or ``W(lamda1, lamda2, *params)``.
+        """
+        return self._assembled(('energy', protocol), lambda m: m.energy_kernel(protocol),
+                               _n_stretch(protocol))
+
+    def invariant_derivative_kernel(self):
+        """
+        Return the invariant derivatives assembled from the term kernels.
+
+        Returns
+        -------
+        function
+            ``f(I1, I2, J, *params)`` returning ``(dW_dI1, dW_dI2, dW_dJ)``.
+        """
+        cache = self.__dict__.setdefault('_kernel_cache', {})
+        key = ('invariant_derivatives',)
+        if key not in cache:
+            pieces = [(t.scale, index, t.model.invariant_derivative_kernel())
+                      for t, index in zip(self.terms, self._index)]
+
+            def derivatives(I1, I2, J, *params):
+                total = [0.0, 0.0, 0.0]
+                for scale, index, fn in pieces:
+                    for k, value in enumerate(fn(I1, I2, J, *(params[i] for i in index))):
+                        total[k] = total[k] + scale * value
+                return tuple(total)
+            cache[key] = derivatives
+        return cache[key]
+
+    def jacobian_kernel(self, protocol: str = 'uniaxial', stress_type: str = 'cauchy'):
+        """
+        Return the parameter derivatives assembled from the term kernels.
+
+        A shared parameter collects the derivatives of every term using it.
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measure. Default is 'cauchy'.
+
+        Returns
+        -------
+        tuple of functions
+            See :meth:`~libela.hyperelastic.operations.operations.jacobian_kernel`.
+        """
+        cache = self.__dict__.setdefault('_kernel_cache', {})
+        key = ('jacobian', protocol, stress_type)
+        if key not in cache:
+            n_args = _n_stretch(protocol)
+            kernels = [t.model.jacobian_kernel(protocol, stress_type) for t in self.terms]
+
+            def per_parameter(component):
+                functions = []
+                for j in range(len(self.param_symbols_list)):
+                    pieces = [(t.scale, index, jac[component][index.index(j)] if component is not None
+                               else jac[index.index(j)])
+                              for t, index, jac in zip(self.terms, self._index, kernels) if j in index]
+                    functions.append(_sum(pieces, n_args))
+                return tuple(functions)
+            cache[key] = (per_parameter(0), per_parameter(1)) if protocol == 'biaxial' \
+                else per_parameter(None)
+        return cache[key]
+
+    def _assembled(self, key, kernel_of, n_args):
+        """Cached sum of the term kernels returned by `kernel_of`, with the tuple structure kept."""
+        cache = self.__dict__.setdefault('_kernel_cache', {})
+        if key not in cache:
+            pieces = [(t.scale, index, kernel_of(t.model)) for t, index in zip(self.terms, self._index)]
+            if isinstance(pieces[0][2], tuple):
+                cache[key] = tuple(_sum([(s, i, fn[k]) for s, i, fn in pieces], n_args)
+                                   for k in range(len(pieces[0][2])))
+            else:
+                cache[key] = _sum(pieces, n_args)
+        return cache[key]
+
+
+class _isochoric_term(operations):
+    """An incompressible model's energy as the isochoric part of a compressible composite."""
+    compressible = True
+
+    def __init__(self, model):
+        self.model = model
+        self._isochoric_of = model
+        super().__init__()
+        self.param_symbols_list = list(model.model_param_symbols())
+
+    def energy(self):
+        """Energy of the wrapped model in the isochoric invariants."""
+        iso = J_sym**sp.Rational(-2, 3)
+        return self.model.energy().subs({I1_sym: iso * I1_sym, I2_sym: iso**2 * I2_sym,
+                                         I4_sym: iso * I4_sym, I6_sym: iso * I6_sym},
+                                        simultaneous=True)
+
+    def fiber_directions(self):
+        """Fiber directions of the wrapped model."""
+        return self.model.fiber_directions()
+
+
+# --------------------------------------------------------------------------
+# helper functions
+# --------------------------------------------------------------------------
+
+def _n_stretch(protocol):
+    """Number of stretch arguments of the protocol kernels."""
+    if protocol not in ('uniaxial', 'simple_shear', 'biaxial'):
+        raise ValueError(f"Unknown protocol: {protocol}")
+    return 2 if protocol == 'biaxial' else 1
+
+
+def _sum(pieces, n_args):
+    """Kernel ``f(*stretch, *params) = Σ scale · fn(*stretch, *params[index])``."""
+    def kernel(*args):
+        stretch, params = args[:n_args], args[n_args:]
+        total = 0.0
+        for scale, index, fn in pieces:
+            total = total + scale * fn(*stretch, *(params[i] for i in index))
+        return total
+    return kernel
+
+
+def _compressible(model):
+    """Isochoric, compressible counterpart of an incompressible term model."""
+    from .numeric import numeric_model
+    if isinstance(model, numeric_model):
+        energy_fn = model.energy_fn
+
+        def isochoric(I1, I2, J, *params):
+            return energy_fn(J**(-2 / 3) * I1, J**(-4 / 3) * I2, J, *params)
+        promoted = numeric_model(isochoric, [s.name for s in model.model_param_symbols()],
+                                 compressible=True, derivative=model.derivative)
+        promoted._isochoric_of = model
+        return promoted
+    return _isochoric_term(model)
+
+
+def _original(model):
+    """The user's model behind an isochoric wrapper (the model itself otherwise)."""
+    return getattr(model, '_isochoric_of', model)
+
+
+def _name(model):
+    """Class name of a term model, looking through the isochoric wrapper."""
+    return _original(model).__class__.__name__
@@ -0,0 +1,211 @@
+"""
+export.py
+=========
+
+Export compiled kernels to a standalone, NumPy-only Python module.
+
+The stress, tangent and energy expressions of a model (see
+:meth:`~libela.hyperelastic.operations.operations.stress_expression`) are
+derived once, reduced with common-subexpression elimination and printed as
+plain NumPy code. The generated module embeds the parameter ordering and
+imports nothing but NumPy, so deployed evaluators start without SymPy.
+
+Usage
+-----
+From Python::
+
+    from libela.hyperelastic import yeoh
+    from libela.hyperelastic.export import export_kernels
+    export_kernels(yeoh(), "yeoh_kernels.py", protocols=["uniaxial", "biaxial"])
+
+or from the command line::
+
+    python -m libela.hyperelastic.export yeoh yeoh_kernels.py --protocols uniaxial biaxial
+
+The generated module provides ``stress``, ``tangent`` and ``energy``
+functions with the same ``(strain, params, protocol=…, stress_type=…)``
+conventions as :meth:`~libela.hyperelastic.operations.operations.stress`,
+plus the individual kernels and the ``PARAMETERS`` tuple.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+
+import sympy as sp
+from sympy.printing.numpy import NumPyPrinter
+
+from .operations import stretch_symbols
+
+_HEADER = '''"""
+Standalone {model} kernels exported from libela.
+
+Generated by libela.hyperelastic.export - do not edit.
+Requires only NumPy.
+"""
+
+import numpy
+
+MODEL = {model!r}
+COMPRESSIBLE = {compressible!r}
+PARAMETERS = {parameters!r}
+PROTOCOLS = {protocols!r}
+STRESS_TYPES = {stress_types!r}
+'''
+
+_DISPATCH = '''
+
+def _call(kind, strain, params, protocol, stress_type=None):
+    key = (kind, protocol) if stress_type is None else (kind, protocol, stress_type)
+    if key not in KERNELS:
+        raise ValueError(f"No exported {{kind}} kernel for {{key[1:]}}.")
+    if len(params) != len(PARAMETERS):
+        raise ValueError(f"Expected parameters {{PARAMETERS}}.")
+    strain = numpy.asarray(strain, dtype=float)
+    if protocol == 'biaxial':
+        return KERNELS[key](strain[0], strain[1], *params)
+    return KERNELS[key](strain, *params)
+
+
+def stress(strain, params, protocol={protocol!r}, stress_type='cauchy'):
+    """Stress for stretches `strain` and parameters ordered as PARAMETERS."""
+    return _call('stress', strain, params, protocol, stress_type)
+
+
+def tangent(strain, params, protocol={protocol!r}, stress_type='cauchy'):
+    """Derivative of stress with respect to stretch."""
+    return _call('tangent', strain, params, protocol, stress_type)
+
+
+def energy(strain, params, protocol={protocol!r}):
+    """Strain-energy density."""
+    return _call('energy', strain, params, protocol)
+'''
+
+
+def export_kernels(model,
+                   path: str | os.PathLike,
+                   *,
+                   protocols: list[str] | tuple[str, ...] = ('uniaxial',),
+                   stress_types: list[str] | tuple[str, ...] = ('cauchy',)) -> str:
+    """
+    Write the model's stress, tangent and energy kernels to a NumPy-only module.
+
+    Parameters
+    ----------
+    model : operations
+        Model instance, e.g. ``yeoh()`` or ``neohookean(compressible=True)``.
+    path : str or os.PathLike
+        Output ``.py`` file.
+    protocols : sequence of str, optional
+        Protocols to export. Default is ``('uniaxial',)``.
+    stress_types : sequence of str, optional
+        Stress measures to export. Default is ``('cauchy',)``.
+
+    Returns
+    -------
+    str
+        The generated source code.
+    """
+    params = model.model_param_symbols()
+    printer = NumPyPrinter({'fully_qualified_modules': True})
+    functions, entries = [], []
+
+    for protocol in protocols:
+        for stress_type in stress_types:
+            suffix = f"{protocol}_{stress_type.replace('-', '_')}"
+            functions.append(_function_source(f"stress_{suffix}", protocol, params,
+                                              model.stress_expression(protocol, stress_type), printer))
+            functions.append(_function_source(f"tangent_{suffix}", protocol, params,
+                                              model.tangent_expression(protocol, stress_type), printer))
+            entries.append(f"    ('stress', {protocol!r}, {stress_type!r}): stress_{suffix},")
+            entries.append(f"    ('tangent', {protocol!r}, {stress_type!r}): tangent_{suffix},")
+        functions.append(_function_source(f"energy_{protocol}", protocol, params,
+                                          model.energy_expression(protocol), printer))
+        entries.append(f"    ('energy', {protocol!r}): energy_{protocol},")
+
+    source = (_HEADER.format(model=type(model).__name__,
+                             compressible=bool(getattr(model, 'compressible', False)),
+                             parameters=tuple(s.name for s in params),
+                             protocols=tuple(protocols),
+                             stress_types=tuple(stress_types))
+              + "\n\n" + "\n\n".join(functions)
+              + "\n\nKERNELS = {\n" + "\n".join(entries) + "\n}\n"
+              + _DISPATCH.format(protocol=protocols[0]))
+    with open(path, 'w', encoding='utf-8') as fh:
+        fh.write(source)
+    return source
+
+
+def _function_source(name, protocol, params, expressions, printer):
+    """
+    Print one kernel as a Python function using common-subexpression elimination.
+
+    Parameters
+    ----------
+    name : str
+        Function name.
+    protocol : str
+        Deformation protocol, selecting the stretch arguments.
+    params : list of sympy.Symbol
+        Model parameter symbols.
+    expressions : sympy.Expr or tuple of sympy.Expr
+        Expression(s) to return.
+    printer : NumPyPrinter
+        Code printer.
+
+    Returns
+    -------
+    str
+        Function source.
+    """
+    stretch = stretch_symbols(protocol)
+    args = ", ".join(s.name for s in stretch + params)
+    many = isinstance(expressions, tuple)
+    exprs = list(expressions) if many else [expressions]
+    replacements, reduced = sp.cse([sp.sympify(e) for e in exprs],
+                                   symbols=sp.numbered_symbols('_x'))
+
+    lines = [f"def {name}({args}):"]
+    for sym, sub in replacements:
+        lines.append(f"    {sym} = {printer.doprint(sub)}")
+    # constants (e.g. a linear shear response) still broadcast to the stretch shape
+    shape_like = " + ".join(f"0.0 * {s.name}" for s in stretch)
+    returned = []
+    for e in reduced:
+        code = printer.doprint(e)
+        if not (e.free_symbols & set(stretch)) and not any(
+                sym in e.free_symbols for sym, _ in replacements):
+            code = f"{code} + {shape_like}"
+        returned.append(code)
+    lines.append(f"    return ({', '.join(returned)},)" if many else f"    return {returned[0]}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """
+    Command-line entry point: ``python -m libela.hyperelastic.export MODEL OUTPUT``.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        Arguments; default is ``sys.argv[1:]``.
+    """
+    from . import hyperelastic
+
+    parser = argparse.ArgumentParser(description="Export libela kernels to a NumPy-only module.")
+    parser.add_argument("model", help="model class in libela.hyperelastic, e.g. yeoh")
+    parser.add_argument("output", help="output .py file")
+    parser.add_argument("--protocols", nargs="+", default=["uniaxial"])
+    parser.add_argument("--stress-types", nargs="+", default=["cauchy"])
+    parser.add_argument("--compressible", action="store_true")
+    args = parser.parse_args(argv)
+
+    cls = getattr(hyperelastic, args.model)
+    model = cls(compressible=True) if args.compressible else cls()
+    export_kernels(model, args.output, protocols=args.protocols, stress_types=args.stress_types)
+
+
+if __name__ == "__main__":
+    main()
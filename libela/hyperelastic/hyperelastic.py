@@ -17,18 +17,23 @@ mooney_rivlin    — two-parameter Mooney-Rivlin
 klosner_segal    — four-term Klosner-Segal
 yeoh             — three-term Yeoh
 polynomial       — full nine-term polynomial
+hgo              — Holzapfel–Gasser–Ogden fiber-reinforced (I4/I6)
+volumetric       — volumetric penalty K/2 (J − 1)² for composite models
 
 Notes
 -----
 * All symbols are generated on the fly so they remain unique in SymPy's cache.
 * Incompressibility is assumed (**J = 1**) unless 
   ``compressible=True`` and a bulk modulus *K* is supplied.
+* Anisotropic models declare fiber directions
+  (:meth:`~libela.hyperelastic.operations.operations.fiber_directions`) and
+  use the fiber invariants I4, I6 in their energy.
 """
 
 from __future__ import annotations #allows annotations to be stored as strings
 
 import sympy as sp
-from .operations import operations, I1_sym, J_sym, I2_sym
+from .operations import operations, I1_sym, J_sym, I2_sym, I4_sym, I6_sym
 
 class neohookean(operations):
     """
@@ -78,7 +83,6 @@ class neohookean(operations):
         sympy.Expr
             The strain-energy function :math:`W = \\frac{\\mu}{2}(I_1 - 3)` (plus volumetric term if compressible).
         """
-        (mu_sym,) = sp.symbols('a_mu')
         W_neohookean = self.mu_sym/2 * (I1_sym - 3)
         if self.compressible:
             W_neohookean += self.K_sym/2 * (J_sym - 1)**2
@@ -204,9 +208,146 @@ class polynomial(operations):
                     + c12_sym*(I1_sym - 3)*(I2_sym - 3)**2
                     + c03_sym*(I2_sym - 3)**3)
         return W_polynomial
-    
 
 
+class hgo(operations):
+    """
+    Holzapfel–Gasser–Ogden fiber-reinforced strain-energy model.
+
+    A Neo-Hookean matrix reinforced by one or two fiber families lying in the
+    1–2 plane at ±θ to direction 1, optionally with the Gasser–Ogden–Holzapfel
+    dispersion κ. Fibers only contribute in tension (Macaulay bracket on the
+    fiber strain).
+
+    Inherits from
+    -------------
+    operations
+
+    Parameters
+    ----------
+    families : {1, 2}, optional
+        Number of fiber families (a₀ at +θ, g₀ at −θ). Default is 2.
+    dispersion : bool, optional
+        If True, include the dispersion parameter κ ∈ [0, 1/3]. Default is False.
+    compressible : bool, optional
+        If True, a bulk-modulus term ``K/2*(J - 1)**2`` is added (K is the
+        first parameter). Default is False.
+
+    Examples
+    --------
+    >>> model = hgo()                            # params [mu, k1, k2, theta]
+    >>> sigma = model.stress(lam, [0.01, 1.0, 5.0, np.radians(40)])   # lateral stretches solved
+    >>> angles = np.radians(np.linspace(0, 90, 2000))[:, None]
+    >>> sweep = model.stress_batch(np.vstack([lam, lam]),               # equibiaxial, 2000 angles
+    ...                            np.column_stack([np.full((2000, 3), [0.01, 1.0, 5.0]), angles]),
+    ...                            protocol='biaxial')
+
+    Notes
+    -----
+    Uniaxial kernels (:meth:`stress_kernel`, :meth:`stress_batch`,
+    :meth:`energy_kernel` for 'uniaxial') are not available: with fibers in
+    the 1–2 plane the lateral stretches differ, so :meth:`stress` solves them
+    numerically instead (see :func:`~libela.hyperelastic.path.evaluate_path`).
+    """
+    def __init__(self, *, families: int = 2, dispersion: bool = False, compressible: bool = False):
+        """
+        Initialize an HGO material model.
 
+        Parameters
+        ----------
+        families : {1, 2}, optional
+            Number of fiber families. Default is 2.
+        dispersion : bool, optional
+            Include the dispersion parameter κ. Default is False.
+        compressible : bool, optional
+            Include a bulk modulus term. Default is False.
+        """
+        if families not in (1, 2):
+            raise ValueError("families must be 1 or 2.")
+        self.families = families
+        self.dispersion = dispersion
+        self.compressible = compressible
+        super().__init__()
+        self.param_symbols_list = []
+        if self.compressible:
+            self.K_sym = sp.symbols('a_K')
+            self.param_symbols_list.append(self.K_sym)
+        self.mu_sym, self.k1_sym, self.k2_sym = sp.symbols('a_mu b_k1 c_k2')
+        self.param_symbols_list += [self.mu_sym, self.k1_sym, self.k2_sym]
+        if self.dispersion:
+            self.kappa_sym = sp.symbols('d_kappa')
+            self.param_symbols_list.append(self.kappa_sym)
+        self.theta_sym = sp.symbols('e_theta')
+        self.param_symbols_list.append(self.theta_sym)
+
+    def fiber_directions(self):
+        """
+        Return the reference fiber directions.
 
+        Returns
+        -------
+        list of sympy.Matrix
+            ``a₀ = (cos θ, sin θ, 0)`` and, for two families, ``g₀ = (cos θ, −sin θ, 0)``.
+        """
+        theta = self.theta_sym
+        directions = [sp.Matrix([sp.cos(theta), sp.sin(theta), 0])]
+        if self.families == 2:
+            directions.append(sp.Matrix([sp.cos(theta), -sp.sin(theta), 0]))
+        return directions
 
+    def energy(self):
+        """
+        Return the symbolic strain-energy function for the HGO model.
+
+        Returns
+        -------
+        sympy.Expr
+            :math:`W = \\frac{\\mu}{2}(I_1-3) + \\frac{k_1}{2k_2}\\sum_i \\left[e^{k_2\\langle E_i\\rangle^2} - 1\\right]`,
+            :math:`E_i = \\kappa(I_1-3) + (1-3\\kappa)(I_{4,6}-1)` (plus volumetric term if compressible).
+        """
+        kappa = self.kappa_sym if self.dispersion else 0
+        W_hgo = self.mu_sym/2 * (I1_sym - 3)
+        for fiber_sym in (I4_sym, I6_sym)[:self.families]:
+            E = sp.Max(kappa*(I1_sym - 3) + (1 - 3*kappa)*(fiber_sym - 1), 0)
+            W_hgo += self.k1_sym/(2*self.k2_sym) * (sp.exp(self.k2_sym*E**2) - 1)
+        if self.compressible:
+            W_hgo += self.K_sym/2 * (J_sym - 1)**2
+        return W_hgo
+
+
+class volumetric(operations):
+    """
+    Volumetric penalty strain-energy term.
+
+    Always compressible; meant as the volumetric part of a
+    :class:`~libela.hyperelastic.composite.composite_model`, whose
+    incompressible terms then act as the isochoric part, evaluated on
+    the isochoric invariants J^-2/3 I1, J^-4/3 I2.
+
+    Inherits from
+    -------------
+    operations
+
+    Examples
+    --------
+    >>> w = yeoh() + volumetric()                # params [c10, c20, c30, K]
+    >>> sigma = w.stress(lam, [0.5, 0.01, 0.001, 100.0])
+    """
+    compressible = True
+
+    def __init__(self):
+        """Initialize a volumetric penalty term."""
+        super().__init__()
+        self.K_sym = sp.symbols('a_K')
+        self.param_symbols_list = [self.K_sym]
+
+    def energy(self):
+        """
+        Return the symbolic volumetric strain energy.
+
+        Returns
+        -------
+        sympy.Expr
+            :math:`W = \\frac{K}{2}(J-1)^2`.
+        """
+        return self.K_sym/2 * (J_sym - 1)**2
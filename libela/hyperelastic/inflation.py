@@ -0,0 +1,265 @@
+"""
+inflation.py
+============
+
+Pressure–stretch response of inflated membranes and thick-walled tubes.
+
+All solvers work for any incompressible
+:class:`~libela.hyperelastic.operations.operations` model and reuse its
+compiled biaxial Cauchy kernel: with the thickness (radial) direction as the
+eliminated third direction, the kernel returns the in-plane stresses relative
+to the radial stress, σθθ − σrr and σzz − σrr, which is all the equilibrium
+equations need. Every solver is vectorized over the stretch steps.
+
+* :func:`spherical_membrane` — thin spherical balloon,
+  :math:`p = 2\\sigma H / (R\\lambda^3)`.
+* :func:`cylindrical_membrane` — thin tube with prescribed axial stretch, or
+  closed ends (axial stretch solved per step from σzz = σθθ / 2).
+* :func:`thick_tube` — thick-walled incompressible tube with axial stretch,
+  :math:`p = \\int_a^b (\\sigma_{\\theta\\theta} - \\sigma_{rr})\\, dr / r`,
+  integrated by Gauss–Legendre quadrature through the wall for all steps at
+  once.
+* :func:`limit_point` — pressure maximum (onset of inflation instability) of
+  any of the above.
+
+Public API
+----------
+spherical_membrane     — balloon pressure vs. stretch
+cylindrical_membrane   — thin-tube pressure and axial force vs. hoop stretch
+thick_tube             — thick-walled tube pressure and axial force vs. inner stretch
+limit_point            — maximum pressure along a solver's curve
+
+Notes
+-----
+Compressible models are not supported: the deformed wall thickness follows
+from incompressibility.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def spherical_membrane(model, params: list[float], stretch, *, radius: float = 1.0,
+                       thickness: float = 0.01) -> dict:
+    """
+    Inflation of a thin spherical membrane.
+
+    Parameters
+    ----------
+    model : operations
+        Incompressible hyperelastic model.
+    params : list of float
+        Material parameters.
+    stretch : array_like
+        Circumferential stretch λ = r / R per step.
+    radius : float, optional
+        Reference mid-surface radius R. Default is 1.
+    thickness : float, optional
+        Reference wall thickness H. Default is 0.01.
+
+    Returns
+    -------
+    dict
+        ``'stretch'``, ``'pressure'`` and ``'stress'`` (equibiaxial Cauchy
+        stress σ), each with the shape of `stretch`.
+
+    Examples
+    --------
+    >>> curve = spherical_membrane(neohookean(), [1.0], np.linspace(1, 4, 500))
+    >>> limit_point(spherical_membrane, neohookean(), [1.0], (1.01, 4))
+    """
+    sigma11, _ = _biaxial(model)
+    lam = np.asarray(stretch, dtype=float)
+    sigma = np.broadcast_to(sigma11(lam, lam, *params), lam.shape)
+    return {'stretch': lam,
+            'pressure': 2 * thickness / radius * sigma / lam**3,
+            'stress': sigma}
+
+
+def cylindrical_membrane(model, params: list[float], stretch, *, axial_stretch: float | None = 1.0,
+                         radius: float = 1.0, thickness: float = 0.01, tol: float = 1e-12,
+                         max_iter: int = 50) -> dict:
+    """
+    Inflation of a thin cylindrical membrane.
+
+    Parameters
+    ----------
+    model : operations
+        Incompressible hyperelastic model.
+    params : list of float
+        Material parameters.
+    stretch : array_like
+        Hoop stretch λθ = r / R per step.
+    axial_stretch : float or array_like or None, optional
+        Prescribed axial stretch λz; None for a tube with closed, unrestrained
+        ends (λz solved per step). Default is 1.
+    radius : float, optional
+        Reference mid-surface radius R. Default is 1.
+    thickness : float, optional
+        Reference wall thickness H. Default is 0.01.
+    tol : float, optional
+        Tolerance of the closed-end solve. Default is 1e-12.
+    max_iter : int, optional
+        Newton iterations of the closed-end solve. Default is 50.
+
+    Returns
+    -------
+    dict
+        ``'stretch'``, ``'axial_stretch'``, ``'pressure'``, ``'axial_force'``
+        (reduced axial force 2πrhσzz − πr²p needed to hold the ends) and
+        ``'stress'`` (σθθ, σzz).
+    """
+    sigma11, sigma22 = _biaxial(model)
+    lam = np.asarray(stretch, dtype=float)
+    if axial_stretch is None:
+        lam_z = _closed_ends(model, params, lam, tol, max_iter)
+    else:
+        lam_z = np.broadcast_to(np.asarray(axial_stretch, dtype=float), lam.shape)
+    s_theta = np.broadcast_to(sigma11(lam, lam_z, *params), lam.shape)
+    s_z = np.broadcast_to(sigma22(lam, lam_z, *params), lam.shape)
+    r = radius * lam
+    h = thickness / (lam * lam_z)
+    pressure = s_theta * h / r
+    return {'stretch': lam, 'axial_stretch': lam_z, 'pressure': pressure,
+            'axial_force': 2 * np.pi * r * h * s_z - np.pi * r**2 * pressure,
+            'stress': (s_theta, s_z)}
+
+
+def thick_tube(model, params: list[float], stretch, *, axial_stretch: float = 1.0,
+               inner_radius: float = 1.0, outer_radius: float = 1.2, n_quad: int = 16) -> dict:
+    """
+    Inflation of a thick-walled incompressible tube with axial stretch.
+
+    The deformation r² = a² + (R² − A²)/λz maps the reference wall A ≤ R ≤ B;
+    the pressure and the reduced axial force are integrated over R with
+    `n_quad` Gauss–Legendre points, for all steps at once.
+
+    Parameters
+    ----------
+    model : operations
+        Incompressible hyperelastic model.
+    params : list of float
+        Material parameters.
+    stretch : array_like
+        Inner hoop stretch λa = a / A per step.
+    axial_stretch : float or array_like, optional
+        Axial stretch λz. Default is 1.
+    inner_radius, outer_radius : float, optional
+        Reference radii A and B. Defaults are 1 and 1.2.
+    n_quad : int, optional
+        Quadrature points through the wall. Default is 16.
+
+    Returns
+    -------
+    dict
+        ``'stretch'``, ``'outer_stretch'`` (λb = b / B), ``'pressure'`` and
+        ``'axial_force'`` (reduced axial force
+        :math:`\\pi \\int_a^b (2\\sigma_{zz} - \\sigma_{\\theta\\theta} - \\sigma_{rr})\\, r\\, dr`).
+    """
+    if not 0 < inner_radius < outer_radius:
+        raise ValueError("Need 0 < inner_radius < outer_radius.")
+    sigma11, sigma22 = _biaxial(model)
+    lam_a = np.asarray(stretch, dtype=float)
+    lam_z = np.broadcast_to(np.asarray(axial_stretch, dtype=float), lam_a.shape)
+    A, B = inner_radius, outer_radius
+
+    nodes, weights = np.polynomial.legendre.leggauss(n_quad)
+    R = 0.5 * (B - A) * nodes + 0.5 * (B + A)            # (n_quad,)
+    w = 0.5 * (B - A) * weights
+    a = (lam_a * A)[..., None]
+    lz = lam_z[..., None]
+    r = np.sqrt(a**2 + (R**2 - A**2) / lz)                 # (..., n_quad)
+    lam_theta = r / R
+    s11 = np.broadcast_to(sigma11(lam_theta, lz, *params), r.shape)   # σθθ − σrr
+    s22 = np.broadcast_to(sigma22(lam_theta, lz, *params), r.shape)   # σzz − σrr
+    # r dr = R dR / λz
+    pressure = np.sum(w * s11 * R / (lz * r**2), axis=-1)
+    axial_force = np.pi * np.sum(w * (2 * s22 - s11) * R / lz, axis=-1)
+    return {'stretch': lam_a, 'outer_stretch': np.sqrt(lam_a**2 * A**2 + (B**2 - A**2) / lam_z) / B,
+            'pressure': pressure, 'axial_force': axial_force}
+
+
+def limit_point(solver, model, params: list[float], bracket=(1.0, 5.0), *, n_grid: int = 256,
+                tol: float = 1e-8, **options) -> dict:
+    """
+    Locate the pressure maximum along an inflation curve.
+
+    A grid evaluation finds the first local maximum, which a golden-section
+    search then refines.
+
+    Parameters
+    ----------
+    solver : callable
+        :func:`spherical_membrane`, :func:`cylindrical_membrane` or
+        :func:`thick_tube`.
+    model : operations
+        Incompressible hyperelastic model.
+    params : list of float
+        Material parameters.
+    bracket : tuple of float, optional
+        Stretch range searched. Default is (1, 5).
+    n_grid : int, optional
+        Grid points of the initial scan. Default is 256.
+    tol : float, optional
+        Stretch tolerance of the refinement. Default is 1e-8.
+    **options
+        Passed to `solver` (geometry, axial stretch, …).
+
+    Returns
+    -------
+    dict
+        ``'stretch'`` and ``'pressure'`` at the limit point (NaN if the
+        pressure rises monotonically over `bracket`).
+    """
+    def pressure(lam):
+        return solver(model, params, lam, **options)['pressure']
+
+    grid = np.linspace(bracket[0], bracket[1], n_grid)
+    values = pressure(grid)
+    peaks = np.flatnonzero((values[1:-1] >= values[:-2]) & (values[1:-1] > values[2:])) + 1
+    if peaks.size == 0:
+        return {'stretch': np.nan, 'pressure': np.nan}
+    lo, hi = grid[peaks[0] - 1], grid[peaks[0] + 1]
+    ratio = (np.sqrt(5.0) - 1) / 2
+    x1, x2 = hi - ratio * (hi - lo), lo + ratio * (hi - lo)
+    f1, f2 = pressure(np.array([x1, x2]))
+    while hi - lo > tol * max(1.0, abs(hi)):
+        if f1 > f2:
+            hi, x2, f2 = x2, x1, f1
+            x1 = hi - ratio * (hi - lo)
+            f1 = pressure(np.array([x1]))[0]
+        else:
+            lo, x1, f1 = x1, x2, f2
+            x2 = lo + ratio * (hi - lo)
+            f2 = pressure(np.array([x2]))[0]
+    lam = 0.5 * (lo + hi)
+    return {'stretch': float(lam), 'pressure': float(pressure(np.array([lam]))[0])}
+
+
+# --------------------------------------------------------------------------
+# helper functions
+# --------------------------------------------------------------------------
+
+def _biaxial(model):
+    """Biaxial Cauchy kernels (σ₁₁ − σ₃₃, σ₂₂ − σ₃₃) of an incompressible model."""
+    if getattr(model, 'compressible', False):
+        raise ValueError("Inflation solvers need an incompressible model.")
+    return model.stress_kernel('biaxial', 'cauchy')
+
+
+def _closed_ends(model, params, lam, tol, max_iter):
+    """Axial stretch with σzz = σθθ / 2 (closed, unrestrained ends), by Newton per step."""
+    sigma11, sigma22 = _biaxial(model)
+    _, d11_dz, _, d22_dz = model.tangent_kernel('biaxial', 'cauchy')
+    lam_z = np.ones(lam.shape)
+    for _ in range(max_iter):
+        g = sigma22(lam, lam_z, *params) - 0.5 * sigma11(lam, lam_z, *params)
+        dg = d22_dz(lam, lam_z, *params) - 0.5 * d11_dz(lam, lam_z, *params)
+        step = np.broadcast_to(g / dg, lam.shape)
+        # keep the axial stretch positive
+        step = np.where(lam_z - step > 0, step, 0.5 * lam_z)
+        lam_z = lam_z - step
+        if np.all(np.abs(step) <= tol * lam_z):
+            break
+    return lam_z
@@ -0,0 +1,304 @@
+"""
+mullins.py
+==========
+
+Mullins effect and cyclic stress softening by the Ogden–Roxburgh
+pseudo-elastic damage model, wrapped around any hyperelastic model.
+
+The damaged stress is the virgin (primary-loading) stress scaled by a
+softening variable,
+
+.. math::
+
+   \\sigma = \\eta\\, \\sigma_0, \\qquad
+   \\eta = 1 - \\frac{1}{r}\\,
+   \\operatorname{erf}\\!\\left(\\frac{W_{max} - W_0}{m + \\beta W_{max}}\\right),
+
+where :math:`W_0` is the virgin strain-energy density at the current
+deformation and :math:`W_{max}` its maximum over the loading history. On the
+primary loading path :math:`W_0 = W_{max}` and η = 1; on unloading and
+reloading below the previous maximum the response softens.
+
+The only history variable is :math:`W_{max}`, one float per specimen, kept in
+a :class:`damage_state`. :meth:`ogden_roxburgh.stream` evaluates a load
+history chunk by chunk along the time axis: within a chunk the running
+maximum is a cumulative maximum seeded by the state, and the state is carried
+to the next chunk. Histories of many cycles for many specimens are therefore
+evaluated vectorized over specimens, with memory bounded by the chunk size —
+the history may be a generator of chunks or an array (including a
+:class:`numpy.memmap`), and :meth:`ogden_roxburgh.evaluate` can write into a
+preallocated (memory-mapped) output.
+
+Public API
+----------
+ogden_roxburgh   — damage wrapper evaluating stress over load histories
+damage_state     — compact per-specimen history state (maximum energy)
+
+Notes
+-----
+* Parameters are the wrapped model's parameters followed by ``r``, ``m`` and
+  ``beta``. Each may be a scalar or an array broadcasting against the
+  specimen axes with a trailing time axis, e.g. shape ``(n_specimens, 1)``
+  for per-specimen values.
+* The virgin stress and energy use the wrapped model's compiled kernels, so
+  no new derivation is needed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .operations import strain_converter
+
+_DAMAGE_PARAMS = ['r', 'm', 'beta']
+
+
+class damage_state:
+    """
+    Maximum virgin strain-energy density reached per specimen.
+
+    Attributes
+    ----------
+    W_max : np.ndarray
+        Maximum energy so far, with the specimen shape of the history.
+    steps : int
+        Number of time steps processed.
+    """
+    def __init__(self, shape=(), W_max=None):
+        """
+        Initialize a virgin (undamaged) state.
+
+        Parameters
+        ----------
+        shape : int or tuple of int, optional
+            Specimen shape, e.g. ``n_specimens``. Default is a single
+            specimen.
+        W_max : array_like, optional
+            Initial maximum energy (preconditioned material), broadcast to
+            `shape`. Default is zero.
+        """
+        self.W_max = np.zeros(shape, dtype=float)
+        if W_max is not None:
+            self.W_max[...] = W_max
+        self.steps = 0
+
+    def copy(self) -> 'damage_state':
+        """Return an independent copy of the state."""
+        state = damage_state(self.W_max.shape, self.W_max)
+        state.steps = self.steps
+        return state
+
+    def reset(self) -> None:
+        """Return all specimens to the virgin state."""
+        self.W_max[...] = 0.0
+        self.steps = 0
+
+
+class ogden_roxburgh:
+    """
+    Ogden–Roxburgh damage wrapper around a hyperelastic model.
+
+    Parameters
+    ----------
+    model : operations
+        Hyperelastic model giving the virgin response.
+    protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+        Deformation protocol of the histories. Default is 'uniaxial'.
+    stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+        Stress measure returned. Default is 'cauchy'.
+    strain_type : {'stretch', 'engineering', 'true', 'green-lagrange'}, optional
+        Strain measure of the histories. Default is 'stretch'.
+
+    Examples
+    --------
+    >>> damaged = ogden_roxburgh(neohookean())
+    >>> cycles = np.concatenate([np.linspace(1, l, 200) for l in (1.5, 1, 2, 1, 2.5, 1)])
+    >>> history = np.tile(cycles, (1000, 50))           # 1000 specimens, 50 repeats
+    >>> state, peak = damaged.initial_state(1000), np.zeros(1000)
+    >>> for chunk in damaged.stream(history, [mu[:, None], 2.0, 0.5, 0.1], state=state):
+    ...     peak = np.maximum(peak, chunk['stress'].max(axis=-1))
+    """
+    def __init__(self, model, *, protocol: str = 'uniaxial', stress_type: str = 'cauchy',
+                 strain_type: str = 'stretch'):
+        if protocol not in ('uniaxial', 'simple_shear', 'biaxial'):
+            raise ValueError(f"Unknown protocol: {protocol}")
+        self.model = model
+        self.protocol = protocol
+        self.stress_type = stress_type
+        self.strain_type = strain_type
+
+    def param_names(self) -> list[str]:
+        """Wrapped model's parameter names followed by 'r', 'm' and 'beta'."""
+        return [str(s) for s in self.model.model_param_symbols()] + _DAMAGE_PARAMS
+
+    def initial_state(self, shape=(), W_max=None) -> damage_state:
+        """
+        Return a virgin :class:`damage_state`.
+
+        Parameters
+        ----------
+        shape : int or tuple of int, optional
+            Specimen shape. Default is a single specimen.
+        W_max : array_like, optional
+            Initial maximum energy. Default is zero.
+        """
+        return damage_state(shape, W_max)
+
+    def stress(self, strain, params: list, state: damage_state | None = None) -> dict:
+        """
+        Evaluate one chunk of a load history and advance the state.
+
+        Parameters
+        ----------
+        strain : array_like
+            Strain of shape ``(*specimens, n_steps)``, or
+            ``(2, *specimens, n_steps)`` for biaxial, time on the last axis.
+        params : list
+            Model parameters followed by ``r``, ``m`` and ``beta``.
+        state : damage_state, optional
+            History state, updated in place. Default is a virgin state.
+
+        Returns
+        -------
+        dict
+            ``'stress'`` (array, or tuple for biaxial), ``'damage'`` (η) and
+            ``'energy'`` (virgin energy :math:`W_0`), plus ``'state'``.
+        """
+        model_params, (r, m, beta) = _split(params)
+        strain = np.asarray(strain, dtype=float)
+        shape = strain.shape[1:] if self.protocol == 'biaxial' else strain.shape
+        if state is None:
+            state = damage_state(shape[:-1])
+        if state.W_max.shape != shape[:-1]:
+            raise ValueError(f"State shape {state.W_max.shape} does not match the "
+                             f"specimen shape {shape[:-1]} of the history.")
+
+        stretch = strain_converter(strain, self.strain_type)
+        energy_fn = self.model.energy_kernel(self.protocol)
+        if self.protocol == 'biaxial':
+            W = energy_fn(stretch[0], stretch[1], *model_params)
+        else:
+            W = energy_fn(stretch, *model_params)
+        W = np.broadcast_to(W, shape)
+
+        # running maximum along time, seeded with the carried state
+        W_max = np.maximum.accumulate(W, axis=-1)
+        np.maximum(W_max, state.W_max[..., None], out=W_max)
+        eta = 1.0 - _erf((W_max - W) / (m + beta * W_max)) / r
+
+        virgin = self.model.stress(strain, model_params, protocol=self.protocol,
+                                   stress_type=self.stress_type, strain_type=self.strain_type)
+        if self.protocol == 'biaxial':
+            sigma = tuple(eta * s for s in virgin)
+        else:
+            sigma = eta * virgin
+
+        if shape[-1]:
+            state.W_max[...] = W_max[..., -1]
+        state.steps += shape[-1]
+        return {'stress': sigma, 'damage': eta, 'energy': W, 'state': state}
+
+    def stream(self, history, params: list, *, state: damage_state | None = None,
+               chunk_size: int = 4096):
+        """
+        Evaluate a load history chunk by chunk.
+
+        Parameters
+        ----------
+        history : array_like or iterable of array_like
+            Full history, shaped as for :meth:`stress` and sliced along the
+            time axis into chunks of `chunk_size` steps, or an iterable
+            yielding such chunks (e.g. read from disk or generated cycle by
+            cycle).
+        params : list
+            Model parameters followed by ``r``, ``m`` and ``beta``.
+        state : damage_state, optional
+            History state, updated in place after each chunk. Default is a
+            virgin state.
+        chunk_size : int, optional
+            Time steps per chunk when `history` is an array. Default is 4096.
+
+        Yields
+        ------
+        dict
+            Result of :meth:`stress` for each chunk.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive.")
+        if isinstance(history, np.ndarray) or not hasattr(history, '__iter__'):
+            history = np.asarray(history)
+            n_steps = history.shape[-1]
+            chunks = (history[..., start:start + chunk_size] for start in range(0, n_steps, chunk_size))
+        else:
+            chunks = history
+        for chunk in chunks:
+            result = self.stress(chunk, params, state)
+            state = result['state']
+            yield result
+
+    def evaluate(self, history, params: list, *, state: damage_state | None = None,
+                 chunk_size: int = 4096, out=None):
+        """
+        Evaluate a whole load-history array in chunks.
+
+        Parameters
+        ----------
+        history : array_like
+            History shaped as for :meth:`stress`.
+        params : list
+            Model parameters followed by ``r``, ``m`` and ``beta``.
+        state : damage_state, optional
+            History state, updated in place. Default is a virgin state.
+        chunk_size : int, optional
+            Time steps per chunk. Default is 4096.
+        out : np.ndarray, optional
+            Output of shape ``(*specimens, n_steps)`` (``(2, …)`` for
+            biaxial), e.g. a :class:`numpy.memmap`. Allocated if omitted.
+
+        Returns
+        -------
+        np.ndarray or tuple of np.ndarray
+            Damaged stress over the whole history.
+        """
+        history = np.asarray(history)
+        if out is None:
+            out = np.empty(history.shape, dtype=float)
+        elif out.shape != history.shape:
+            raise ValueError(f"out has shape {out.shape}, expected {history.shape}.")
+        start = 0
+        for result in self.stream(history, params, state=state, chunk_size=chunk_size):
+            stop = start + result['energy'].shape[-1]
+            if self.protocol == 'biaxial':
+                out[0, ..., start:stop], out[1, ..., start:stop] = result['stress']
+            else:
+                out[..., start:stop] = result['stress']
+            start = stop
+        return (out[0], out[1]) if self.protocol == 'biaxial' else out
+
+
+# --------------------------------------------------------------------------
+# helper functions
+# --------------------------------------------------------------------------
+
+def _split(params):
+    """Split into model parameters and the damage parameters (r, m, beta)."""
+    if len(params) < len(_DAMAGE_PARAMS):
+        raise ValueError("Parameters must end with the damage parameters [r, m, beta].")
+    model_params = list(params[:-3])
+    r, m, beta = (np.asarray(p, dtype=float) for p in params[-3:])
+    if np.any(r <= 0) or np.any(m <= 0) or np.any(beta < 0):
+        raise ValueError("Damage parameters need r > 0, m > 0 and beta >= 0.")
+    return model_params, (r, m, beta)
+
+
+def _erf(x):
+    """Error function; SciPy's when available, else a rational approximation."""
+    try:
+        from scipy.special import erf      # optional dependency
+    except ImportError:
+        # Abramowitz & Stegun 7.1.26, |error| < 1.5e-7
+        t = 1.0 / (1.0 + 0.3275911 * np.abs(x))
+        poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741
+                    + t * (-1.453152027 + t * 1.061405429))))
+        return np.sign(x) * (1.0 - poly * np.exp(-x * x))
+    return erf(x)
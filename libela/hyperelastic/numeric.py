@@ -0,0 +1,440 @@
+"""
+numeric.py
+==========
+
+Hyperelastic models defined by a plain NumPy strain-energy function.
+
+:class:`numeric_model` wraps a vectorized ``W(I1, I2, J, *params)`` and
+plugs into the same protocol machinery as the symbolic models: it overrides
+:meth:`~libela.hyperelastic.operations.operations.stress_kernel` (and the
+tangent / energy kernels), so :meth:`stress`, :meth:`stress_batch` and every
+wrapper built on the kernels work unchanged, without any SymPy derivation.
+
+The invariant derivatives ∂W/∂I₁, ∂W/∂I₂ and ∂W/∂J come from the complex-step
+method, which is exact to machine precision for functions that accept complex
+input, or from central finite differences for functions that do not (e.g.
+those using ``abs``, ``maximum`` or comparisons).
+
+Notes
+-----
+* The deformation gradients, the pressure elimination and the stress measures
+  follow :func:`~libela.hyperelastic.operations.deformation_gradient_matrix`
+  and :meth:`~libela.hyperelastic.operations.operations.stress`; in simple
+  shear the pressure of incompressible models is fixed by σ₃₃ = 0.
+* Tangent kernels are central differences of the stress kernels.
+* Symbolic expressions do not exist for these models, so
+  :mod:`~libela.hyperelastic.export` is not available for them.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import sympy as sp
+
+from .operations import operations
+
+# Component(s) returned for each protocol, and the traction-free component fixing the pressure.
+_COMPONENTS = {'uniaxial': ((0, 0),), 'simple_shear': ((0, 1),), 'biaxial': ((0, 0), (1, 1))}
+_FREE_COMPONENT = {'uniaxial': (1, 1), 'simple_shear': (2, 2), 'biaxial': (2, 2)}
+
+
+class numeric_model(operations):
+    """
+    Hyperelastic model from a vectorized NumPy energy ``W(I1, I2, J, *params)``.
+
+    Parameters
+    ----------
+    energy_fn : callable
+        Strain-energy density. Receives the invariants as arrays followed by
+        the parameters, and must broadcast over all of them.
+    param_names : list of str
+        Parameter names, in the order expected by `energy_fn` and `params`.
+    compressible : bool, optional
+        If True, the volumetric stress J ∂W/∂J is included and no pressure
+        is eliminated. Defaults to False.
+    derivative : {'complex-step', 'central'}, optional
+        Differentiation scheme for the invariant derivatives.
+
+    Examples
+    --------
+    >>> def W(I1, I2, J, mu, jm):
+    ...     return -mu * jm / 2 * np.log(1 - (I1 - 3) / jm)       # Gent
+    >>> gent = numeric_model(W, ["mu", "jm"])
+    >>> sigma = gent.stress(lam, [1.0, 50.0])
+    """
+    def __init__(self, energy_fn, param_names: list[str], *,
+                 compressible: bool = False, derivative: str = 'complex-step'):
+        """
+        Initialize a numeric model.
+
+        Parameters
+        ----------
+        energy_fn : callable
+            Strain-energy density ``W(I1, I2, J, *params)``.
+        param_names : list of str
+            Parameter names.
+        compressible : bool, optional
+            Include the volumetric response. Defaults to False.
+        derivative : {'complex-step', 'central'}, optional
+            Differentiation scheme.
+        """
+        if derivative not in ('complex-step', 'central'):
+            raise ValueError("Invalid derivative. Use 'complex-step' or 'central'")
+        self.energy_fn = energy_fn
+        self.compressible = compressible
+        self.derivative = derivative
+        super().__init__()
+        self.param_symbols_list = list(sp.symbols(list(param_names)))
+
+    def energy(self):
+        """
+        Numeric models have no symbolic energy.
+
+        Raises
+        ------
+        TypeError
+            Always.
+        """
+        raise TypeError("numeric_model has no symbolic energy; use energy_kernel().")
+
+    def stress_expression(self, protocol='uniaxial', stress_type='cauchy'):
+        """Not available for numeric models (raises TypeError)."""
+        raise TypeError("numeric_model has no symbolic stress expression.")
+
+    def tangent_expression(self, protocol='uniaxial', stress_type='cauchy'):
+        """Not available for numeric models (raises TypeError)."""
+        raise TypeError("numeric_model has no symbolic tangent expression.")
+
+    def energy_expression(self, protocol='uniaxial'):
+        """Not available for numeric models (raises TypeError)."""
+        raise TypeError("numeric_model has no symbolic energy expression.")
+
+    def linear_in_params(self, protocol='uniaxial', stress_type='cauchy'):
+        """Numeric models are treated as nonlinear in their parameters (returns False)."""
+        return False
+
+    def stress_kernel(self, protocol: str = 'uniaxial', stress_type: str = 'cauchy'):
+        """
+        Return the numeric stress function for a protocol.
+
+        Same calling convention as
+        :meth:`~libela.hyperelastic.operations.operations.stress_kernel`.
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measure. Default is 'cauchy'.
+
+        Returns
+        -------
+        function or tuple of functions
+            ``f(lamda, *params)``, or ``(f11, f22)`` of ``(lamda1, lamda2, *params)``.
+        """
+        if protocol not in _COMPONENTS:
+            raise ValueError(f"Unknown protocol: {protocol}")
+        if stress_type not in ('cauchy', 'piola', '2nd-piola'):
+            raise ValueError(f"Unknown stress type: {stress_type}")
+
+        def tensor(*args):
+            n_stretch = 2 if protocol == 'biaxial' else 1
+            F = deformation_gradient(protocol, *args[:n_stretch], compressible=self.compressible)
+            return self._stress_tensor(F, protocol, stress_type, args[n_stretch:])
+
+        components = _COMPONENTS[protocol]
+        if protocol == 'biaxial':
+            return tuple(_component_kernel(tensor, c) for c in components)
+        return _component_kernel(tensor, components[0])
+
+    def tangent_kernel(self, protocol: str = 'uniaxial', stress_type: str = 'cauchy'):
+        """
+        Return the derivative of the stress kernel with respect to stretch.
+
+        Computed with central differences; same convention as
+        :meth:`~libela.hyperelastic.operations.operations.tangent_kernel`.
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measure. Default is 'cauchy'.
+
+        Returns
+        -------
+        function or tuple of functions
+            See :meth:`~libela.hyperelastic.operations.operations.tangent_kernel`.
+        """
+        stress_fn = self.stress_kernel(protocol, stress_type)
+        if protocol != 'biaxial':
+            def tangent(lam, *params):
+                h = _step(lam)
+                return (stress_fn(lam + h, *params) - stress_fn(lam - h, *params)) / (2 * h)
+            return tangent
+
+        def partial(f, axis):
+            def tangent(lam1, lam2, *params):
+                if axis == 0:
+                    h = _step(lam1)
+                    return (f(lam1 + h, lam2, *params) - f(lam1 - h, lam2, *params)) / (2 * h)
+                h = _step(lam2)
+                return (f(lam1, lam2 + h, *params) - f(lam1, lam2 - h, *params)) / (2 * h)
+            return tangent
+        return tuple(partial(f, axis) for f in stress_fn for axis in (0, 1))
+
+    def jacobian_kernel(self, protocol: str = 'uniaxial', stress_type: str = 'cauchy'):
+        """
+        Return central-difference derivatives of stress with respect to the parameters.
+
+        Same convention as
+        :meth:`~libela.hyperelastic.operations.operations.jacobian_kernel`.
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measure. Default is 'cauchy'.
+
+        Returns
+        -------
+        tuple of functions
+            One function per parameter (per component for biaxial).
+        """
+        stress_fn = self.stress_kernel(protocol, stress_type)
+        n_stretch = 2 if protocol == 'biaxial' else 1
+
+        def partial(f, j):
+            def derivative(*args):
+                stretch, params = args[:n_stretch], list(args[n_stretch:])
+                h = _step(params[j])
+                upper, lower = list(params), list(params)
+                upper[j], lower[j] = params[j] + h, params[j] - h
+                return (f(*stretch, *upper) - f(*stretch, *lower)) / (2 * h)
+            return derivative
+
+        n_params = len(self.param_symbols_list)
+        if protocol == 'biaxial':
+            return tuple(tuple(partial(f, j) for j in range(n_params)) for f in stress_fn)
+        return tuple(partial(stress_fn, j) for j in range(n_params))
+
+    def energy_kernel(self, protocol: str = 'uniaxial'):
+        """
+        Return the numeric strain-energy density along a protocol.
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+
+        Returns
+        -------
+        function
+            ``W(lamda, *params)``, or ``W(lamda1, lamda2, *params)`` for biaxial.
+        """
+        n_stretch = 2 if protocol == 'biaxial' else 1
+
+        def energy(*args):
+            F = deformation_gradient(protocol, *args[:n_stretch], compressible=self.compressible)
+            I1, I2, J, _, _ = invariants(F)
+            return self.energy_fn(I1, I2, J, *args[n_stretch:])
+        return energy
+
+    def invariant_derivatives(self, I1, I2, J, params):
+        """
+        Return ∂W/∂I₁, ∂W/∂I₂ and ∂W/∂J.
+
+        Parameters
+        ----------
+        I1, I2, J : array_like
+            Invariants.
+        params : sequence
+            Model parameters (scalars or broadcastable arrays).
+
+        Returns
+        -------
+        tuple of np.ndarray
+            ``(dW_dI1, dW_dI2, dW_dJ)``.
+        """
+        W = self.energy_fn
+        I1, I2, J = (np.asarray(v, dtype=float) for v in (I1, I2, J))
+        if self.derivative == 'complex-step':
+            h = 1e-30
+            return (np.imag(W(I1 + 1j * h, I2, J, *params)) / h,
+                    np.imag(W(I1, I2 + 1j * h, J, *params)) / h,
+                    np.imag(W(I1, I2, J + 1j * h, *params)) / h)
+        h1, h2, hJ = _step(I1), _step(I2), _step(J)
+        return ((W(I1 + h1, I2, J, *params) - W(I1 - h1, I2, J, *params)) / (2 * h1),
+                (W(I1, I2 + h2, J, *params) - W(I1, I2 - h2, J, *params)) / (2 * h2),
+                (W(I1, I2, J + hJ, *params) - W(I1, I2, J - hJ, *params)) / (2 * hJ))
+
+    def invariant_derivative_kernel(self):
+        """
+        Return ``f(I1, I2, J, *params) -> (dW_dI1, dW_dI2, dW_dJ)``.
+
+        Same convention as
+        :meth:`~libela.hyperelastic.operations.operations.invariant_derivative_kernel`.
+
+        Returns
+        -------
+        function
+            Numeric invariant derivatives.
+        """
+        def derivatives(I1, I2, J, *params):
+            return self.invariant_derivatives(I1, I2, J, params)
+        return derivatives
+
+    def _stress_tensor(self, F, protocol, stress_type, params):
+        """Full stress tensor, shape ``(..., 3, 3)``, in the requested measure."""
+        I1, I2, J, b, b_inverse = invariants(F)
+        derivatives = self.invariant_derivatives(I1, I2, J, params)
+        return stress_tensors(F, derivatives, (J, b, b_inverse), (stress_type,),
+                              free_component=_FREE_COMPONENT[protocol],
+                              compressible=self.compressible)[stress_type]
+
+
+# --------------------------------------------------------------------------
+# helper functions
+# --------------------------------------------------------------------------
+
+def deformation_gradient(protocol: str, *stretch, compressible: bool = False) -> np.ndarray:
+    """
+    Numeric counterpart of :func:`~libela.hyperelastic.operations.deformation_gradient_matrix`.
+
+    Parameters
+    ----------
+    protocol : {'uniaxial', 'simple_shear', 'biaxial'}
+        Deformation protocol.
+    *stretch : array_like
+        λ (or γ for simple shear), or λ₁, λ₂ for biaxial; broadcast together.
+    compressible : bool, optional
+        If True, no lateral contraction is enforced.
+
+    Returns
+    -------
+    np.ndarray
+        Deformation gradients, shape ``broadcast(stretch).shape + (3, 3)``.
+    """
+    stretch = np.broadcast_arrays(*(np.asarray(s, dtype=float) for s in stretch))
+    F = np.zeros(stretch[0].shape + (3, 3))
+    if protocol == 'uniaxial':
+        (lam,) = stretch
+        lateral = 1.0 if compressible else 1.0 / np.sqrt(lam)
+        F[..., 0, 0], F[..., 1, 1], F[..., 2, 2] = lam, lateral, lateral
+    elif protocol == 'simple_shear':
+        (gamma,) = stretch
+        F[..., 0, 0] = F[..., 1, 1] = F[..., 2, 2] = 1.0
+        F[..., 0, 1] = gamma
+    elif protocol == 'biaxial':
+        lam1, lam2 = stretch
+        F[..., 0, 0], F[..., 1, 1] = lam1, lam2
+        F[..., 2, 2] = 1.0 if compressible else 1.0 / (lam1 * lam2)
+    else:
+        raise ValueError(f"Unknown protocol: {protocol}. Supported protocols are 'uniaxial', 'simple_shear', 'biaxial'.")
+    return F
+
+
+def invariants(F):
+    """
+    Return the invariants and left Cauchy–Green tensors of a stack of deformation gradients.
+
+    Parameters
+    ----------
+    F : np.ndarray
+        Deformation gradients, shape ``(..., 3, 3)``.
+
+    Returns
+    -------
+    tuple
+        ``(I1, I2, J, b, b_inverse)``.
+    """
+    b = F @ np.swapaxes(F, -1, -2)
+    b_inverse = np.linalg.inv(b)
+    trace_b = np.trace(b, axis1=-2, axis2=-1)
+    I1 = trace_b
+    I2 = 0.5 * (trace_b**2 - np.trace(b @ b, axis1=-2, axis2=-1))
+    J = np.linalg.det(F)
+    return I1, I2, J, b, b_inverse
+
+
+def stress_tensors(F, derivatives, kinematics, stress_types, *, free_component, compressible=False, fibers=()):
+    """
+    Assemble stress tensors from invariant derivatives.
+
+    The Cauchy stress is formed once and converted to each requested measure
+    (:math:`\\mathbf P = J \\boldsymbol\\sigma \\mathbf F^{-T}`,
+    :math:`\\mathbf S = \\mathbf F^{-1} \\mathbf P`). Compressible models use
+    :math:`\\boldsymbol\\sigma = \\tfrac{2}{J}[(W_1 + I_1 W_2)\\mathbf b - W_2 \\mathbf b^2]
+    + W_J \\mathbf I`; incompressible models use
+    :math:`2 W_1 \\mathbf b - 2 W_2 \\mathbf b^{-1}` minus the pressure fixed by
+    the traction-free component.
+
+    Parameters
+    ----------
+    F : np.ndarray
+        Deformation gradients, shape ``(..., 3, 3)``.
+    derivatives : tuple of np.ndarray
+        ``(dW_dI1, dW_dI2, dW_dJ)`` broadcastable against ``F[..., 0, 0]``.
+    kinematics : tuple
+        ``(J, b, b_inverse)`` as returned by :func:`invariants`.
+    stress_types : sequence of {'cauchy', 'piola', '2nd-piola'}
+        Stress measures to return.
+    free_component : tuple of int
+        Traction-free component ``(i, i)`` fixing the pressure (incompressible).
+    compressible : bool, optional
+        Add the volumetric stress instead of eliminating a pressure.
+    fibers : sequence of tuple, optional
+        ``(dW_dI4, a)`` pairs of fiber-invariant derivatives and current
+        fiber vectors ``a = F a₀`` (shape ``(..., 3)``), each adding
+        :math:`\\tfrac{2}{J} W_4\\, \\mathbf a \\otimes \\mathbf a`.
+
+    Returns
+    -------
+    dict
+        ``{stress_type: tensor}`` with tensors of shape ``(..., 3, 3)``.
+    """
+    dW_dI1, dW_dI2, dW_dJ = derivatives
+    J, b, b_inverse = kinematics
+    eye = np.eye(3)
+    W1 = np.asarray(dW_dI1)[..., None, None]
+    W2 = np.asarray(dW_dI2)[..., None, None]
+    J = np.asarray(J, dtype=float)
+    if compressible:
+        I1 = np.trace(b, axis1=-2, axis2=-1)[..., None, None]
+        sigma = 2 / J[..., None, None] * ((W1 + I1 * W2) * b - W2 * (b @ b))
+    else:
+        sigma = 2 * W1 * b - 2 * W2 * b_inverse
+    for dW_dI4, a in fibers:
+        sigma = sigma + (2 / J * np.asarray(dW_dI4))[..., None, None] * (a[..., :, None] * a[..., None, :])
+    if compressible:
+        sigma = sigma + np.asarray(dW_dJ)[..., None, None] * eye
+    else:
+        i, j = free_component
+        sigma = sigma - sigma[..., i:i + 1, j:j + 1] * eye  # traction-free lateral face
+
+    out = {}
+    if 'cauchy' in stress_types:
+        out['cauchy'] = sigma
+    if 'piola' in stress_types or '2nd-piola' in stress_types:
+        F_inverse = np.linalg.inv(F)
+        piola = J[..., None, None] * sigma @ np.swapaxes(F_inverse, -1, -2)
+        if 'piola' in stress_types:
+            out['piola'] = piola
+        if '2nd-piola' in stress_types:
+            out['2nd-piola'] = F_inverse @ piola
+    return out
+
+
+def _component_kernel(tensor, component):
+    """Kernel returning one component of the stress tensor."""
+    i, j = component
+
+    def kernel(*args):
+        return tensor(*args)[..., i, j]
+    return kernel
+
+
+def _step(x):
+    """Central-difference step scaled to the magnitude of x."""
+    return 1e-6 * np.maximum(1.0, np.abs(np.asarray(x, dtype=float)))
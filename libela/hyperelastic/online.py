@@ -0,0 +1,200 @@
+"""
+online.py
+=========
+
+Incremental, warm-started parameter fitting for streaming test data.
+
+:class:`online_fitter` keeps the least-squares problem of all points seen so
+far in compressed form: the accumulated Gauss–Newton information matrix
+:math:`\\mathbf A = \\sum \\mathbf J_i^T \\mathbf J_i` and the residual sum of
+squares at the current estimate. Each :meth:`online_fitter.update` runs a few
+Gauss–Newton iterations, warm-started from the previous estimate, on
+
+.. math::
+
+   \\min_\\theta \\; \\lVert \\mathbf r_{new}(\\theta) \\rVert^2
+   + (\\theta - \\theta_{prev})^T \\mathbf A\\, (\\theta - \\theta_{prev}),
+
+where the quadratic term stands in for the history. Only the new points are
+evaluated (with the compiled stress and parameter-Jacobian kernels), so the
+cost of an update scales with the batch, not with the length of the test.
+For models that are linear in their parameters (Mooney–Rivlin, Yeoh,
+polynomial, …) the history term is exact and the estimate equals the batch
+least-squares fit.
+
+Public API
+----------
+online_fitter    — streaming Gauss–Newton fitter for one protocol
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .operations import strain_converter
+
+
+class online_fitter:
+    """
+    Streaming least-squares fitter for an :class:`~libela.hyperelastic.operations.operations` model.
+
+    Parameters
+    ----------
+    model : operations
+        Hyperelastic model.
+    params0 : list of float
+        Initial estimate, ordered as
+        :meth:`~libela.hyperelastic.operations.operations.model_param_symbols`.
+    protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+        Protocol of the streamed test. Default is 'uniaxial'.
+    stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+        Measure of the streamed stress. Default is 'cauchy'.
+    strain_type : {'stretch', 'engineering'}, optional
+        Measure of the streamed strain. Default is 'stretch'.
+    prior_weight : float, optional
+        Weight of the initial estimate (ridge term), keeping the first
+        updates well posed. Default is 1e-8.
+    forgetting : float, optional
+        Factor in (0, 1] applied to the history at each update; values
+        below 1 track slowly drifting parameters. Default is 1 (no forgetting).
+    max_iter : int, optional
+        Gauss–Newton iterations per update. Default is 10.
+    tol : float, optional
+        Relative step tolerance ending the iterations. Default is 1e-10.
+
+    Examples
+    --------
+    >>> fitter = online_fitter(yeoh(), [0.1, 0.0, 0.0])
+    >>> for lam, sigma in rig.stream():
+    ...     params = fitter.update(lam, sigma)
+    """
+    def __init__(self, model, params0, *, protocol: str = 'uniaxial', stress_type: str = 'cauchy',
+                 strain_type: str = 'stretch', prior_weight: float = 1e-8, forgetting: float = 1.0,
+                 max_iter: int = 10, tol: float = 1e-10):
+        """
+        Initialize the fitter.
+
+        Parameters
+        ----------
+        model : operations
+            Hyperelastic model.
+        params0 : list of float
+            Initial estimate.
+        protocol, stress_type, strain_type : str, optional
+            Test protocol, stress and strain measures.
+        prior_weight, forgetting, max_iter, tol : float, optional
+            See the class docstring.
+        """
+        if not 0.0 < forgetting <= 1.0:
+            raise ValueError("forgetting must be in (0, 1].")
+        self.model = model
+        self.protocol = protocol
+        self.stress_type = stress_type
+        self.strain_type = strain_type
+        self.forgetting = float(forgetting)
+        self.max_iter = int(max_iter)
+        self.tol = float(tol)
+        self.params = np.asarray(params0, dtype=float).copy()
+        n_params = len(model.model_param_symbols())
+        if self.params.shape != (n_params,):
+            raise ValueError(f"Expected {n_params} initial parameters.")
+        self.information = prior_weight * np.eye(n_params)
+        self.rss = 0.0
+        self.n_points = 0
+        self._stress_fn = model.stress_kernel(protocol, stress_type)
+        self._jacobian_fn = model.jacobian_kernel(protocol, stress_type)
+
+    def update(self, strain, stress, weights=None) -> np.ndarray:
+        """
+        Add new data points and return the updated parameters.
+
+        Parameters
+        ----------
+        strain : array_like
+            New strain points; shape ``(2, N)`` for biaxial.
+        stress : array_like
+            Measured stress at those points; ``(2, N)`` (σ₁₁, σ₂₂) for biaxial.
+        weights : array_like, optional
+            Per-point weights (same shape as `stress`).
+
+        Returns
+        -------
+        np.ndarray
+            Updated parameter estimate.
+        """
+        lam = np.asarray(strain_converter(strain, self.strain_type), dtype=float)
+        data = np.asarray(stress, dtype=float).ravel()
+        w = np.ones_like(data) if weights is None else np.sqrt(np.asarray(weights, dtype=float).ravel())
+        if self.protocol == 'biaxial':
+            lam = lam.reshape(2, -1)
+        if data.size != (lam.size if self.protocol != 'biaxial' else 2 * lam.shape[1]):
+            raise ValueError("strain and stress sizes do not match.")
+
+        A_prev = self.forgetting * self.information
+        theta_prev = self.params
+        theta = theta_prev.copy()
+        for _ in range(self.max_iter):
+            residual, J = self._linearize(lam, theta, data, w)
+            H = A_prev + J.T @ J
+            g = J.T @ residual + A_prev @ (theta - theta_prev)
+            step = np.linalg.lstsq(H, -g, rcond=None)[0]
+            theta = theta + step
+            if np.linalg.norm(step) <= self.tol * (1.0 + np.linalg.norm(theta)):
+                break
+
+        residual, J = self._linearize(lam, theta, data, w)
+        delta = theta - theta_prev
+        self.rss = self.forgetting * self.rss + float(delta @ A_prev @ delta + residual @ residual)
+        self.information = A_prev + J.T @ J
+        self.params = theta
+        self.n_points += data.size
+        return theta.copy()
+
+    def predict(self, strain):
+        """
+        Evaluate the model at the current estimate.
+
+        Parameters
+        ----------
+        strain : array_like
+            Strain points (in `strain_type`).
+
+        Returns
+        -------
+        np.ndarray or tuple of np.ndarray
+            Stress, as from :meth:`~libela.hyperelastic.operations.operations.stress`.
+        """
+        return self.model.stress(strain, list(self.params), protocol=self.protocol,
+                                 stress_type=self.stress_type, strain_type=self.strain_type)
+
+    @property
+    def covariance(self) -> np.ndarray:
+        """
+        Approximate parameter covariance, :math:`s^2 \\mathbf A^{-1}`.
+
+        Returns
+        -------
+        np.ndarray
+            ``(N_params, N_params)`` matrix (NaN until there are more
+            points than parameters).
+        """
+        dof = self.n_points - self.params.size
+        if dof <= 0:
+            return np.full_like(self.information, np.nan)
+        return self.rss / dof * np.linalg.pinv(self.information)
+
+    def _linearize(self, lam, theta, data, w):
+        """Weighted residual and parameter Jacobian of the new points only."""
+        if self.protocol == 'biaxial':
+            shape = lam.shape[1:]
+            model = np.concatenate([np.broadcast_to(f(lam[0], lam[1], *theta), shape)
+                                    for f in self._stress_fn])
+            J = np.concatenate([np.stack([np.broadcast_to(d(lam[0], lam[1], *theta), shape)
+                                          for d in component], axis=-1)
+                                for component in self._jacobian_fn])
+        else:
+            shape = lam.shape
+            model = np.broadcast_to(self._stress_fn(lam, *theta), shape).ravel()
+            J = np.stack([np.broadcast_to(d(lam, *theta), shape).ravel()
+                          for d in self._jacobian_fn], axis=-1)
+        return w * (model - data), w[:, None] * J
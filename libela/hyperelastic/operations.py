@@ -9,7 +9,11 @@ A material model class (e.g. :class:`~libela.hyperelastic.hyperelastic.neohookea
 function *W(I₁, I₂, J,…)*.  The mix-in then provides:
 
 * :py:meth:`operations.stress` - convert principal stretches → stress array
+* :py:meth:`operations.evaluate` - several protocols and stress measures in one call
+* :py:meth:`operations.invert_stress` - stress-controlled inverse (stretch from stress)
+* ``+`` and scalar ``*`` - energy sums (:class:`~libela.hyperelastic.composite.composite_model`)
 * deformation-gradient builders for common test protocols
+* numeric stress-measure and strain-measure conversions
 * tiny numerical plotting helper
 
 .. note::
@@ -23,10 +27,14 @@ Dependencies
 """
 
 from __future__ import annotations
+import threading
+
 import sympy as sp
 import numpy as np
 # Define the symbols for invariants to share across all materials.
 (I1_sym, I2_sym, J_sym) = sp.symbols('I1 I2 J')
+# Fiber invariants a₀·C a₀ and g₀·C g₀ of anisotropic models (see operations.fiber_directions).
+(I4_sym, I6_sym) = sp.symbols('I4 I6')
 
 class operations:
     """
@@ -73,7 +81,7 @@ class operations:
             Deformation protocol to use. Default is 'uniaxial'.
         stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
             Stress measure to return. Default is 'cauchy'.
-        strain_type : {'stretch', 'engineering'}, optional
+        strain_type : {'stretch', 'engineering', 'true', 'green-lagrange'}, optional
             Input strain type. Default is 'stretch'.
         plot : bool, optional
             If True, show a quick Matplotlib plot.
@@ -82,18 +90,746 @@ class operations:
         -------
         np.ndarray or tuple of np.ndarray
             Stress values for the specified protocol.
+
+        Notes
+        -----
+        For incompressible models in uniaxial and biaxial loading, Piola
+        measures are converted in place from the Cauchy kernel with
+        :func:`convert_stress`, so no separate kernel is compiled for them.
+
+        Incompressible anisotropic models in uniaxial loading do not keep the
+        isotropic lateral stretches λ^-1/2; their lateral stretches are
+        solved numerically per point with
+        :func:`~libela.hyperelastic.path.evaluate_path` (scalar parameters).
         """
         compressible_flag = getattr(self, "compressible", False)
         if compressible_flag and len(params) < 2:
             raise ValueError("Compressible model needs [K, MU] parameters.")
         
-        model_param_syms = self.param_symbols_list
-        
         strain = strain_converter(strain, strain_type or "stretch")
         stress_type = stress_type or 'cauchy'
         strain_type = strain_type or 'stretch'
         protocol = protocol or 'uniaxial'
         
+        if protocol == 'uniaxial' and not compressible_flag and self.fiber_directions():
+            return self._solved_uniaxial(strain, params, stress_type, plot, strain_type)
+
+        kernel_type = self._kernel_stress_type(protocol, stress_type)
+        stress_fn = self.stress_kernel(protocol, kernel_type)
+        
+        if protocol == 'biaxial':
+            stress_11_function, stress_22_function = stress_fn
+            stress_11_values = stress_11_function(strain[0, :], strain[1, :], *params)
+            stress_22_values = stress_22_function(strain[0, :], strain[1, :], *params)
+            stress_values = (stress_11_values, stress_22_values)
+        else:
+            stress_values = stress_fn(strain, *params)
+        if kernel_type != stress_type:
+            stress_values = convert_stress(stress_values, strain, kernel_type, stress_type,
+                                           protocol=protocol, out=_writable(stress_values))
+        
+        model_name = self.__class__.__name__
+        
+        if plot:
+            _plot_stress_strain(strain, stress_values, 
+                        protocol, 
+                        stress_type,  
+                        strain_type or "stretch",
+                        self.__class__.__name__)
+            
+        return stress_values
+    
+    def _solved_uniaxial(self, strain, params, stress_type, plot, strain_type):
+        """Uniaxial stress with the lateral stretches solved (anisotropic models)."""
+        from .path import evaluate_path, uniaxial_path
+        lam = np.asarray(strain, dtype=float)
+        result = evaluate_path(self, uniaxial_path(lam), params, stress_types=(stress_type,))
+        stress_values = result['stress'][stress_type][:, 0, 0].reshape(lam.shape)
+        if plot:
+            _plot_stress_strain(lam, stress_values, 'uniaxial', stress_type, strain_type,
+                                self.__class__.__name__)
+        return stress_values
+
+    def stress_batch(self,
+                     strain: np.ndarray | float,
+                     params: np.ndarray,
+                     *,
+                     protocol: str | None = None,
+                     stress_type: str | None = None,
+                     strain_type: str | None = None):
+        """
+        Compute stress for many parameter sets in one vectorized call.
+
+        Parameters
+        ----------
+        strain : array_like or float
+            As in :meth:`stress`; shared by all parameter sets.
+        params : array_like
+            Parameter sets, shape ``(N_sets, N_params)``, columns in the
+            order of :meth:`model_param_symbols`.
+        protocol, stress_type, strain_type : str, optional
+            As in :meth:`stress`.
+
+        Returns
+        -------
+        np.ndarray or tuple of np.ndarray
+            Stress of shape ``(N_sets,) + strain.shape`` (per component for
+            biaxial, where the leading axis of `strain` holds λ₁ and λ₂).
+        """
+        strain = strain_converter(strain, strain_type or "stretch")
+        protocol = protocol or 'uniaxial'
+        params = np.asarray(params, dtype=float)
+        if params.ndim != 2:
+            raise ValueError("params must have shape (N_sets, N_params).")
+        stress_type = stress_type or 'cauchy'
+        kernel_type = self._kernel_stress_type(protocol, stress_type)
+        if self.linear_in_params(protocol, kernel_type):
+            # σ = Σ_j p_j ∂σ/∂p_j: evaluate the basis once, then one matrix product
+            zeros = [0.0] * params.shape[1]
+            jacobian_fn = self.jacobian_kernel(protocol, kernel_type)
+            if protocol == 'biaxial':
+                values = tuple(np.tensordot(params, np.stack([np.broadcast_to(d(strain[0], strain[1], *zeros),
+                                                                              strain.shape[1:])
+                                                              for d in component], axis=-1), axes=(1, -1))
+                               for component in jacobian_fn)
+            else:
+                basis = np.stack([np.broadcast_to(d(strain, *zeros), strain.shape) for d in jacobian_fn], axis=-1)
+                values = np.tensordot(params, basis, axes=(1, -1))
+        else:
+            stress_fn = self.stress_kernel(protocol, kernel_type)
+            if protocol == 'biaxial':
+                out_shape = params.shape[:1] + strain.shape[1:]
+                columns = [params[:, j].reshape(out_shape[:1] + (1,) * (strain.ndim - 1))
+                           for j in range(params.shape[1])]
+                values = tuple(np.broadcast_to(f(strain[0], strain[1], *columns), out_shape)
+                               for f in stress_fn)
+            else:
+                out_shape = params.shape[:1] + strain.shape
+                columns = [params[:, j].reshape(out_shape[:1] + (1,) * strain.ndim)
+                           for j in range(params.shape[1])]
+                values = np.broadcast_to(stress_fn(strain, *columns), out_shape)
+        if kernel_type != stress_type:
+            values = convert_stress(values, strain, kernel_type, stress_type,
+                                    protocol=protocol, out=_writable(values))
+        return values
+
+    def invert_stress(self,
+                      stress,
+                      params: list[float],
+                      *,
+                      protocol: str | None = None,
+                      stress_type: str | None = None,
+                      strain_type: str | None = None,
+                      tol: float = 1e-12,
+                      max_iter: int = 100):
+        """
+        Solve σ(λ; θ) = σ_target for the strain, over whole arrays.
+
+        One-parameter protocols first bracket each root by expanding from the
+        undeformed state in the direction given by the sign of the residual
+        (stress increases with stretch for stable materials), then run a
+        safeguarded Newton iteration with the compiled stress and tangent
+        kernels: steps that leave the bracket or meet a non-positive tangent
+        fall back to bisection. Growth stops at limit points, so for
+        non-monotone responses the root on the stable branch (connected to
+        the undeformed state) is returned, and targets beyond the stress
+        extremum give NaN. Biaxial targets (σ₁₁, σ₂₂) use a damped 2-D
+        Newton iteration with backtracking on the residual norm.
+
+        Parameters
+        ----------
+        stress : array_like or tuple
+            Target stress; the pair (σ₁₁, σ₂₂) for 'biaxial'.
+        params : list of float
+            Material parameters (scalars or arrays broadcasting with `stress`).
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Measure of `stress`. Default is 'cauchy'.
+        strain_type : {'stretch', 'engineering', 'true', 'green-lagrange'}, optional
+            Measure of the returned strain. Default is 'stretch'.
+        tol : float, optional
+            Relative tolerance on stress and stretch. Default is 1e-12.
+        max_iter : int, optional
+            Maximum Newton iterations. Default is 100.
+
+        Returns
+        -------
+        np.ndarray
+            Strain with the shape of `stress` (``(2,) + shape`` for biaxial);
+            NaN where no root was found.
+        """
+        protocol = protocol or 'uniaxial'
+        stress_type = stress_type or 'cauchy'
+        stress_fn = self.stress_kernel(protocol, stress_type)
+        tangent_fn = self.tangent_kernel(protocol, stress_type)
+        if protocol == 'biaxial':
+            targets = np.broadcast_arrays(*(np.asarray(s, dtype=float) for s in stress))
+            lam = _newton_2d(stress_fn, tangent_fn, targets, params, tol, max_iter)
+        else:
+            target = np.asarray(stress, dtype=float)
+            lam = _newton_bracketed(stress_fn, tangent_fn, target, params, tol, max_iter,
+                                    additive=(protocol == 'simple_shear'))
+        if protocol == 'simple_shear' or (strain_type or 'stretch') == 'stretch':
+            return lam
+        return stretch_to_strain(lam, strain_type, out=lam)
+
+    def evaluate(self,
+                 strain,
+                 params: list[float],
+                 *,
+                 protocols: list[str] | tuple[str, ...] = ('uniaxial', 'equibiaxial', 'planar', 'simple_shear'),
+                 stress_types: list[str] | tuple[str, ...] = ('cauchy',),
+                 strain_type: str | None = None) -> dict:
+        """
+        Evaluate several protocols and stress measures in one call.
+
+        :math:`\\partial W/\\partial I_1`, :math:`\\partial W/\\partial I_2`
+        (and :math:`\\partial W/\\partial J`) are differentiated and compiled
+        once, by :meth:`invariant_derivative_kernel`, and shared by every
+        protocol; each protocol then only evaluates its invariants and
+        assembles the stress tensor numerically, once for all stress measures.
+
+        Parameters
+        ----------
+        strain : array_like or dict
+            Stretch (amount of shear for 'simple_shear') shared by all
+            one-parameter protocols, or ``{protocol: strain}``. 'biaxial' needs
+            shape ``(2, N)`` as in :meth:`stress`.
+        params : list of float
+            Material parameters in the order of :meth:`model_param_symbols`.
+        protocols : sequence of str, optional
+            Any of 'uniaxial', 'equibiaxial' (λ₁ = λ₂ = λ), 'planar'
+            (pure shear, λ₂ = 1), 'simple_shear' and 'biaxial'. Default is the
+            first four.
+        stress_types : sequence of {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measures. Default is ``('cauchy',)``.
+        strain_type : {'stretch', 'engineering'}, optional
+            Input strain type. Default is 'stretch'.
+
+        Returns
+        -------
+        dict
+            ``{protocol: {'strain', 'I1', 'I2', 'J', 'dW_dI1', 'dW_dI2',
+            'stress': {stress_type: values}}}``. Stress values are σ₁₁ for
+            'uniaxial' and 'equibiaxial', σ₁₂ for 'simple_shear', and the pair
+            (σ₁₁, σ₂₂) for 'planar' and 'biaxial'.
+
+        Notes
+        -----
+        Results equal :meth:`stress` for every measure; the Piola measures
+        are :math:`\\mathbf P = J \\boldsymbol\\sigma \\mathbf F^{-T}` and
+        :math:`\\mathbf S = \\mathbf F^{-1} \\mathbf P`.
+
+        Examples
+        --------
+        >>> report = yeoh().evaluate(lam, [0.5, 0.01, 0.001], stress_types=['cauchy', 'piola'])
+        >>> report['planar']['stress']['piola'][0]
+        """
+        from .numeric import deformation_gradient, invariants, stress_tensors
+
+        compressible_flag = getattr(self, "compressible", False)
+        anisotropic = bool(self.fiber_directions())
+        for stress_type in stress_types:
+            if stress_type not in ('cauchy', 'piola', '2nd-piola'):
+                raise ValueError(f"Unknown stress type: {stress_type}")
+
+        result = {}
+        for protocol in protocols:
+            lam = strain_converter(strain[protocol] if isinstance(strain, dict) else strain,
+                                   strain_type or "stretch")
+            lam = np.asarray(lam, dtype=float)
+            if protocol == 'equibiaxial':
+                F = deformation_gradient('biaxial', lam, lam, compressible=compressible_flag)
+            elif protocol == 'planar':
+                F = deformation_gradient('biaxial', lam, 1.0, compressible=compressible_flag)
+            elif protocol == 'biaxial':
+                F = deformation_gradient('biaxial', lam[0], lam[1], compressible=compressible_flag)
+            else:
+                F = deformation_gradient(protocol, lam, compressible=compressible_flag)
+            if protocol == 'uniaxial' and anisotropic and not compressible_flag:
+                # fibers break the lateral symmetry: solve the lateral stretches
+                from .path import evaluate_path, uniaxial_path
+                F = evaluate_path(self, uniaxial_path(lam), params)['F'].reshape(lam.shape + (3, 3))
+            I1, I2, J, b, b_inverse = invariants(F)
+            derivatives, fibers = self._derivatives(F, I1, I2, J, params)
+            derivatives = tuple(np.broadcast_to(d, I1.shape) for d in derivatives)
+            free_component = (1, 1) if protocol == 'uniaxial' else (2, 2)
+            tensors = stress_tensors(F, derivatives, (J, b, b_inverse), stress_types,
+                                     free_component=free_component, compressible=compressible_flag,
+                                     fibers=fibers)
+
+            stresses = {}
+            for stress_type, tensor in tensors.items():
+                if protocol in ('planar', 'biaxial'):
+                    stresses[stress_type] = (tensor[..., 0, 0], tensor[..., 1, 1])
+                elif protocol == 'simple_shear':
+                    stresses[stress_type] = tensor[..., 0, 1]
+                else:
+                    stresses[stress_type] = tensor[..., 0, 0]
+            result[protocol] = {'strain': lam, 'I1': I1, 'I2': I2, 'J': J,
+                                'dW_dI1': derivatives[0], 'dW_dI2': derivatives[1],
+                                'stress': stresses}
+        return result
+
+    def invariant_derivative_kernel(self):
+        """
+        Return the compiled invariant derivatives of :meth:`energy`.
+
+        :meth:`energy` is differentiated once per model instance and the
+        result cached like :meth:`stress_kernel`.
+
+        Returns
+        -------
+        function
+            ``f(I1, I2, J, *params)`` returning ``(dW_dI1, dW_dI2, dW_dJ)``.
+        """
+        cache = self.__dict__.setdefault('_kernel_cache', {})
+        key = ('invariant_derivatives',)
+        if key not in cache:
+            with self._build_lock(key):
+                if key not in cache:
+                    energy_expr = self.energy()
+                    derivatives = [sp.diff(energy_expr, s) for s in (I1_sym, I2_sym, J_sym)]
+                    cache[key] = sp.lambdify([I1_sym, I2_sym, J_sym] + self.model_param_symbols(),
+                                             derivatives, 'numpy')
+        return cache[key]
+
+    def fiber_directions(self):
+        """
+        Return the reference fiber directions of an anisotropic model.
+
+        Isotropic models have none. Anisotropic models return up to two
+        3×1 SymPy vectors a₀ and g₀ (possibly in terms of parameters such as
+        a fiber angle), which define the invariants I4 = a₀·C a₀ and
+        I6 = g₀·C g₀ used in :meth:`energy`.
+
+        Returns
+        -------
+        list of sympy.Matrix
+            Unit fiber directions in the reference configuration.
+        """
+        return []
+
+    def fiber_derivative_kernel(self):
+        """
+        Return the compiled invariant derivatives including the fiber invariants.
+
+        Returns
+        -------
+        function
+            ``f(I1, I2, J, I4, I6, *params)`` returning
+            ``(dW_dI1, dW_dI2, dW_dJ, dW_dI4, dW_dI6)``.
+        """
+        cache = self.__dict__.setdefault('_kernel_cache', {})
+        key = ('fiber_derivatives',)
+        if key not in cache:
+            with self._build_lock(key):
+                if key not in cache:
+                    energy_expr = self.energy()
+                    symbols = [I1_sym, I2_sym, J_sym, I4_sym, I6_sym]
+                    cache[key] = sp.lambdify(symbols + self.model_param_symbols(),
+                                             [sp.diff(energy_expr, s) for s in symbols], 'numpy')
+        return cache[key]
+
+    def stress_tensor(self, F, params: list[float], *, stress_types=('cauchy',), free_component=(2, 2)) -> dict:
+        """
+        Evaluate full stress tensors for a batch of deformation gradients.
+
+        The stress is assembled numerically from the compiled invariant
+        derivatives, :math:`\\sigma = 2W_1 \\mathbf b - 2W_2 \\mathbf b^{-1}
+        + 2W_4\\, \\mathbf a\\otimes\\mathbf a + 2W_6\\, \\mathbf g\\otimes\\mathbf g`
+        minus the pressure fixed by a traction-free component (compressible
+        models: :math:`\\tfrac{2}{J}[(W_1 + I_1 W_2)\\mathbf b - W_2 \\mathbf b^2
+        + W_4\\, \\mathbf a\\otimes\\mathbf a + W_6\\, \\mathbf g\\otimes\\mathbf g]
+        + W_J \\mathbf I`), so it covers arbitrary F and, for
+        anisotropic models, any number of fiber orientations at once.
+
+        Parameters
+        ----------
+        F : array_like
+            Deformation gradients, shape ``(..., 3, 3)``.
+        params : list
+            Material parameters; entries may be arrays broadcasting against
+            ``F.shape[:-2]`` (e.g. a column of fiber angles for a sweep).
+        stress_types : sequence of {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measures. Default is ``('cauchy',)``.
+        free_component : tuple of int, optional
+            Traction-free diagonal component fixing the pressure of
+            incompressible models. Default is (2, 2).
+
+        Returns
+        -------
+        dict
+            ``{stress_type: tensor}``, tensors of shape
+            ``broadcast(F.shape[:-2], params) + (3, 3)``.
+
+        Examples
+        --------
+        >>> angles = np.radians(np.linspace(0, 90, 1000))[:, None]
+        >>> sigma = hgo().stress_tensor(F, [1.0, 2.0, 5.0, angles])['cauchy']   # (1000, N, 3, 3)
+        """
+        from .numeric import invariants, stress_tensors
+
+        F = np.asarray(F, dtype=float)
+        I1, I2, J, b, b_inverse = invariants(F)
+        derivatives, fibers = self._derivatives(F, I1, I2, J, params)
+        return stress_tensors(F, derivatives, (J, b, b_inverse), stress_types,
+                              free_component=free_component,
+                              compressible=getattr(self, "compressible", False), fibers=fibers)
+
+    def _derivatives(self, F, I1, I2, J, params):
+        """
+        Invariant derivatives ``(dW_dI1, dW_dI2, dW_dJ)`` and the fiber terms
+        ``[(dW_dI4, F a₀), ...]`` expected by :func:`~libela.hyperelastic.numeric.stress_tensors`.
+        """
+        if not self.fiber_directions():
+            return self.invariant_derivative_kernel()(I1, I2, J, *params), ()
+        vectors = self._fiber_vectors(params)
+        C = np.swapaxes(F, -1, -2) @ F
+        fiber_invariants = [np.einsum('...i,...ij,...j->...', a0, C, a0) for a0 in vectors]
+        while len(fiber_invariants) < 2:
+            fiber_invariants.append(np.ones_like(I1))
+        derivatives = self.fiber_derivative_kernel()(I1, I2, J, *fiber_invariants, *params)
+        fibers = [(d, (F @ a0[..., None])[..., 0]) for d, a0 in zip(derivatives[3:], vectors)]
+        return tuple(derivatives[:3]), fibers
+
+    def _fiber_vectors(self, params):
+        """Numeric reference fiber directions, each of shape ``(..., 3)``."""
+        cache = self.__dict__.setdefault('_kernel_cache', {})
+        key = ('fiber_vectors',)
+        if key not in cache:
+            cache[key] = sp.lambdify(self.model_param_symbols(),
+                                     [list(a0) for a0 in self.fiber_directions()], 'numpy')
+        return [np.stack(np.broadcast_arrays(*(np.asarray(c, dtype=float) for c in a0)), axis=-1)
+                for a0 in cache[key](*params)]
+
+    def stress_kernel(self, protocol: str = 'uniaxial', stress_type: str = 'cauchy'):
+        """
+        Return the compiled (lambdified) stress function for a protocol.
+
+        The symbolic derivation runs once per model instance, protocol and
+        stress measure; later calls return the cached function.
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measure. Default is 'cauchy'.
+
+        Returns
+        -------
+        function or tuple of functions
+            ``f(lamda, *params)`` for uniaxial and simple shear, or the pair
+            ``(f11, f22)`` taking ``(lamda1, lamda2, *params)`` for biaxial.
+        """
+        cache = self.__dict__.setdefault('_kernel_cache', {})
+        key = ('stress', protocol, stress_type)
+        if key not in cache:
+            with self._build_lock(key):
+                if key not in cache:
+                    cache[key] = self._lambdify(protocol, self.stress_expression(protocol, stress_type))
+        return cache[key]
+
+    def tangent_kernel(self, protocol: str = 'uniaxial', stress_type: str = 'cauchy'):
+        """
+        Return the compiled tangent (derivative of stress with respect to stretch).
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measure. Default is 'cauchy'.
+
+        Returns
+        -------
+        function or tuple of functions
+            ``dσ/dλ (lamda, *params)`` for uniaxial and simple shear, or
+            ``(dσ11/dλ1, dσ11/dλ2, dσ22/dλ1, dσ22/dλ2)`` taking
+            ``(lamda1, lamda2, *params)`` for biaxial.
+        """
+        cache = self.__dict__.setdefault('_kernel_cache', {})
+        key = ('tangent', protocol, stress_type)
+        if key not in cache:
+            with self._build_lock(key):
+                if key not in cache:
+                    cache[key] = self._lambdify(protocol, self.tangent_expression(protocol, stress_type))
+        return cache[key]
+
+    def jacobian_kernel(self, protocol: str = 'uniaxial', stress_type: str = 'cauchy'):
+        """
+        Return the compiled derivatives of stress with respect to the model parameters.
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measure. Default is 'cauchy'.
+
+        Returns
+        -------
+        tuple of functions
+            ``∂σ/∂p_j (lamda, *params)``, one per parameter in
+            :meth:`model_param_symbols` order; for biaxial, one such tuple
+            per component (σ11, σ22) taking ``(lamda1, lamda2, *params)``.
+        """
+        cache = self.__dict__.setdefault('_kernel_cache', {})
+        key = ('jacobian', protocol, stress_type)
+        if key not in cache:
+            with self._build_lock(key):
+                if key not in cache:
+                    stress_expr = self.stress_expression(protocol, stress_type)
+                    params = self.model_param_symbols()
+                    if protocol == 'biaxial':
+                        cache[key] = tuple(self._lambdify(protocol, tuple(sp.diff(c, p) for p in params))
+                                           for c in stress_expr)
+                    else:
+                        cache[key] = self._lambdify(protocol, tuple(sp.diff(stress_expr, p) for p in params))
+        return cache[key]
+
+    def _kernel_stress_type(self, protocol, stress_type):
+        """
+        Stress measure of the kernel used by :meth:`stress` and :meth:`stress_batch`.
+
+        Incompressible principal protocols convert numerically from the
+        Cauchy kernel (see :func:`convert_stress`), so one kernel serves all
+        measures; other cases keep their own symbolic pipeline.
+        """
+        if (stress_type != 'cauchy' and protocol in ('uniaxial', 'biaxial')
+                and not getattr(self, "compressible", False)):
+            return 'cauchy'
+        return stress_type
+
+    def linear_in_params(self, protocol: str = 'uniaxial', stress_type: str = 'cauchy') -> bool:
+        """
+        Return whether the protocol stress is linear in the model parameters.
+
+        True for Mooney–Rivlin, Yeoh, polynomial, Klosner–Segal and
+        Neo-Hookean models; :meth:`stress_batch` then evaluates
+        :meth:`jacobian_kernel` once and combines parameter sets with a
+        matrix product.
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measure. Default is 'cauchy'.
+
+        Returns
+        -------
+        bool
+            True if every ∂σ/∂p_j is free of parameters and the stress
+            vanishes with all parameters zero (no parameter-free offset, so
+            σ = Σ_j p_j ∂σ/∂p_j exactly).
+        """
+        cache = self.__dict__.setdefault('_kernel_cache', {})
+        key = ('linear', protocol, stress_type)
+        if key not in cache:
+            stress_expr = self.stress_expression(protocol, stress_type)
+            components = stress_expr if isinstance(stress_expr, tuple) else (stress_expr,)
+            params = set(self.model_param_symbols())
+            zeros = {p: 0 for p in params}
+            cache[key] = (all(not (sp.diff(c, p).free_symbols & params)
+                              for c in components for p in params)
+                          and all(sp.simplify(c.subs(zeros)) == 0 for c in components))
+        return cache[key]
+
+    def energy_kernel(self, protocol: str = 'uniaxial'):
+        """
+        Return the compiled (lambdified) strain-energy density for a protocol.
+
+        The invariants of the protocol's deformation gradient are substituted
+        into :meth:`energy`; the result is cached like :meth:`stress_kernel`.
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+
+        Returns
+        -------
+        function
+            ``W(lamda, *params)`` for uniaxial and simple shear, or
+            ``W(lamda1, lamda2, *params)`` for biaxial.
+        """
+        cache = self.__dict__.setdefault('_kernel_cache', {})
+        key = ('energy', protocol)
+        if key not in cache:
+            with self._build_lock(key):
+                if key not in cache:
+                    cache[key] = self._lambdify(protocol, self.energy_expression(protocol))
+        return cache[key]
+
+    def stress_expression(self, protocol: str = 'uniaxial', stress_type: str = 'cauchy'):
+        """
+        Return the symbolic protocol stress, with the pressure eliminated.
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measure. Default is 'cauchy'.
+
+        Returns
+        -------
+        sympy.Expr or tuple of sympy.Expr
+            Stress in the stretch symbols of :func:`stretch_symbols` and the
+            model parameters; ``(σ11, σ22)`` for biaxial.
+        """
+        cache = self.__dict__.setdefault('_kernel_cache', {})
+        key = ('stress_expr', protocol, stress_type)
+        if key not in cache:
+            with self._build_lock(key):
+                if key not in cache:
+                    cache[key] = self._derive_stress(protocol, stress_type)
+        return cache[key]
+
+    def tangent_expression(self, protocol: str = 'uniaxial', stress_type: str = 'cauchy'):
+        """
+        Return the symbolic derivative of :meth:`stress_expression` with respect to stretch.
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measure. Default is 'cauchy'.
+
+        Returns
+        -------
+        sympy.Expr or tuple of sympy.Expr
+            See :meth:`tangent_kernel`.
+        """
+        cache = self.__dict__.setdefault('_kernel_cache', {})
+        key = ('tangent_expr', protocol, stress_type)
+        if key not in cache:
+            with self._build_lock(key):
+                if key not in cache:
+                    stress_expr = self.stress_expression(protocol, stress_type)
+                    if protocol == 'biaxial':
+                        cache[key] = tuple(sp.diff(component, lam)
+                                           for component in stress_expr
+                                           for lam in stretch_symbols(protocol))
+                    else:
+                        cache[key] = sp.diff(stress_expr, stretch_symbols(protocol)[0])
+        return cache[key]
+
+    def energy_expression(self, protocol: str = 'uniaxial'):
+        """
+        Return the symbolic strain-energy density along a protocol.
+
+        Parameters
+        ----------
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+
+        Returns
+        -------
+        sympy.Expr
+            :meth:`energy` with the protocol invariants substituted.
+        """
+        cache = self.__dict__.setdefault('_kernel_cache', {})
+        key = ('energy_expr', protocol)
+        if key not in cache:
+            with self._build_lock(key):
+                if key not in cache:
+                    self._check_template(protocol)
+                    F = deformation_gradient_matrix(protocol, compressible=getattr(self, "compressible", False))
+                    b = F * sp.transpose(F)
+                    invariant_subs = {I1_sym: b.trace(),
+                                      I2_sym: 1 / 2 * (b.trace()**2 - (b * b).trace()),
+                                      J_sym: F.det()}
+                    for sym, a0 in zip((I4_sym, I6_sym), self.fiber_directions()):
+                        a = F * a0
+                        invariant_subs[sym] = (a.T * a)[0, 0]
+                    cache[key] = self.energy().subs(invariant_subs)
+        return cache[key]
+
+    def model_param_symbols(self):
+        """
+        Return the model parameter symbols in the order expected by `params`.
+
+        Uses `param_symbols_list` when the model defines it, otherwise the
+        free symbols of :meth:`energy` (other than I1, I2, J) sorted by name.
+
+        Returns
+        -------
+        list of sympy.Symbol
+            Parameter symbols.
+        """
+        if self.param_symbols_list:
+            return list(self.param_symbols_list)
+        invariant_names = {I1_sym.name, I2_sym.name, J_sym.name, I4_sym.name, I6_sym.name}
+        return sorted((s for s in self.energy().free_symbols if s.name not in invariant_names),
+                      key=lambda s: s.name)
+
+    def _build_lock(self, key):
+        """
+        Lock serializing the build of one cached kernel or expression.
+
+        A kernel requested while another thread (e.g. :func:`~libela.hyperelastic.prewarm.prewarm`)
+        is building it waits for that build instead of repeating it.
+        """
+        locks = self.__dict__.setdefault('_kernel_locks', {})
+        return locks.setdefault(key, threading.RLock())
+
+    def _lambdify(self, protocol, expressions):
+        """
+        Lambdify one expression, or each of a tuple, in ``(stretch..., *params)``.
+
+        Parameters
+        ----------
+        protocol : str
+            Deformation protocol, selecting the stretch symbols.
+        expressions : sympy.Expr or tuple of sympy.Expr
+            Expressions to compile.
+
+        Returns
+        -------
+        function or tuple of functions
+            NumPy functions.
+        """
+        lambdify_args = stretch_symbols(protocol) + self.model_param_symbols()
+        if isinstance(expressions, tuple):
+            return tuple(sp.lambdify(lambdify_args, e, 'numpy') for e in expressions)
+        return sp.lambdify(lambdify_args, expressions, 'numpy')
+
+    def _check_template(self, protocol):
+        """
+        Reject the uniaxial template for incompressible anisotropic models.
+
+        F = diag(λ, λ^-1/2, λ^-1/2) leaves σ₂₂ ≠ σ₃₃ when fibers lie in the
+        1–2 plane, so it is not a uniaxial stress state.
+        """
+        if (protocol == 'uniaxial' and not getattr(self, "compressible", False)
+                and self.fiber_directions()):
+            raise ValueError("The uniaxial template is not a uniaxial stress state for anisotropic "
+                             "models; use stress() or path.evaluate_path(model, uniaxial_path(lam), params).")
+
+    def _derive_stress(self, protocol, stress_type):
+        """
+        Derive the symbolic stress tensor and reduce it to the protocol components.
+
+        Parameters
+        ----------
+        protocol : str
+            Deformation protocol.
+        stress_type : str
+            Stress measure.
+
+        Returns
+        -------
+        sympy.Expr or tuple of sympy.Expr
+            See :meth:`stress_expression`.
+        """
+        compressible_flag = getattr(self, "compressible", False)
+        self._check_template(protocol)
+        
         #deformation gradient & tensors
         F = deformation_gradient_matrix(protocol, compressible=compressible_flag)
         self.F = F
@@ -115,76 +851,81 @@ class operations:
         # Strain-energy expression 
         energy_expr = self.energy() # call energy function without passing J_sym.
         
-        #First derivatives, *then* substitute I1, I2, J
+        #First derivatives, *then* substitute I1, I2, J (and the fiber invariants)
         invariant_subs = {I1_sym: I1, I2_sym: I2, J_sym: J_expr}
+        fibers = [(sym, F * a0) for sym, a0 in zip((I4_sym, I6_sym), self.fiber_directions())]
+        for sym, a in fibers:
+            invariant_subs[sym] = (a.T * a)[0, 0]
         diff1_W = sp.diff(energy_expr, I1_sym).subs(invariant_subs)
         diff2_W = sp.diff(energy_expr, I2_sym).subs(invariant_subs)
         
-        #Isochoric part
-        sigma_expression = 2 * (diff1_W * b) - 2 * (diff2_W * b_inverse)
+        #Isochoric part: σ = (2/J)[(W1 + I1 W2) b − W2 b²], which for J = 1
+        #equals 2 W1 b − 2 W2 b⁻¹ up to a pressure absorbed by P
+        if compressible_flag:
+            sigma_expression = 2 / J_expr * ((diff1_W + I1 * diff2_W) * b - diff2_W * b2)
+        else:
+            sigma_expression = 2 * (diff1_W * b) - 2 * (diff2_W * b_inverse)
+        
+        #Fiber part, (2/J) ∂W/∂I4 a⊗a (+ (2/J) ∂W/∂I6 g⊗g)
+        for sym, a in fibers:
+            sigma_expression += 2 / J_expr * sp.diff(energy_expr, sym).subs(invariant_subs) * (a * a.T)
         
         if compressible_flag:
             dW_dJ = sp.diff(energy_expr, J_sym ).subs(invariant_subs)
-            sigma_expression += J_expr * dW_dJ * sp.eye(3)  # volumetric part
+            sigma_expression += dW_dJ * sp.eye(3)  # volumetric part
         
         # add Lagrange multiplier for incompressible model
         else:
             sigma_expression -= P * sp.eye(3)  # incompressible part
         
-        #choose stress measure
+        #choose stress measure: P = J σ F⁻ᵀ, S = F⁻¹ P (the pressure, if any,
+        #is already part of σ)
         
         if stress_type == 'piola':
-            sigma_cauchy_incompressible = sigma_expression - P * sp.eye(3)
-            sigma_piola_incompressible = sigma_cauchy_incompressible * F_inverse_transpose
-            sigma_tensor = sigma_piola_incompressible
+            sigma_tensor = J_expr * sigma_expression * F_inverse_transpose
         elif stress_type == '2nd-piola':
-            sigma_cauchy_incompressible = sigma_expression - P * sp.eye(3)
-            sigma_piola_incompressible = sigma_cauchy_incompressible * F_inverse_transpose
-            sigma_2nd_piola_incompressible = F_inverse * sigma_piola_incompressible
-            sigma_tensor = sigma_2nd_piola_incompressible
+            sigma_tensor = F_inverse * (J_expr * sigma_expression * F_inverse_transpose)
         else:
             sigma_tensor = sigma_expression
         
-        #protocol specific stress solver
+        #protocol specific stress components; only incompressible models
+        #carry the pressure P to be fixed by a traction-free face
+        pressure = None if compressible_flag else P
             
         if protocol == 'uniaxial':
-            stress_component_expr = sigma_tensor[0, 0]  # Uniaxial stress component
-            lam_s = sp.symbols('lamda')
-            
-            if compressible_flag:
-                lambdify_args = [lam_s] + model_param_syms
-                stress_fn = sp.lambdify(lambdify_args, stress_component_expr, 'numpy')
-            
-            else:
-                stress_fn = uniaxial_solver(sigma_tensor, P, model_param_syms)
-            
-            stress_values = stress_fn(strain, *params)
+            return uniaxial_stress_expression(sigma_tensor, pressure)
 
         elif protocol == 'simple_shear':
-            stress_12_function = simple_shear_solver(sigma_tensor)
-            stress_values = stress_12_function(strain, *params)
-            #return stress_12_function(strain, *params)
+            return sigma_tensor[0, 1]  # Shear stress component
 
         elif protocol == 'biaxial':
-            stress_11_function, stress_22_function = biaxial_solver(sigma_tensor)
-            stress_11_values = stress_11_function(strain[0, :], strain[1, :], *params)
-            stress_22_values = stress_22_function(strain[0, :], strain[1, :], *params)
-            stress_values = (stress_11_values, stress_22_values)
-            #return (stress_11_function(strain[0, :], strain[1, :], *params), stress_22_function(strain[0, :], strain[1, :], *params))
-        else:
-            raise ValueError(f"Unknown protocol: {protocol}")
-        
-        model_name = self.__class__.__name__
-        
-        if plot:
-            _plot_stress_strain(strain, stress_values, 
-                        protocol, 
-                        stress_type,  
-                        strain_type or "stretch",
-                        self.__class__.__name__)
-            
-        return stress_values
-    
+            return biaxial_stress_expressions(sigma_tensor, pressure)
+
+        raise ValueError(f"Unknown protocol: {protocol}")
+
+    def __add__(self, other):
+        """Sum of energies, as a :class:`~libela.hyperelastic.composite.composite_model`."""
+        from .composite import composite_model, term
+        if not isinstance(other, (operations, term)):
+            return NotImplemented
+        return composite_model(self, other)
+
+    def __radd__(self, other):
+        """Support ``sum(models)`` (the start value 0 is dropped)."""
+        from .composite import composite_model
+        if isinstance(other, (int, float)) and other == 0:
+            return composite_model(self)
+        return NotImplemented
+
+    def __mul__(self, scale):
+        """Energy scaled by a constant, as a :class:`~libela.hyperelastic.composite.composite_model`."""
+        from .composite import composite_model, term
+        if not isinstance(scale, (int, float, np.number)):
+            return NotImplemented
+        return composite_model(term(self, scale))
+
+    __rmul__ = __mul__
+
     def fit(self):
         """
         Placeholder for parameter-fitting routine.
@@ -208,11 +949,13 @@ def strain_converter(strain, strain_type):
     Parameters
     ----------
     strain : array_like or float
-        The input strain array. Can be engineering strain (ε) or direct stretch (λ).
-    strain_type : {'engineering', 'stretch'}
+        The input strain array.
+    strain_type : {'engineering', 'stretch', 'true', 'green-lagrange'}
         Type of input strain:
         - 'engineering': Interprets input as ε, returns λ = 1 + ε.
         - 'stretch': Returns the input as-is.
+        - 'true': Logarithmic strain ε = ln λ, returns λ = exp(ε).
+        - 'green-lagrange': E = (λ² - 1)/2, returns λ = sqrt(1 + 2E).
 
     Returns
     -------
@@ -232,9 +975,264 @@ def strain_converter(strain, strain_type):
         return 1 + strain
     elif strain_type == 'stretch':
         return strain
+    elif strain_type == 'true':
+        return np.exp(strain)
+    elif strain_type == 'green-lagrange':
+        return np.sqrt(1 + 2 * strain)
     else:
-        raise ValueError("Invalid strain type. Use 'engineering' or 'stretch'")
-    
+        raise ValueError("Invalid strain type. Use 'engineering', 'stretch', 'true' or 'green-lagrange'")
+
+
+def stretch_to_strain(stretch, strain_type, *, out=None):
+    """
+    Convert principal stretches to a strain measure; inverse of :func:`strain_converter`.
+
+    Parameters
+    ----------
+    stretch : array_like
+        Stretches λ.
+    strain_type : {'engineering', 'stretch', 'true', 'green-lagrange'}
+        Target measure.
+    out : np.ndarray, optional
+        Float array to write the result into; may be `stretch` itself.
+
+    Returns
+    -------
+    np.ndarray
+        Strain in the requested measure.
+    """
+    stretch = np.asarray(stretch, dtype=float)
+    if strain_type == 'engineering':
+        return np.subtract(stretch, 1.0, out=out)
+    elif strain_type == 'stretch':
+        return np.multiply(stretch, 1.0, out=out)
+    elif strain_type == 'true':
+        return np.log(stretch, out=out)
+    elif strain_type == 'green-lagrange':
+        result = np.square(stretch, out=out)
+        result -= 1.0
+        result *= 0.5
+        return result
+    raise ValueError("Invalid strain type. Use 'engineering', 'stretch', 'true' or 'green-lagrange'")
+
+
+def convert_stress(stress, stretch, from_type, to_type, *, protocol='uniaxial', compressible=False, out=None):
+    """
+    Convert protocol stress values between Cauchy, first and second Piola–Kirchhoff measures.
+
+    For the diagonal protocols the principal components satisfy
+    :math:`P_i = J \\sigma_i / \\lambda_i` and :math:`S_i = P_i / \\lambda_i`,
+    with J = 1 for incompressible models and the protocol's J (λ for
+    uniaxial, λ₁λ₂ for biaxial) otherwise. In simple shear σ₁₂ = P₁₂;
+    S₁₂ also needs σ₂₂ and is not available.
+
+    Parameters
+    ----------
+    stress : array_like or tuple of array_like
+        Stress values; (σ₁₁, σ₂₂) pair for biaxial.
+    stretch : array_like
+        Stretches (amount of shear for simple shear); ``(2, N)`` for biaxial.
+    from_type, to_type : {'cauchy', 'piola', '2nd-piola'}
+        Source and target measures.
+    protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+        Deformation protocol. Default is 'uniaxial'.
+    compressible : bool, optional
+        If True, the protocol F has no lateral contraction (see
+        :func:`deformation_gradient_matrix`). Default is False.
+    out : np.ndarray or tuple of np.ndarray, optional
+        Float array(s) to write into; may be `stress` itself for an in-place
+        conversion.
+
+    Returns
+    -------
+    np.ndarray or tuple of np.ndarray
+        Converted stress.
+    """
+    measures = ('cauchy', 'piola', '2nd-piola')
+    if from_type not in measures or to_type not in measures:
+        raise ValueError(f"Unknown stress type; use one of {measures}.")
+    stretch = np.asarray(stretch, dtype=float)
+    if protocol == 'simple_shear':
+        if '2nd-piola' in (from_type, to_type) and from_type != to_type:
+            raise ValueError("2nd-piola shear stress needs the normal stresses; convert the kernel output instead.")
+        return np.multiply(stress, 1.0, out=out)
+    if protocol == 'biaxial':
+        lam = (stretch[0], stretch[1])
+        J = stretch[0] * stretch[1] if compressible else 1.0
+        outs = out if out is not None else (None, None)
+        return tuple(_scale_stress(component, l, J, from_type, to_type, o)
+                     for component, l, o in zip(stress, lam, outs))
+    if protocol != 'uniaxial':
+        raise ValueError(f"Unknown protocol: {protocol}")
+    J = stretch if compressible else 1.0
+    return _scale_stress(stress, stretch, J, from_type, to_type, out)
+
+
+def _subset(params, shape, index):
+    """Parameters restricted to the flat points `index` (scalars pass through)."""
+    return [p if np.ndim(p) == 0 else np.broadcast_to(p, shape).ravel()[index] for p in params]
+
+
+def _newton_bracketed(stress_fn, tangent_fn, target, params, tol, max_iter, additive=False):
+    """
+    Vectorized bracketed Newton solve of ``stress_fn(x, *params) = target``.
+
+    Brackets are grown from x = 1 (stretch, multiplicatively towards 0) or
+    x = 0 (shear, additively) until the residual changes sign; growth stops
+    at a limit point (non-positive tangent), so roots are taken on the
+    stable branch connected to the undeformed state.
+    """
+    shape = target.shape
+    t = target.ravel()
+    n = t.size
+    x0 = 0.0 if additive else 1.0
+    lo = np.full(n, np.nan)
+    hi = np.full(n, np.nan)
+    r0 = np.broadcast_to(stress_fn(np.full(n, x0), *_subset(params, shape, slice(None))), (n,)) - t
+    up = r0 < 0
+    lo[up], hi[~up] = x0, x0
+
+    # grow the open side of each bracket until the residual changes sign
+    active = np.flatnonzero(r0 != 0)
+    lo[r0 == 0] = hi[r0 == 0] = x0
+    step = np.ones(n)
+    for _ in range(200):
+        if active.size == 0:
+            break
+        sub = _subset(params, shape, active)
+        grow_up = up[active]
+        if additive:
+            trial = np.where(grow_up, x0 + step[active], x0 - step[active])
+        else:
+            trial = np.where(grow_up, x0 + step[active], x0 / (1.0 + step[active]))
+        with np.errstate(all='ignore'):
+            r = np.broadcast_to(stress_fn(trial, *sub), trial.shape) - t[active]
+            d = np.broadcast_to(tangent_fn(trial, *sub), trial.shape)
+        crossed = np.where(grow_up, r >= 0, r <= 0)
+        inner = np.where(grow_up, lo[active], hi[active])
+        # past a limit point without crossing: the stable branch ends at the stress extremum
+        limit = ~crossed & ~(d > 0)
+        if limit.any():
+            peak = _limit_point(tangent_fn, inner[limit], trial[limit], _subset(params, shape, active[limit]))
+            with np.errstate(all='ignore'):
+                r_peak = np.broadcast_to(stress_fn(peak, *_subset(params, shape, active[limit])),
+                                         peak.shape) - t[active[limit]]
+            trial[limit] = peak
+            crossed[limit] = np.where(grow_up[limit], r_peak >= 0, r_peak <= 0)
+            r[limit] = np.where(crossed[limit], r_peak, np.nan)   # no root on the stable branch
+        outer = np.where(crossed, trial, inner)
+        inner = np.where(crossed, inner, trial)
+        lo[active] = np.where(grow_up, inner, outer)
+        hi[active] = np.where(grow_up, outer, inner)
+        step[active] *= 2.0
+        failed = ~crossed & ~np.isfinite(r)
+        lo[active[failed]] = np.nan
+        active = active[~crossed & ~failed]
+    lo[active] = np.nan
+    found = np.isfinite(lo) & np.isfinite(hi)
+
+    x = np.where(found, 0.5 * (lo + hi), np.nan)
+    active = np.flatnonzero(found & (lo != hi))
+    x[found & (lo == hi)] = lo[found & (lo == hi)]
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        sub = _subset(params, shape, active)
+        xa = x[active]
+        with np.errstate(all='ignore'):
+            r = np.broadcast_to(stress_fn(xa, *sub), xa.shape) - t[active]
+            d = np.broadcast_to(tangent_fn(xa, *sub), xa.shape)
+        below = r < 0
+        lo[active[below]] = xa[below]
+        hi[active[~below]] = xa[~below]
+        with np.errstate(all='ignore'):
+            x_new = xa - r / d
+        la, ha = lo[active], hi[active]
+        safe = (d > 0) & (x_new > la) & (x_new < ha)
+        x_new = np.where(safe, x_new, 0.5 * (la + ha))
+        small = np.abs(r) <= tol * (1.0 + np.abs(t[active]))
+        x[active] = np.where(small, xa, x_new)
+        active = active[~(small | (np.abs(x_new - xa) <= tol * (1.0 + np.abs(xa))))]
+    return x.reshape(shape)
+
+
+def _limit_point(tangent_fn, a, b, params, n_iter=60):
+    """Bisection for the zero of the tangent between `a` (positive) and `b`."""
+    for _ in range(n_iter):
+        mid = 0.5 * (a + b)
+        with np.errstate(all='ignore'):
+            rising = np.broadcast_to(tangent_fn(mid, *params), mid.shape) > 0
+        a = np.where(rising, mid, a)
+        b = np.where(rising, b, mid)
+    return a
+
+
+def _newton_2d(stress_fns, tangent_fns, targets, params, tol, max_iter):
+    """Damped 2-D Newton solve of the biaxial stress pair, with backtracking."""
+    shape = targets[0].shape
+    t1, t2 = (t.ravel() for t in targets)
+    n = t1.size
+    lam1, lam2 = np.ones(n), np.ones(n)
+    f11, f22 = stress_fns
+
+    def residual(l1, l2, sub, idx):
+        return (np.broadcast_to(f11(l1, l2, *sub), l1.shape) - t1[idx],
+                np.broadcast_to(f22(l1, l2, *sub), l1.shape) - t2[idx])
+
+    active = np.arange(n)
+    converged = np.zeros(n, dtype=bool)
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        sub = _subset(params, shape, active)
+        l1, l2 = lam1[active], lam2[active]
+        with np.errstate(all='ignore'):
+            r1, r2 = residual(l1, l2, sub, active)
+            a, b, c, d = (np.broadcast_to(f(l1, l2, *sub), l1.shape) for f in tangent_fns)
+            det = a * d - b * c
+            s1 = -(d * r1 - b * r2) / det
+            s2 = -(-c * r1 + a * r2) / det
+        norm = np.hypot(r1, r2)
+        done = norm <= tol * (1.0 + np.hypot(t1[active], t2[active]))
+        converged[active[done]] = True
+        # backtracking: halve the step until stretches stay positive and the residual drops
+        alpha = np.ones(l1.shape)
+        for _ in range(30):
+            n1, n2 = l1 + alpha * s1, l2 + alpha * s2
+            with np.errstate(all='ignore'):
+                q1, q2 = residual(n1, n2, sub, active)
+                ok = (n1 > 0) & (n2 > 0) & (np.hypot(q1, q2) < norm)
+            if ok.all():
+                break
+            alpha = np.where(ok, alpha, 0.5 * alpha)
+        move = ~done & np.isfinite(s1) & np.isfinite(s2)
+        lam1[active[move]] = n1[move]
+        lam2[active[move]] = n2[move]
+        stalled = np.abs(alpha * s1) + np.abs(alpha * s2) <= tol * (l1 + l2)
+        converged[active[move & stalled]] = True
+        active = active[move & ~stalled]
+    lam1[~converged] = np.nan
+    lam2[~converged] = np.nan
+    return np.stack([lam1.reshape(shape), lam2.reshape(shape)])
+
+
+def _writable(values):
+    """`values` (or each of a tuple) if it can receive an in-place result, else None."""
+    if isinstance(values, tuple):
+        return tuple(_writable(v) for v in values)
+    if isinstance(values, np.ndarray) and values.flags.writeable and values.dtype == np.float64:
+        return values
+    return None
+
+
+def _scale_stress(stress, lam, J, from_type, to_type, out):
+    """Multiply one principal stress component by J^k λ^-m for the measure change."""
+    power = {'cauchy': 0, 'piola': 1, '2nd-piola': 2}
+    j_power = int(to_type != 'cauchy') - int(from_type != 'cauchy')
+    factor = lam ** (power[from_type] - power[to_type]) * np.asarray(J, dtype=float) ** j_power
+    return np.multiply(stress, factor, out=out)
+
+
 def deformation_gradient_matrix(protocol: str = 'uniaxial', *, compressible: bool = False):
     """
     Return the symbolic deformation gradient tensor F for a given loading protocol.
@@ -280,7 +1278,69 @@ def deformation_gradient_matrix(protocol: str = 'uniaxial', *, compressible: boo
     else:
         raise ValueError(f"Unknown protocol: {protocol}. Supported protocols are 'uniaxial', 'simple_shear', 'biaxial'.")
 
+def stretch_symbols(protocol: str = 'uniaxial'):
+    """
+    Return the stretch symbols that parameterize a protocol's deformation gradient.
+
+    Parameters
+    ----------
+    protocol : {'uniaxial', 'simple_shear', 'biaxial'}
+        Type of deformation protocol.
+
+    Returns
+    -------
+    list of sympy.Symbol
+        ``[lamda]``, or ``[lamda1, lamda2]`` for biaxial.
+    """
+    if protocol == 'biaxial':
+        return list(sp.symbols('lamda1 lamda2'))
+    return [sp.symbols('lamda')]
+
 # ---- protocol-specific solvers ---------------------------
+def uniaxial_stress_expression(sigma_tensor, P):
+    """
+    Return σ₁₁ of a uniaxial test with the pressure fixed by σ₂₂ = 0.
+
+    Parameters
+    ----------
+    sigma_tensor : sympy.Matrix
+        Symbolic stress tensor.
+    P : sympy.Symbol or None
+        Lagrange multiplier for incompressibility; None for compressible
+        models, which have no pressure to solve for.
+
+    Returns
+    -------
+    sympy.Expr
+        Uniaxial stress component.
+    """
+    if P is None or P not in sigma_tensor.free_symbols:
+        return sigma_tensor[0, 0]
+    P_val = sp.solve(sp.Eq(sigma_tensor[1, 1], 0), P)[0]  # Enforcing component 22 of stress = 0
+    return sigma_tensor[0, 0].subs(P, P_val)
+
+def biaxial_stress_expressions(sigma_tensor, P):
+    """
+    Return (σ₁₁, σ₂₂) of a biaxial test with the pressure fixed by σ₃₃ = 0.
+
+    Parameters
+    ----------
+    sigma_tensor : sympy.Matrix
+        Symbolic stress tensor.
+    P : sympy.Symbol or None
+        Lagrange multiplier for incompressibility; None for compressible
+        models, which have no pressure to solve for.
+
+    Returns
+    -------
+    tuple of sympy.Expr
+        In-plane stress components.
+    """
+    if P is None or P not in sigma_tensor.free_symbols:
+        return sigma_tensor[0, 0], sigma_tensor[1, 1]
+    P_val = sp.solve(sp.Eq(sigma_tensor[2, 2], 0), P)[0]  # Enforcing out-of-plane stress = 0
+    return sigma_tensor[0, 0].subs(P, P_val), sigma_tensor[1, 1].subs(P, P_val)
+
 def uniaxial_solver(sigma_tensor, P, model_param_symbols):
     """
     Generate a function to solve for uniaxial stress given a symbolic stress tensor.
@@ -299,18 +1359,13 @@ def uniaxial_solver(sigma_tensor, P, model_param_symbols):
     function
         Function that computes uniaxial stress for given stretches and parameters.
     """
-    #P = sp.symbols('P')
-    Eq = sp.Eq(sigma_tensor[1,1], 0) # Enforcing component 22 of stress = 0
-    P_val = sp.solve(Eq, P)[0] # Solving the symbolic expression for P 
-    P_sub_val = P_val
-    
-    stress_tensor = sigma_tensor[0,0].subs(P, P_sub_val) # Substituting the expression of P into the component 11 of stress
+    stress_tensor = uniaxial_stress_expression(sigma_tensor, P) # component 11 with P eliminated
     
     lam_s = sp.symbols('lamda')
     lambdify_args = [lam_s] + model_param_symbols
     return sp.lambdify(lambdify_args, stress_tensor, 'numpy')
 
-def simple_shear_solver(sigma_tensor):
+def simple_shear_solver(sigma_tensor, model_param_symbols=None):
     """
     Generate a function to solve for simple shear stress given a symbolic stress tensor.
 
@@ -318,6 +1373,9 @@ def simple_shear_solver(sigma_tensor):
     ----------
     sigma_tensor : sympy.Matrix
         Symbolic stress tensor.
+    model_param_symbols : list, optional
+        List of model parameter symbols. If omitted, the free symbols of the
+        stress component are used, sorted by name.
 
     Returns
     -------
@@ -325,13 +1383,15 @@ def simple_shear_solver(sigma_tensor):
         Function that computes shear stress for given strains and parameters.
     """
     stress_tensor = sigma_tensor[0,1] # Shear stress component
+    if model_param_symbols is not None:
+        return sp.lambdify([sp.symbols('lamda')] + list(model_param_symbols), stress_tensor, 'numpy')
     symbols = sorted (
         stress_tensor.free_symbols,
         key = lambda s: (s.name != 'lamda', s.name)
         ) # This is used to make sure that input parameters are sorted and also lamda comes in the first place
     return sp.lambdify(symbols, stress_tensor, 'numpy')
 
-def biaxial_solver(sigma_tensor):
+def biaxial_solver(sigma_tensor, model_param_symbols=None):
     """
     Generate functions to solve for biaxial stress components given a symbolic stress tensor.
 
@@ -339,6 +1399,9 @@ def biaxial_solver(sigma_tensor):
     ----------
     sigma_tensor : sympy.Matrix
         Symbolic stress tensor.
+    model_param_symbols : list, optional
+        List of model parameter symbols. If omitted, the free symbols of each
+        stress component are used, sorted by name.
 
     Returns
     -------
@@ -346,10 +1409,13 @@ def biaxial_solver(sigma_tensor):
         Functions that compute σ₁₁ and σ₂₂ for given stretches and parameters.
     """
     P = sp.symbols('P')
-    Eq = sp.Eq(sigma_tensor[2,2], 0) # Enforcing out-of-plane stress = 0
-    P_val = sp.solve(Eq, P)[0]
-    stress_1 = sigma_tensor[0,0].subs(P, P_val)
-    stress_2 = sigma_tensor[1,1].subs(P, P_val)
+    stress_1, stress_2 = biaxial_stress_expressions(sigma_tensor, P) # out-of-plane stress = 0
+    if model_param_symbols is not None:
+        lambdify_args = list(sp.symbols('lamda1 lamda2')) + list(model_param_symbols)
+        return (
+            sp.lambdify(lambdify_args, stress_1, 'numpy'),
+            sp.lambdify(lambdify_args, stress_2, 'numpy')
+        )
     symbols1 = sorted(
         stress_1.free_symbols, 
         key=lambda s: (s.name not in ['lamda1', 'lamda2'], s.name)
@@ -383,24 +1449,14 @@ def _plot_stress_strain(strain, stress_values, protocol, stress_type, strain_typ
         Type of strain measure.
     model_name : str
         Name of the material model.
-    """
-  
-    
-    import matplotlib.pyplot as plt
-
-    plt.figure(figsize=(7,5))
 
-    if protocol in ["uniaxial", "shear"]:
+    Notes
+    -----
+    Delegates to :func:`~libela.hyperelastic.plotting.plot_stress_strain`,
+    which downsamples large curves (LTTB) before drawing.
+    """
+    from .plotting import plot_stress_strain
 
-        plt.plot(strain, stress_values, 'o-', label = 'stress')
-    else:
-        plt.plot(strain[0, :], stress_values[0], 'o-', label = 'stress 11')
-        plt.plot(strain[1, :], stress_values[1], 's-', label = 'stress 22')
-        
-    plt.xlabel(strain_type)
-    plt.ylabel(stress_type)
-    plt.title(f"{model_name}: {protocol}")
-    plt.grid(True)
-    plt.legend()
-    plt.show()
+    plot_stress_strain(strain, stress_values, protocol=protocol, stress_type=stress_type,
+                       strain_type=strain_type, title=f"{model_name}: {protocol}")
           
@@ -0,0 +1,377 @@
+"""
+path.py
+=======
+
+Stress along arbitrary, time-dependent loading paths.
+
+A :class:`loading_path` is a sampled deformation-gradient trajectory
+``F(t)``, shape ``(N, 3, 3)``, plus per step the principal directions whose
+faces are traction-free. :func:`evaluate_path` solves the free stretches of
+every step numerically and returns the full stress tensors, all steps in one
+vectorized pass:
+
+* stresses come from
+  :meth:`~libela.hyperelastic.operations.operations.stress_tensor`, i.e. the
+  invariant derivatives compiled once per model (including the fiber
+  invariants of anisotropic models), with no per-protocol symbolic F;
+* incompressible models eliminate the pressure on the first free face and fix
+  its stretch by det F = 1; remaining free faces, and all free faces of
+  compressible models, are solved with a batched Newton iteration on the
+  normal stresses;
+* steps are grouped by their free-face pattern, so mixed-mode sequences
+  (e.g. uniaxial → planar → equibiaxial cycles) are evaluated in one call.
+
+Parametric builders cover the common test modes; :func:`sequence` (or ``+``)
+chains them into multi-stage programs.
+
+Public API
+----------
+loading_path        — sampled F(t) with traction-free faces
+evaluate_path       — stress along a path, free stretches solved numerically
+uniaxial_path       — uniaxial tension / compression, lateral faces free
+equibiaxial_path    — equal in-plane stretch, thickness free
+planar_path         — pure shear (planar tension), λ₂ = 1, thickness free
+biaxial_path        — general in-plane stretches, thickness free
+simple_shear_path   — prescribed shear, pressure fixed by σ₃₃ = 0
+sequence            — concatenate paths into one program
+
+Notes
+-----
+* For incompressible models without free faces (e.g. simple shear or a fully
+  prescribed F), the pressure is fixed by σ₃₃ = 0, as in
+  :meth:`~libela.hyperelastic.operations.operations.stress`.
+* Compressible models contract freely on the free faces, whereas the
+  compressible templates of
+  :func:`~libela.hyperelastic.operations.deformation_gradient_matrix` keep
+  the lateral stretches at 1.
+* Piola measures are :math:`\\mathbf P = J \\boldsymbol\\sigma \\mathbf F^{-T}`
+  and :math:`\\mathbf S = \\mathbf F^{-1} \\mathbf P`, as in
+  :meth:`~libela.hyperelastic.operations.operations.evaluate`.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .numeric import invariants
+
+
+class loading_path:
+    """
+    Sampled deformation-gradient trajectory with traction-free faces.
+
+    Parameters
+    ----------
+    F : array_like
+        Deformation gradients, shape ``(N, 3, 3)``. Diagonal entries of free
+        directions are only initial guesses.
+    free : array_like of bool or sequence of int, optional
+        Traction-free principal directions: indices shared by all steps
+        (e.g. ``(1, 2)``), or a boolean mask of shape ``(3,)`` or ``(N, 3)``.
+        Default is none.
+    time : array_like, optional
+        Time of each step. Default is ``0, 1, …, N-1``.
+
+    Examples
+    --------
+    >>> program = uniaxial_path(np.linspace(1, 2, 200)) + planar_path(np.linspace(1, 2, 200))
+    >>> result = evaluate_path(model, program, params)
+    """
+    def __init__(self, F, free=(), time=None):
+        """
+        Initialize a loading path.
+
+        Parameters
+        ----------
+        F : array_like
+            Deformation gradients ``(N, 3, 3)``.
+        free : array_like, optional
+            Traction-free directions.
+        time : array_like, optional
+            Step times.
+        """
+        self.F = np.array(F, dtype=float).reshape(-1, 3, 3)
+        n = self.F.shape[0]
+        free = np.asarray(free)
+        if free.dtype != bool:
+            mask = np.zeros(3, dtype=bool)
+            mask[free.astype(int).ravel()] = True
+            free = mask
+        self.free = np.broadcast_to(free, (n, 3)).copy()
+        self.time = np.arange(n, dtype=float) if time is None else np.asarray(time, dtype=float).ravel()
+        if self.time.size != n:
+            raise ValueError("time must have one entry per step.")
+
+    def __len__(self):
+        return self.F.shape[0]
+
+    def __add__(self, other):
+        if not isinstance(other, loading_path):
+            return NotImplemented
+        return sequence(self, other)
+
+
+def evaluate_path(model, path: loading_path, params: list[float], *,
+                  stress_types=('cauchy',), tol: float = 1e-10, max_iter: int = 50) -> dict:
+    """
+    Evaluate the stress along a loading path.
+
+    Parameters
+    ----------
+    model : operations
+        Hyperelastic model (symbolic, numeric or composite).
+    path : loading_path
+        Loading program.
+    params : list of float
+        Material parameters in the order of
+        :meth:`~libela.hyperelastic.operations.operations.model_param_symbols`.
+    stress_types : sequence of {'cauchy', 'piola', '2nd-piola'}, optional
+        Stress measures. Default is ``('cauchy',)``.
+    tol : float, optional
+        Tolerance on the free normal stresses, relative to the stress
+        magnitude of the step. Default is 1e-10.
+    max_iter : int, optional
+        Maximum Newton iterations. Default is 50.
+
+    Returns
+    -------
+    dict
+        ``'time'``, ``'F'`` (solved, ``(N, 3, 3)``), ``'I1'``, ``'I2'``,
+        ``'J'``, ``'stress'`` (``{stress_type: (N, 3, 3)}``) and
+        ``'converged'`` (``(N,)`` bool).
+    """
+    for stress_type in stress_types:
+        if stress_type not in ('cauchy', 'piola', '2nd-piola'):
+            raise ValueError(f"Unknown stress type: {stress_type}")
+    compressible = bool(getattr(model, 'compressible', False))
+    F = path.F.copy()
+    n = F.shape[0]
+    converged = np.ones(n, dtype=bool)
+    stresses = {s: np.empty((n, 3, 3)) for s in stress_types}
+
+    patterns, group = np.unique(path.free, axis=0, return_inverse=True)
+    for g, pattern in enumerate(patterns):
+        steps = np.flatnonzero(group.ravel() == g)
+        free = list(np.flatnonzero(pattern))
+        face = 2 if compressible or not free else free[0]
+        unknowns = free if compressible else free[1:]
+        F_group = F[steps]
+        if unknowns:
+            converged[steps] = _newton(F_group, unknowns, face, model, params,
+                                       compressible, tol, max_iter)
+        if not compressible and free:
+            _incompressible(F_group, face)
+        F[steps] = F_group
+        tensors = model.stress_tensor(F_group, params, stress_types=stress_types, free_component=(face, face))
+        for stress_type in stress_types:
+            stresses[stress_type][steps] = tensors[stress_type]
+
+    I1, I2, J, _, _ = invariants(F)
+    return {'time': path.time, 'F': F, 'I1': I1, 'I2': I2, 'J': J,
+            'stress': stresses, 'converged': converged}
+
+
+def uniaxial_path(stretch, time=None) -> loading_path:
+    """
+    Uniaxial tension/compression along direction 1; faces 2 and 3 free.
+
+    Parameters
+    ----------
+    stretch : array_like
+        Axial stretch λ per step.
+    time : array_like, optional
+        Step times.
+
+    Returns
+    -------
+    loading_path
+        Path with F = diag(λ, λ^-1/2, λ^-1/2) as initial guess.
+    """
+    lam = np.asarray(stretch, dtype=float).ravel()
+    return loading_path(_diagonal(lam, lam**-0.5, lam**-0.5), (1, 2), time)
+
+
+def equibiaxial_path(stretch, time=None) -> loading_path:
+    """
+    Equibiaxial stretch λ₁ = λ₂ = λ; face 3 free.
+
+    Parameters
+    ----------
+    stretch : array_like
+        In-plane stretch per step.
+    time : array_like, optional
+        Step times.
+
+    Returns
+    -------
+    loading_path
+        Path with F = diag(λ, λ, λ^-2) as initial guess.
+    """
+    lam = np.asarray(stretch, dtype=float).ravel()
+    return loading_path(_diagonal(lam, lam, lam**-2), (2,), time)
+
+
+def planar_path(stretch, time=None) -> loading_path:
+    """
+    Pure shear (planar tension): λ₁ = λ, λ₂ = 1; face 3 free.
+
+    Parameters
+    ----------
+    stretch : array_like
+        Stretch λ₁ per step.
+    time : array_like, optional
+        Step times.
+
+    Returns
+    -------
+    loading_path
+        Path with F = diag(λ, 1, λ^-1) as initial guess.
+    """
+    lam = np.asarray(stretch, dtype=float).ravel()
+    return loading_path(_diagonal(lam, np.ones_like(lam), 1 / lam), (2,), time)
+
+
+def biaxial_path(stretch1, stretch2, time=None) -> loading_path:
+    """
+    General biaxial stretch; face 3 free.
+
+    Parameters
+    ----------
+    stretch1, stretch2 : array_like
+        In-plane stretches per step (broadcast together).
+    time : array_like, optional
+        Step times.
+
+    Returns
+    -------
+    loading_path
+        Path with F = diag(λ₁, λ₂, 1/(λ₁λ₂)) as initial guess.
+    """
+    lam1, lam2 = (np.ravel(s) for s in np.broadcast_arrays(np.asarray(stretch1, dtype=float),
+                                                           np.asarray(stretch2, dtype=float)))
+    return loading_path(_diagonal(lam1, lam2, 1 / (lam1 * lam2)), (2,), time)
+
+
+def simple_shear_path(shear, time=None) -> loading_path:
+    """
+    Simple shear F₁₂ = γ with no free faces.
+
+    Parameters
+    ----------
+    shear : array_like
+        Amount of shear γ per step.
+    time : array_like, optional
+        Step times.
+
+    Returns
+    -------
+    loading_path
+        Path with F = I + γ e₁ ⊗ e₂.
+    """
+    gamma = np.asarray(shear, dtype=float).ravel()
+    F = _diagonal(*(np.ones_like(gamma),) * 3)
+    F[:, 0, 1] = gamma
+    return loading_path(F, (), time)
+
+
+def sequence(*paths: loading_path) -> loading_path:
+    """
+    Concatenate loading paths into one program.
+
+    Times of later segments are shifted to continue after the previous
+    segment (by the spacing of its last two steps).
+
+    Parameters
+    ----------
+    *paths : loading_path
+        Segments, in order.
+
+    Returns
+    -------
+    loading_path
+        Combined path with per-step free faces.
+    """
+    if not paths:
+        raise ValueError("sequence needs at least one path.")
+    times, offset = [], 0.0
+    for i, p in enumerate(paths):
+        t = p.time - p.time[0] if len(p) else p.time
+        if i:
+            offset += _spacing(paths[i - 1].time)
+        times.append(t + offset)
+        if len(p):
+            offset = times[-1][-1]
+    return loading_path(np.concatenate([p.F for p in paths]), np.concatenate([p.free for p in paths]),
+                        np.concatenate(times))
+
+
+# --------------------------------------------------------------------------
+# helper functions
+# --------------------------------------------------------------------------
+
+def _diagonal(f11, f22, f33):
+    """Stack of diagonal deformation gradients."""
+    F = np.zeros((f11.size, 3, 3))
+    F[:, 0, 0], F[:, 1, 1], F[:, 2, 2] = f11, f22, f33
+    return F
+
+
+def _spacing(time):
+    """Last time step of a segment (1 for single-step segments)."""
+    return float(time[-1] - time[-2]) if time.size > 1 else 1.0
+
+
+def _incompressible(F, face):
+    """Set F[face, face] in place so that det F = 1 (det is affine in that entry)."""
+    F[:, face, face] = 0.0
+    rest = np.linalg.det(F)
+    F[:, face, face] = 1.0
+    cofactor = np.linalg.det(F) - rest
+    F[:, face, face] = (1.0 - rest) / cofactor
+
+
+def _newton(F, unknowns, face, model, params, compressible, tol, max_iter):
+    """
+    Solve the free diagonal entries of F in place so their normal stresses vanish.
+
+    Batched over steps, with a forward-difference Jacobian and steps limited
+    to keep the stretches positive.
+    """
+    idx = np.asarray(unknowns)
+
+    def residual(F_active):
+        if not compressible:
+            _incompressible(F_active, face)
+        sigma = model.stress_tensor(F_active, params, free_component=(face, face))['cauchy']
+        return sigma[:, idx, idx], 1.0 + np.abs(sigma).max(axis=(1, 2))
+
+    n, m = F.shape[0], idx.size
+    converged = np.zeros(n, dtype=bool)
+    active = np.arange(n)
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        F_active = F[active]
+        r, scale = residual(F_active)
+        done = np.abs(r).max(axis=1) <= tol * scale
+        converged[active[done]] = True
+        F[active] = F_active
+        active, F_active, r = active[~done], F_active[~done], r[~done]
+        if active.size == 0:
+            break
+        u = F_active[:, idx, idx]
+        jac = np.empty((active.size, m, m))
+        for k in range(m):
+            h = 1e-7 * np.maximum(1.0, np.abs(u[:, k]))
+            F_step = F_active.copy()
+            F_step[:, idx[k], idx[k]] += h
+            jac[:, :, k] = (residual(F_step)[0] - r) / h[:, None]
+        with np.errstate(all='ignore'):
+            du = np.linalg.solve(jac, -r[..., None])[..., 0]
+            shrink = np.where(du < 0, -0.8 * u / du, np.inf).min(axis=1)
+        alpha = np.minimum(1.0, np.where(np.isfinite(shrink), shrink, 1.0))[:, None]
+        ok = np.all(np.isfinite(du), axis=1)
+        F_active[:, idx, idx] = np.where(ok[:, None], u + alpha * du, u)
+        F[active] = F_active
+        active = active[ok]
+    return converged
@@ -0,0 +1,174 @@
+"""
+plotting.py
+===========
+
+Scalable stress–strain plots.
+
+Curves are reduced to screen resolution with Largest-Triangle-Three-Buckets
+(LTTB) downsampling before anything reaches Matplotlib, so multi-million
+point runs plot in milliseconds while keeping peaks, knees and hysteresis
+loops. Overlays of many parameter sets (the output of
+:meth:`~libela.hyperelastic.operations.operations.stress_batch`) are
+downsampled together and drawn as a single line collection.
+
+Figures can be rendered headlessly: with ``path=`` the figure is built on a
+bare :class:`matplotlib.figure.Figure` (no pyplot, no GUI backend) and
+saved to file.
+
+Public API
+----------
+lttb                 — LTTB indices for one curve or a batch sharing x
+plot_stress_strain   — downsampled plot of one curve, a batch, or biaxial data
+
+Notes
+-----
+Matplotlib is an optional dependency, imported only when plotting.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def lttb(x, y, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling indices.
+
+    Parameters
+    ----------
+    x : array_like
+        Abscissa, shape ``(N,)`` (stretch or time; need not be monotonic).
+    y : array_like
+        Ordinate, ``(N,)`` or a batch ``(N_sets, N)`` sharing `x`.
+    n_out : int
+        Number of points to keep (at least 3).
+
+    Returns
+    -------
+    np.ndarray
+        Indices into the last axis, ``(n_out,)`` or ``(N_sets, n_out)``,
+        always including the first and last point.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    single = y.ndim == 1
+    y = np.atleast_2d(y)
+    n = x.size
+    if y.shape[-1] != n:
+        raise ValueError("x and y must have the same length.")
+    if n_out >= n or n_out < 3:
+        idx = np.broadcast_to(np.arange(n), y.shape[:1] + (n,))
+        return idx[0] if single else idx
+
+    # bucket edges for the n - 2 interior points
+    edges = (np.floor(np.arange(n_out - 1) * (n - 2) / (n_out - 2)) + 1).astype(int)
+    edges[-1] = n - 1
+    # mean of each bucket, used as the third triangle vertex
+    x_mean = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / np.diff(edges)
+    y_mean = np.add.reduceat(y[:, 1:n - 1], edges[:-1] - 1, axis=1) / np.diff(edges)
+    x_mean = np.append(x_mean, x[-1])
+    y_mean = np.concatenate([y_mean, y[:, -1:]], axis=1)
+
+    rows = np.arange(y.shape[0])
+    out = np.empty((y.shape[0], n_out), dtype=np.intp)
+    out[:, 0], out[:, -1] = 0, n - 1
+    a = np.zeros(y.shape[0], dtype=np.intp)
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        xa, ya = x[a], y[rows, a]
+        xc, yc = x_mean[b + 1], y_mean[:, b + 1]
+        # twice the triangle area for every candidate in the bucket, all curves at once
+        area = np.abs((xa - xc)[:, None] * (y[:, lo:hi] - ya[:, None])
+                      - (xa[:, None] - x[lo:hi]) * (yc - ya)[:, None])
+        a = lo + np.argmax(area, axis=1)
+        out[:, b + 1] = a
+    return out[0] if single else out
+
+
+def plot_stress_strain(strain, stress, *, protocol: str = 'uniaxial', stress_type: str = 'cauchy',
+                       strain_type: str = 'stretch', labels=None, title: str | None = None,
+                       max_points: int = 2000, ax=None, path=None, show: bool | None = None, **line_kw):
+    """
+    Plot stress–strain curves downsampled to screen resolution.
+
+    Parameters
+    ----------
+    strain : array_like
+        Strain, ``(N,)``; ``(2, N)`` for 'biaxial'.
+    stress : array_like or tuple
+        Stress ``(N,)`` or a batch ``(N_sets, N)``; for 'biaxial' the pair
+        (σ₁₁, σ₂₂), each ``(N,)`` or ``(N_sets, N)``.
+    protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+        Only 'biaxial' is drawn as two components. Default is 'uniaxial'.
+    stress_type, strain_type : str, optional
+        Axis labels.
+    labels : list of str, optional
+        Legend entries, one per curve of a batch.
+    title : str, optional
+        Figure title.
+    max_points : int, optional
+        Points kept per curve (LTTB). Default is 2000.
+    ax : matplotlib.axes.Axes, optional
+        Draw into existing axes.
+    path : str or os.PathLike, optional
+        Save the figure to this file without pyplot (headless).
+    show : bool, optional
+        Call ``plt.show()``; default only when neither `ax` nor `path` is given.
+    **line_kw
+        Passed to the line collection (e.g. ``linewidth``, ``alpha``).
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        The figure drawn on.
+    """
+    from matplotlib.collections import LineCollection
+
+    interactive = ax is None and path is None
+    if ax is None:
+        if path is not None:
+            from matplotlib.figure import Figure
+            fig = Figure(figsize=(7, 5))
+        else:
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(7, 5))
+        ax = fig.add_subplot()
+    fig = ax.figure
+
+    strain = np.asarray(strain, dtype=float)
+    if protocol == 'biaxial':
+        groups = [(strain[0], stress[0], 'σ11'), (strain[1], stress[1], 'σ22')]
+    else:
+        groups = [(strain.ravel(), stress, None)]
+
+    colors = [f"C{i}" for i in range(10)]
+    for g, (x, y, component) in enumerate(groups):
+        y = np.atleast_2d(np.asarray(y, dtype=float))
+        y = np.broadcast_to(y, y.shape[:-1] + x.shape)
+        idx = lttb(x, y, max_points)
+        segments = np.stack([x[idx], np.take_along_axis(y, idx, axis=1)], axis=-1)
+        if y.shape[0] == 1 or labels is not None:
+            for i, segment in enumerate(segments):
+                label = labels[i] if labels is not None else component or 'stress'
+                if component and labels is not None:
+                    label = f"{label} ({component})"
+                ax.plot(segment[:, 0], segment[:, 1], '-', color=colors[(g + i) % 10], label=label,
+                        **line_kw)
+        else:
+            ax.add_collection(LineCollection(segments, colors=colors[g], label=component or 'stress',
+                                             **{'linewidth': 0.8, 'alpha': 0.5, **line_kw}))
+            ax.autoscale_view()
+
+    ax.set_xlabel(strain_type)
+    ax.set_ylabel(stress_type)
+    if title:
+        ax.set_title(title)
+    ax.grid(True)
+    ax.legend()
+
+    if path is not None:
+        fig.savefig(path)
+    if show if show is not None else interactive:
+        import matplotlib.pyplot as plt
+        plt.show()
+    return fig
@@ -0,0 +1,213 @@
+"""
+prewarm.py
+==========
+
+Background compilation of model kernels.
+
+The first :meth:`~libela.hyperelastic.operations.operations.stress` call for
+a model, protocol and stress measure runs the SymPy derivation and
+lambdification, which can take seconds. :func:`prewarm` starts these builds
+on a background thread pool at application start-up and returns a
+:class:`kernel_warmup` with one :class:`concurrent.futures.Future` per
+kernel, so tools can show readiness or wait for specific kernels.
+
+Kernel builds are serialized per model and kernel: a ``stress`` call whose
+kernel is still being built waits for that build (instead of repeating it),
+and calls whose kernels are ready, or not part of the pre-warm, proceed
+immediately.
+
+Public API
+----------
+prewarm          — start building kernels in the background
+kernel_warmup    — futures and readiness status of a pre-warm run
+
+Notes
+-----
+* Threads share the compiled kernels with the caller directly; SymPy holds
+  the GIL while deriving, so the foreground keeps running but slower until
+  the builds finish.
+* Running builds cannot be interrupted; :meth:`kernel_warmup.cancel` drops
+  the queued ones, and interpreter exit waits for the running ones.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, wait as _wait_futures
+
+_KINDS = ('stress', 'batch', 'tangent', 'jacobian', 'energy')
+
+
+class kernel_warmup:
+    """
+    Futures and readiness status of a :func:`prewarm` run.
+
+    Attributes
+    ----------
+    futures : dict
+        ``(model, protocol, stress_type, kind)`` → :class:`concurrent.futures.Future`
+        resolving to the compiled kernel.
+    """
+    def __init__(self, executor, futures: dict):
+        """
+        Initialize a warm-up handle (created by :func:`prewarm`).
+
+        Parameters
+        ----------
+        executor : concurrent.futures.Executor
+            Executor running the builds.
+        futures : dict
+            Build futures, keyed as :attr:`futures`.
+        """
+        self._executor = executor
+        self.futures = futures
+
+    def ready(self, model=None, protocol: str | None = None, stress_type: str | None = None,
+              kind: str | None = None) -> bool:
+        """
+        Return whether the selected kernels are built.
+
+        Parameters
+        ----------
+        model : operations, optional
+            Restrict to one model.
+        protocol, stress_type, kind : str, optional
+            Restrict to one protocol, stress measure or kernel kind.
+
+        Returns
+        -------
+        bool
+            True if every selected build finished successfully.
+        """
+        return all(f.done() and not f.cancelled() and f.exception() is None
+                   for f in self._select(model, protocol, stress_type, kind))
+
+    def status(self) -> dict:
+        """
+        Return the state of every build.
+
+        Returns
+        -------
+        dict
+            ``(model name, protocol, stress_type, kind)`` → one of 'pending',
+            'running', 'ready', 'failed' or 'cancelled'.
+        """
+        return {(m.__class__.__name__, p, s, k): _state(f) for (m, p, s, k), f in self.futures.items()}
+
+    def wait(self, timeout: float | None = None, *, model=None, protocol: str | None = None,
+             stress_type: str | None = None, kind: str | None = None) -> bool:
+        """
+        Block until the selected builds finish.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum wait in seconds; None waits indefinitely.
+        model, protocol, stress_type, kind : optional
+            Selection, as in :meth:`ready`.
+
+        Returns
+        -------
+        bool
+            True if all selected builds finished in time.
+
+        Raises
+        ------
+        Exception
+            The first error raised by a failed build.
+        """
+        futures = self._select(model, protocol, stress_type, kind)
+        done, pending = _wait_futures(futures, timeout=timeout)
+        for f in futures:
+            if f in done and not f.cancelled() and f.exception() is not None:
+                raise f.exception()
+        return not pending
+
+    def cancel(self) -> None:
+        """Drop the builds that have not started; running builds complete."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _select(self, model, protocol, stress_type, kind):
+        """Futures matching the given filters."""
+        return [f for (m, p, s, k), f in self.futures.items()
+                if (model is None or m is model) and (protocol is None or p == protocol)
+                and (stress_type is None or s == stress_type) and (kind is None or k == kind)]
+
+
+def prewarm(combinations, *, kinds=('stress',), max_workers: int = 1) -> kernel_warmup:
+    """
+    Build model kernels in background threads.
+
+    Parameters
+    ----------
+    combinations : iterable of tuple
+        ``(model, protocol, stress_type)`` triples (``(model, protocol)``
+        uses 'cauchy'), built in the given order.
+    kinds : iterable of str, optional
+        Kernels to build per combination:
+
+        * 'stress'   — the kernel used by :meth:`stress` (the Cauchy kernel
+          when Piola measures are converted numerically);
+        * 'batch'    — the kernels used by :meth:`stress_batch`;
+        * 'tangent', 'jacobian', 'energy' — the matching kernel methods.
+
+        Default is ('stress',).
+    max_workers : int, optional
+        Number of build threads. Default is 1.
+
+    Returns
+    -------
+    kernel_warmup
+        Futures and readiness status.
+
+    Examples
+    --------
+    >>> warm = prewarm([(yeoh(), 'uniaxial', 'cauchy'), (model, 'biaxial', 'piola')])
+    >>> warm.ready()                     # poll from a UI loop
+    >>> sigma = model.stress(strain, params, protocol='biaxial', stress_type='piola')  # waits only if needed
+    """
+    kinds = tuple(kinds)
+    unknown = set(kinds) - set(_KINDS)
+    if unknown:
+        raise ValueError(f"Unknown kernel kinds {sorted(unknown)}. Use {list(_KINDS)}.")
+    jobs = []
+    for combination in combinations:
+        model, protocol, stress_type = (tuple(combination) + ('cauchy',))[:3]
+        if protocol not in ('uniaxial', 'simple_shear', 'biaxial'):
+            raise ValueError(f"Unknown protocol: {protocol}")
+        jobs.extend(((model, protocol, stress_type, kind) for kind in kinds))
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='libela-prewarm')
+    futures = {job: executor.submit(_build, *job) for job in jobs}
+    executor.shutdown(wait=False)
+    return kernel_warmup(executor, futures)
+
+
+# --------------------------------------------------------------------------
+# helper functions
+# --------------------------------------------------------------------------
+
+def _build(model, protocol, stress_type, kind):
+    """Build (or fetch) one kernel; runs on a worker thread."""
+    kernel_type = model._kernel_stress_type(protocol, stress_type)
+    if kind == 'stress':
+        return model.stress_kernel(protocol, kernel_type)
+    if kind == 'batch':
+        if model.linear_in_params(protocol, kernel_type):
+            return model.jacobian_kernel(protocol, kernel_type)
+        return model.stress_kernel(protocol, kernel_type)
+    if kind == 'tangent':
+        return model.tangent_kernel(protocol, stress_type)
+    if kind == 'jacobian':
+        return model.jacobian_kernel(protocol, stress_type)
+    return model.energy_kernel(protocol)
+
+
+def _state(future):
+    """Readable state of a build future."""
+    if future.cancelled():
+        return 'cancelled'
+    if future.running():
+        return 'running'
+    if not future.done():
+        return 'pending'
+    return 'failed' if future.exception() is not None else 'ready'
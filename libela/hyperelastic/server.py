@@ -0,0 +1,445 @@
+"""
+server.py
+=========
+
+Optional local evaluation server that keeps compiled kernels warm.
+
+Separate processes (solvers, optimizers, GUIs) that query material
+responses at high rates can share one long-lived server instead of each
+deriving and compiling the same kernels. The server speaks newline-delimited
+JSON over a Unix socket or TCP on localhost, using only :mod:`asyncio`.
+
+Concurrent requests for the same model, protocol and stress type are
+coalesced: requests arriving within a short window are concatenated into a
+single vectorized kernel call (parameters are repeated per point, which the
+compiled kernels broadcast), and the result is split back per request.
+
+Public API
+----------
+evaluation_server   — the asyncio server and its counters
+serve               — run a server until interrupted (also ``python -m``)
+query               — minimal blocking client for one request
+
+Protocol
+--------
+Each request is one JSON object per line::
+
+    {"id": 1, "op": "stress", "model": "yeoh", "compressible": false,
+     "protocol": "uniaxial", "stress_type": "cauchy",
+     "strain": [1.0, 1.1, 1.2], "params": [0.5, 0.01, 0.001]}
+
+and is answered by ``{"id": 1, "stress": [...]}`` (a pair of lists for
+'biaxial') or ``{"id": 1, "error": "..."}``. ``{"op": "stats"}`` returns
+the per-model latency and throughput counters. A request line longer than
+the server's `limit` is answered with an error and the connection is closed.
+
+Usage
+-----
+::
+
+    python -m libela.hyperelastic.server --unix /tmp/libela.sock
+    python -m libela.hyperelastic.server --port 8765
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import socket
+import time
+
+import numpy as np
+
+from . import hyperelastic
+from .operations import operations, strain_converter
+
+
+class evaluation_server:
+    """
+    Asyncio evaluation server with request coalescing.
+
+    Parameters
+    ----------
+    models : dict, optional
+        Extra models to serve, ``{name: model_instance}`` (e.g. a
+        :class:`~libela.hyperelastic.numeric.numeric_model`). Model classes in
+        :mod:`libela.hyperelastic.hyperelastic` are served by name.
+    window : float, optional
+        Coalescing window in seconds. Default is 1 ms.
+    max_batch : int, optional
+        Maximum number of points per coalesced kernel call. Default is 65536.
+    limit : int, optional
+        Maximum length of a request line in bytes. Default is 16 MiB, about
+        a million strain points.
+
+    Examples
+    --------
+    >>> server = evaluation_server()
+    >>> asyncio.run(server.serve(path="/tmp/libela.sock"))
+    """
+    def __init__(self, models: dict | None = None, *, window: float = 1e-3, max_batch: int = 65536,
+                 limit: int = 2**24):
+        """
+        Initialize the server.
+
+        Parameters
+        ----------
+        models : dict, optional
+            Extra named model instances.
+        window : float, optional
+            Coalescing window in seconds.
+        max_batch : int, optional
+            Maximum points per kernel call.
+        limit : int, optional
+            Maximum request-line length in bytes.
+        """
+        if limit < 1:
+            raise ValueError("limit must be positive.")
+        self.models = dict(models or {})
+        self.window = float(window)
+        self.max_batch = int(max_batch)
+        self.limit = int(limit)
+        self._queues = {}
+        self._counters = {}
+        self._started = time.perf_counter()
+
+    def model(self, name: str, compressible: bool = False):
+        """
+        Return the (cached) model instance for a name.
+
+        Parameters
+        ----------
+        name : str
+            Registered name or model class name, e.g. 'yeoh'.
+        compressible : bool, optional
+            Compressible variant of a model class.
+
+        Returns
+        -------
+        operations
+            Model instance whose kernels stay compiled for the server's lifetime.
+        """
+        key = name if name in self.models else f"{name}-compressible" if compressible else name
+        if key not in self.models:
+            cls = getattr(hyperelastic, name, None)
+            if not (isinstance(cls, type) and issubclass(cls, operations)
+                    and cls.__module__ == hyperelastic.__name__):
+                raise ValueError(f"Unknown model: {name}")
+            always = getattr(cls, 'compressible', False) is True      # e.g. volumetric
+            self.models[key] = cls(compressible=True) if compressible and not always else cls()
+        return self.models[key]
+
+    async def evaluate(self, request: dict):
+        """
+        Evaluate one stress request, coalescing it with concurrent ones.
+
+        Parameters
+        ----------
+        request : dict
+            Decoded request (see the module docstring).
+
+        Returns
+        -------
+        np.ndarray or tuple of np.ndarray
+            Stress for the request's strain points.
+        """
+        name = request['model']
+        compressible = bool(request.get('compressible', False))
+        protocol = request.get('protocol', 'uniaxial')
+        stress_type = request.get('stress_type', 'cauchy')
+        if protocol not in ('uniaxial', 'simple_shear', 'biaxial'):
+            raise ValueError(f"Unknown protocol: {protocol}")
+        if stress_type not in ('cauchy', 'piola', '2nd-piola'):
+            raise ValueError(f"Unknown stress type: {stress_type}")
+        model = self.model(name, compressible)
+        n_params = len(model.model_param_symbols())
+        params = np.asarray(request['params'], dtype=float)
+        if params.shape != (n_params,):
+            raise ValueError(f"Expected {n_params} parameters for {name}.")
+        strain = strain_converter(request['strain'], request.get('strain_type', 'stretch'))
+        strain = np.atleast_1d(np.asarray(strain, dtype=float))
+        if protocol == 'biaxial' and (strain.ndim != 2 or strain.shape[0] != 2):
+            raise ValueError("Biaxial strain must have shape (2, N).")
+
+        key = (name, compressible, protocol, stress_type)
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = asyncio.Queue()
+            asyncio.get_running_loop().create_task(self._batcher(key, model, queue))
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((strain.reshape(strain.shape[0], -1) if protocol == 'biaxial' else strain.ravel(),
+                         params, strain.shape, future, time.perf_counter()))
+        return await future
+
+    def stats(self) -> dict:
+        """
+        Return per-model latency and throughput counters.
+
+        Returns
+        -------
+        dict
+            ``{"model/protocol/stress_type": {...}}`` with request, point and
+            batch counts, mean and max latency (s), points per batch and
+            points per second since the server started.
+        """
+        elapsed = time.perf_counter() - self._started
+        out = {}
+        for (name, compressible, protocol, stress_type), c in self._counters.items():
+            label = f"{name}-compressible" if compressible else name
+            out[f"{label}/{protocol}/{stress_type}"] = {
+                'requests': c['requests'],
+                'points': c['points'],
+                'batches': c['batches'],
+                'mean_latency': c['latency'] / max(c['requests'], 1),
+                'max_latency': c['max_latency'],
+                'points_per_batch': c['points'] / max(c['batches'], 1),
+                'throughput': c['points'] / elapsed if elapsed > 0 else 0.0,
+            }
+        return out
+
+    async def serve(self, *, path: str | None = None, host: str = '127.0.0.1', port: int = 0,
+                    ready=None):
+        """
+        Serve until cancelled.
+
+        Parameters
+        ----------
+        path : str, optional
+            Unix-socket path. If omitted, TCP on `host`:`port` is used.
+        host : str, optional
+            TCP host; only local addresses should be used. Default '127.0.0.1'.
+        port : int, optional
+            TCP port; 0 picks a free port. Default 0.
+        ready : callable, optional
+            Called with the bound address once the server is listening.
+        """
+        if path is not None:
+            server = await asyncio.start_unix_server(self._handle, path=path, limit=self.limit)
+            address = path
+        else:
+            server = await asyncio.start_server(self._handle, host=host, port=port, limit=self.limit)
+            address = server.sockets[0].getsockname()[:2]
+        if ready is not None:
+            ready(address)
+        async with server:
+            await server.serve_forever()
+
+    async def _handle(self, reader, writer):
+        """Answer the requests of one connection, concurrently."""
+        lock = asyncio.Lock()
+        tasks = set()
+
+        async def answer(line):
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as exc:
+                request, reply = {}, {'error': f"Invalid JSON: {exc}"}
+            else:
+                reply = await self._reply(request)
+            if 'id' in request:
+                reply['id'] = request['id']
+            async with lock:
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:      # line longer than the limit; the stream is out of sync
+                    if tasks:
+                        await asyncio.gather(*tasks)
+                    async with lock:
+                        writer.write(json.dumps({'error': f"Request line exceeds the limit of "
+                                                          f"{self.limit} bytes."}).encode() + b"\n")
+                        await writer.drain()
+                    break
+                if not line:
+                    break
+                task = asyncio.ensure_future(answer(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    async def _reply(self, request):
+        """Dispatch one decoded request."""
+        op = request.get('op', 'stress')
+        try:
+            if op == 'stats':
+                return {'stats': self.stats()}
+            if op == 'models':
+                return {'models': sorted(self.models)}
+            if op != 'stress':
+                raise ValueError(f"Unknown op: {op}")
+            result = await self.evaluate(request)
+        except Exception as exc:  # reported to the client, the server keeps running
+            return {'error': f"{type(exc).__name__}: {exc}"}
+        if isinstance(result, tuple):
+            return {'stress': [r.tolist() for r in result]}
+        return {'stress': result.tolist()}
+
+    async def _batcher(self, key, model, queue):
+        """Collect queued requests for one kernel and evaluate them together."""
+        loop = asyncio.get_running_loop()
+        protocol, stress_type = key[2], key[3]
+        # compile off the event loop so other kernels keep being served
+        try:
+            kernel = await loop.run_in_executor(None, model.stress_kernel, protocol, stress_type)
+        except Exception as exc:
+            # fail the waiting requests; the next request starts a fresh batcher
+            if self._queues.get(key) is queue:
+                del self._queues[key]
+            while not queue.empty():
+                future = queue.get_nowait()[3]
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        counters = self._counters.setdefault(key, {'requests': 0, 'points': 0, 'batches': 0,
+                                                   'latency': 0.0, 'max_latency': 0.0})
+        while True:
+            batch = [await queue.get()]
+            n_points = batch[0][0].shape[-1]
+            deadline = loop.time() + self.window
+            while n_points < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+                n_points += item[0].shape[-1]
+
+            sizes = [item[0].shape[-1] for item in batch]
+            strain = np.concatenate([item[0] for item in batch], axis=-1)
+            params = np.repeat(np.stack([item[1] for item in batch]), sizes, axis=0).T
+            try:
+                result = await loop.run_in_executor(None, _evaluate, kernel, protocol, strain, params)
+            except Exception as exc:
+                for item in batch:
+                    if not item[3].done():
+                        item[3].set_exception(exc)
+                continue
+
+            splits = np.cumsum(sizes)[:-1]
+            now = time.perf_counter()
+            for i, (_, _, shape, future, t0) in enumerate(batch):
+                if isinstance(result, tuple):
+                    value = tuple(np.split(r, splits)[i].reshape(shape[1:]) for r in result)
+                else:
+                    value = np.split(result, splits)[i].reshape(shape)
+                if not future.done():
+                    future.set_result(value)
+                counters['latency'] += now - t0
+                counters['max_latency'] = max(counters['max_latency'], now - t0)
+            counters['requests'] += len(batch)
+            counters['points'] += n_points
+            counters['batches'] += 1
+
+
+# --------------------------------------------------------------------------
+# helper functions
+# --------------------------------------------------------------------------
+
+def _evaluate(kernel, protocol, strain, params):
+    """One vectorized kernel call over concatenated points."""
+    if protocol == 'biaxial':
+        return tuple(np.broadcast_to(f(strain[0], strain[1], *params), strain[0].shape).copy()
+                     for f in kernel)
+    return np.broadcast_to(kernel(strain, *params), strain.shape).copy()
+
+
+def serve(*, path: str | None = None, host: str = '127.0.0.1', port: int = 0,
+          models: dict | None = None, window: float = 1e-3, max_batch: int = 65536,
+          limit: int = 2**24):
+    """
+    Run an :class:`evaluation_server` until interrupted.
+
+    Parameters
+    ----------
+    path : str, optional
+        Unix-socket path; TCP on `host`:`port` if omitted.
+    host, port
+        TCP address. Default ``127.0.0.1`` and a free port.
+    models, window, max_batch, limit
+        As in :class:`evaluation_server`.
+    """
+    server = evaluation_server(models, window=window, max_batch=max_batch, limit=limit)
+    try:
+        asyncio.run(server.serve(path=path, host=host, port=port,
+                                 ready=lambda address: print(f"libela server listening on {address}",
+                                                             flush=True)))
+    except KeyboardInterrupt:
+        pass
+
+
+def query(request: dict, *, path: str | None = None, host: str = '127.0.0.1', port: int | None = None,
+          timeout: float = 30.0) -> dict:
+    """
+    Send one request to a running server and return the decoded reply.
+
+    Parameters
+    ----------
+    request : dict
+        Request object (see the module docstring).
+    path : str, optional
+        Unix-socket path of the server.
+    host, port
+        TCP address of the server, used when `path` is omitted.
+    timeout : float, optional
+        Socket timeout in seconds. Default is 30.
+
+    Returns
+    -------
+    dict
+        Reply object.
+    """
+    if path is not None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        address = path
+    else:
+        if port is None:
+            raise ValueError("Give either a Unix-socket path or a TCP port.")
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        address = (host, port)
+    with sock:
+        sock.settimeout(timeout)
+        sock.connect(address)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    return json.loads(data)
+
+
+def main(argv=None):
+    """
+    Command-line entry point: ``python -m libela.hyperelastic.server``.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        Arguments; default is ``sys.argv[1:]``.
+    """
+    parser = argparse.ArgumentParser(description="Serve libela stress kernels locally.")
+    parser.add_argument("--unix", help="Unix-socket path")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--window", type=float, default=1e-3, help="coalescing window (s)")
+    parser.add_argument("--max-batch", type=int, default=65536)
+    parser.add_argument("--limit", type=int, default=2**24, help="maximum request-line length (bytes)")
+    args = parser.parse_args(argv)
+    serve(path=args.unix, host=args.host, port=args.port, window=args.window, max_batch=args.max_batch,
+          limit=args.limit)
+
+
+if __name__ == "__main__":
+    main()
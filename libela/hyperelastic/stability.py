@@ -0,0 +1,179 @@
+"""
+stability.py
+============
+
+Vectorized material-stability (Drucker) scanner.
+
+A hyperelastic fit is Drucker-stable along a loading path when the
+incremental work is positive, i.e. when the tangent of the nominal (first
+Piola–Kirchhoff) stress with respect to stretch is positive definite. The
+scanner checks this on dense grids using the compiled tangent kernels
+(second derivatives of the energy, see
+:meth:`~libela.hyperelastic.operations.operations.tangent_kernel`):
+
+* uniaxial — :math:`\\mathrm dP_{11}/\\mathrm d\\lambda > 0`;
+* biaxial — the symmetric part of :math:`\\partial(P_{11}, P_{22})/\\partial(\\lambda_1, \\lambda_2)`
+  is positive definite on the (λ₁, λ₂) grid, which covers equibiaxial and
+  planar tension;
+* simple shear — :math:`\\mathrm d\\sigma_{12}/\\mathrm d\\gamma > 0`.
+
+All parameter sets and grid points are evaluated in one broadcast call per
+kernel, so a scan of many candidate sets is cheap enough to be used as a
+constraint inside a fitting loop (see :func:`stability_margin`).
+
+Public API
+----------
+stability_scan      — per-protocol tangents, unstable masks and regions
+stability_margin    — smallest tangent eigenvalue per parameter set
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def stability_scan(model,
+                   params,
+                   *,
+                   protocols: list[str] | tuple[str, ...] = ('uniaxial', 'biaxial', 'simple_shear'),
+                   stretch: tuple[float, float] = (0.2, 5.0),
+                   biaxial_stretch: tuple[float, float] = (0.3, 3.0),
+                   shear: tuple[float, float] = (0.0, 5.0),
+                   n_points: int = 400,
+                   n_biaxial: int = 64) -> dict:
+    """
+    Check the Drucker condition on dense protocol grids.
+
+    Parameters
+    ----------
+    model : operations
+        Hyperelastic model, e.g. ``yeoh()``.
+    params : array_like
+        One parameter set ``(N_params,)`` or many ``(N_sets, N_params)``,
+        ordered as :meth:`~libela.hyperelastic.operations.operations.model_param_symbols`.
+    protocols : sequence of {'uniaxial', 'biaxial', 'simple_shear'}, optional
+        Protocols to scan. Default is all three.
+    stretch : tuple of float, optional
+        Uniaxial stretch range. Default is (0.2, 5.0).
+    biaxial_stretch : tuple of float, optional
+        Range of λ₁ and λ₂ for the biaxial grid. Default is (0.3, 3.0).
+    shear : tuple of float, optional
+        Range of the amount of shear. Default is (0.0, 5.0).
+    n_points : int, optional
+        Points of the uniaxial and shear grids. Default is 400.
+    n_biaxial : int, optional
+        Points per axis of the biaxial grid. Default is 64.
+
+    Returns
+    -------
+    dict
+        ``'stable'`` (bool, per set), ``'margin'`` (smallest tangent
+        eigenvalue, per set) and one entry per protocol with the grid
+        (``'strain'``), the tangent or smallest eigenvalue (``'tangent'``),
+        the boolean ``'unstable'`` mask of shape ``(N_sets,) + grid`` and,
+        for the 1-D protocols, ``'regions'``: per set, a list of
+        ``(start, end)`` unstable intervals.
+
+    Examples
+    --------
+    >>> report = stability_scan(yeoh(), [0.5, -0.02, 0.0005])
+    >>> report['stable']
+    array([False])
+    >>> [(round(a, 2), round(b, 2)) for a, b in report['uniaxial']['regions'][0]]
+    [(2.92, 3.41)]
+    """
+    params = np.atleast_2d(np.asarray(params, dtype=float))
+    if params.ndim != 2:
+        raise ValueError("params must have shape (N_params,) or (N_sets, N_params).")
+    n_sets = params.shape[0]
+    result = {}
+    margin = np.full(n_sets, np.inf)
+
+    for protocol in protocols:
+        if protocol == 'uniaxial':
+            grid = np.linspace(*stretch, n_points)
+            tangent = _tangent_1d(model, 'uniaxial', 'piola', grid, params)
+        elif protocol == 'simple_shear':
+            grid = np.linspace(*shear, n_points)
+            tangent = _tangent_1d(model, 'simple_shear', 'cauchy', grid, params)
+        elif protocol == 'biaxial':
+            axis = np.linspace(*biaxial_stretch, n_biaxial)
+            grid = (axis, axis)
+            tangent = _min_eigenvalue_2d(model, axis, params)
+        else:
+            raise ValueError(f"Unknown protocol: {protocol}")
+
+        unstable = ~(tangent > 0)  # NaN (outside the energy's domain) counts as unstable
+        entry = {'strain': grid, 'tangent': tangent, 'unstable': unstable}
+        if protocol != 'biaxial':
+            entry['regions'] = [_regions(grid, mask) for mask in unstable]
+        result[protocol] = entry
+        margin = np.minimum(margin, np.nanmin(np.where(np.isnan(tangent), -np.inf, tangent),
+                                              axis=tuple(range(1, tangent.ndim))))
+
+    result['margin'] = margin
+    result['stable'] = margin > 0
+    return result
+
+
+def stability_margin(model, params, **kwargs) -> np.ndarray:
+    """
+    Return the smallest Drucker tangent eigenvalue per parameter set.
+
+    Positive values are stable; use as an inequality constraint, e.g.
+    ``NonlinearConstraint(lambda p: stability_margin(model, p), 0, np.inf)``.
+
+    Parameters
+    ----------
+    model : operations
+        Hyperelastic model.
+    params : array_like
+        One parameter set or ``(N_sets, N_params)``.
+    **kwargs
+        Grid options of :func:`stability_scan`.
+
+    Returns
+    -------
+    np.ndarray or float
+        Margin per set (a float for a single 1-D parameter set).
+    """
+    margin = stability_scan(model, params, **kwargs)['margin']
+    return float(margin[0]) if np.ndim(params) == 1 else margin
+
+
+# --------------------------------------------------------------------------
+# helper functions
+# --------------------------------------------------------------------------
+
+def _columns(params, ndim):
+    """Parameter columns shaped to broadcast over a grid of `ndim` axes."""
+    return [params[:, j].reshape((-1,) + (1,) * ndim) for j in range(params.shape[1])]
+
+
+def _tangent_1d(model, protocol, stress_type, grid, params):
+    """Tangent of one 1-D protocol, shape ``(N_sets, N_points)``."""
+    tangent_fn = model.tangent_kernel(protocol, stress_type)
+    shape = (params.shape[0], grid.size)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.broadcast_to(tangent_fn(grid, *_columns(params, 1)), shape).astype(float)
+
+
+def _min_eigenvalue_2d(model, axis, params):
+    """Smallest eigenvalue of the symmetric biaxial Piola tangent, shape ``(N_sets, n, n)``."""
+    lam1, lam2 = np.meshgrid(axis, axis, indexing='ij')
+    shape = (params.shape[0],) + lam1.shape
+    columns = _columns(params, 2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        a, b, c, d = (np.broadcast_to(f(lam1, lam2, *columns), shape).astype(float)
+                      for f in model.tangent_kernel('biaxial', 'piola'))
+        off = 0.5 * (b + c)
+        return 0.5 * (a + d) - np.sqrt(0.25 * (a - d)**2 + off**2)
+
+
+def _regions(grid, mask):
+    """Contiguous ``(start, end)`` grid intervals where `mask` is True."""
+    if not mask.any():
+        return []
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1
+    return [(float(grid[s]), float(grid[e])) for s, e in zip(starts, ends)]
@@ -0,0 +1,320 @@
+"""
+surrogate.py
+============
+
+Tabulated spline surrogates for expensive stress kernels.
+
+A surrogate tabulates one model's stress response, for one parameter set,
+over a stretch interval (uniaxial, simple shear) or a (λ₁, λ₂) rectangle
+(biaxial). Values *and* exact derivatives from the compiled tangent kernels
+are stored at the knots and interpolated with cubic Hermite polynomials
+(bicubic Hermite patches in 2-D), so the interpolant is C¹ and converges
+with the fourth power of the knot spacing.
+
+Knots are placed adaptively: intervals whose midpoint and quarter-point
+errors exceed the tolerance are bisected until the whole domain meets it.
+The measured maximum error and the speedup over the exact kernel are
+reported on an independent validation set.
+
+Public API
+----------
+build_surrogate     — tabulate a model to a given tolerance
+spline_surrogate    — the resulting vectorized interpolant
+"""
+
+from __future__ import annotations
+
+import time
+import warnings
+
+import numpy as np
+import sympy as sp
+
+from .operations import strain_converter, stretch_symbols
+
+
+class spline_surrogate:
+    """
+    Cubic Hermite surrogate of a stress kernel.
+
+    Built by :func:`build_surrogate`; call it like the exact kernel.
+
+    Attributes
+    ----------
+    protocol : str
+        Deformation protocol.
+    knots : tuple of np.ndarray
+        Knot vectors, one per stretch axis.
+    tol : float
+        Absolute tolerance the knots were refined to.
+    max_error : float
+        Maximum absolute error measured on the validation set.
+    speedup : float
+        Exact-kernel time divided by surrogate time on the validation set.
+    """
+    def __init__(self, protocol, knots, tables):
+        """
+        Initialize from knot vectors and Hermite tables.
+
+        Parameters
+        ----------
+        protocol : str
+            Deformation protocol.
+        knots : tuple of np.ndarray
+            Knot vectors.
+        tables : list of tuple of np.ndarray
+            Per stress component: ``(f, f')`` in 1-D or ``(f, f_x, f_y, f_xy)`` in 2-D.
+        """
+        self.protocol = protocol
+        self.knots = knots
+        self.tables = tables
+        self.tol = np.nan
+        self.max_error = np.nan
+        self.speedup = np.nan
+
+    @property
+    def domain(self):
+        """Tabulated domain, ``[(lo, hi), …]`` per stretch axis."""
+        return [(float(k[0]), float(k[-1])) for k in self.knots]
+
+    def __call__(self, strain: np.ndarray | float, *, strain_type: str | None = None):
+        """
+        Evaluate the surrogate stress.
+
+        Parameters
+        ----------
+        strain : array_like or float
+            Stretches inside the tabulated domain; for 'biaxial' the first
+            axis holds λ₁ and λ₂.
+        strain_type : {'stretch', 'engineering'}, optional
+            Input strain type. Default is 'stretch'.
+
+        Returns
+        -------
+        np.ndarray or tuple of np.ndarray
+            Stress, as returned by :meth:`~libela.hyperelastic.operations.operations.stress`.
+        """
+        strain = strain_converter(strain, strain_type or 'stretch')
+        if self.protocol == 'biaxial':
+            cell = _locate(self.knots[0], strain[0]), _locate(self.knots[1], strain[1])
+            return tuple(_hermite_2d(self.knots, table, strain[0], strain[1], cell)
+                         for table in self.tables)
+        return _hermite_1d(self.knots[0], self.tables[0], strain, _locate(self.knots[0], strain))
+
+    def report(self) -> dict:
+        """
+        Summarize the surrogate.
+
+        Returns
+        -------
+        dict
+            ``protocol``, ``domain``, ``n_knots``, ``tol``, ``max_error`` and ``speedup``.
+        """
+        return {"protocol": self.protocol, "domain": self.domain,
+                "n_knots": tuple(k.size for k in self.knots),
+                "tol": self.tol, "max_error": self.max_error, "speedup": self.speedup}
+
+
+def build_surrogate(model,
+                    params: list[float],
+                    domain,
+                    *,
+                    protocol: str = 'uniaxial',
+                    stress_type: str = 'cauchy',
+                    tol: float = 1e-6,
+                    relative: bool = True,
+                    initial_knots: int = 9,
+                    max_knots: int = 4096,
+                    n_validation: int = 100_000) -> spline_surrogate:
+    """
+    Tabulate a model's stress response with adaptive knot placement.
+
+    Parameters
+    ----------
+    model : operations
+        Model instance.
+    params : list of float
+        Model parameters.
+    domain : tuple or list of tuple
+        ``(lo, hi)`` stretch interval, or ``[(lo1, hi1), (lo2, hi2)]`` for biaxial.
+    protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+        Deformation protocol. Default is 'uniaxial'.
+    stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+        Stress measure. Default is 'cauchy'.
+    tol : float, optional
+        Error tolerance.
+    relative : bool, optional
+        If True, `tol` is relative to the largest stress magnitude on the
+        initial knots; otherwise it is absolute.
+    initial_knots : int, optional
+        Uniform knots per axis before refinement.
+    max_knots : int, optional
+        Refinement stops (with a warning) when an axis reaches this many knots.
+    n_validation : int, optional
+        Number of random validation points for the error and speed report.
+
+    Returns
+    -------
+    spline_surrogate
+        Surrogate with `max_error` and `speedup` filled in.
+
+    Examples
+    --------
+    >>> s = build_surrogate(polynomial(), params, (0.5, 3.0), tol=1e-8)
+    >>> s.report()
+    """
+    params = list(params)
+    if protocol == 'biaxial':
+        kernels = _biaxial_kernels(model, stress_type)
+        surrogate = _build_2d(kernels, params, domain, tol, relative, initial_knots, max_knots)
+        exact = lambda l1, l2: tuple(f(l1, l2, *params) for f in kernels[0])
+    else:
+        stress_fn = model.stress_kernel(protocol, stress_type)
+        tangent_fn = model.tangent_kernel(protocol, stress_type)
+        surrogate = _build_1d(stress_fn, tangent_fn, params, domain, protocol,
+                              tol, relative, initial_knots, max_knots)
+        exact = lambda lam: stress_fn(lam, *params)
+
+    # validation: error and speed on independent random points
+    rng = np.random.default_rng(0)
+    lows, highs = zip(*surrogate.domain)
+    points = rng.uniform(lows, highs, size=(n_validation, len(lows))).T
+    if protocol == 'biaxial':
+        t0 = time.perf_counter(); reference = exact(points[0], points[1]); t1 = time.perf_counter()
+        approx = surrogate(points); t2 = time.perf_counter()
+        surrogate.max_error = max(float(np.max(np.abs(a - r))) for a, r in zip(approx, reference))
+    else:
+        t0 = time.perf_counter(); reference = exact(points[0]); t1 = time.perf_counter()
+        approx = surrogate(points[0]); t2 = time.perf_counter()
+        surrogate.max_error = float(np.max(np.abs(approx - reference)))
+    surrogate.speedup = (t1 - t0) / max(t2 - t1, 1e-12)
+    return surrogate
+
+
+# --------------------------------------------------------------------------
+# helper functions
+# --------------------------------------------------------------------------
+
+def _build_1d(stress_fn, tangent_fn, params, domain, protocol, tol, relative, n0, max_knots):
+    """Adaptive 1-D Hermite tabulation."""
+    lo, hi = domain
+    x = np.linspace(lo, hi, n0)
+    f = lambda lam: np.broadcast_to(stress_fn(lam, *params), lam.shape)
+    df = lambda lam: np.broadcast_to(tangent_fn(lam, *params), lam.shape)
+    fx, dx = f(x), df(x)
+    if relative:
+        tol = tol * max(float(np.max(np.abs(fx))), np.finfo(float).tiny)
+
+    while True:
+        probes = x[:-1, None] + np.array([0.25, 0.5, 0.75]) * np.diff(x)[:, None]
+        err = np.abs(_hermite_1d(x, (fx, dx), probes, _locate(x, probes)) - f(probes)).max(axis=1)
+        bad = err > tol
+        if not bad.any():
+            break
+        if x.size + bad.sum() > max_knots:
+            warnings.warn(f"Surrogate reached max_knots={max_knots} before tol was met.")
+            break
+        new = 0.5 * (x[:-1] + x[1:])[bad]
+        x = np.concatenate([x, new])
+        order = np.argsort(x)
+        x = x[order]
+        fx = np.concatenate([fx, f(new)])[order]
+        dx = np.concatenate([dx, df(new)])[order]
+    surrogate = spline_surrogate(protocol, (x,), [(fx, dx)])
+    surrogate.tol = tol
+    return surrogate
+
+
+def _biaxial_kernels(model, stress_type):
+    """Stress, tangent and cross-derivative kernels for both biaxial components."""
+    stress = model.stress_kernel('biaxial', stress_type)
+    tangent = model.tangent_kernel('biaxial', stress_type)
+    lam1, lam2 = stretch_symbols('biaxial')
+    args = [lam1, lam2] + model.model_param_symbols()
+    d11_1, _, d22_1, _ = model.tangent_expression('biaxial', stress_type)
+    cross = (sp.lambdify(args, sp.diff(d11_1, lam2), 'numpy'),
+             sp.lambdify(args, sp.diff(d22_1, lam2), 'numpy'))
+    return stress, tangent, cross
+
+
+def _build_2d(kernels, params, domain, tol, relative, n0, max_knots):
+    """Adaptive tensor-product bicubic Hermite tabulation."""
+    stress, tangent, cross = kernels
+    (lo1, hi1), (lo2, hi2) = domain
+    x, y = np.linspace(lo1, hi1, n0), np.linspace(lo2, hi2, n0)
+
+    def tabulate(x, y):
+        X, Y = np.meshgrid(x, y, indexing='ij')
+        shaped = lambda v: np.broadcast_to(v, X.shape)
+        return [(shaped(stress[c](X, Y, *params)),
+                 shaped(tangent[2 * c](X, Y, *params)),
+                 shaped(tangent[2 * c + 1](X, Y, *params)),
+                 shaped(cross[c](X, Y, *params))) for c in range(2)]
+
+    tables = tabulate(x, y)
+    if relative:
+        scale = max(float(np.max(np.abs(t[0]))) for t in tables)
+        tol = tol * max(scale, np.finfo(float).tiny)
+
+    while True:
+        px = x[:-1, None] + np.array([0.25, 0.5, 0.75]) * np.diff(x)[:, None]
+        py = y[:-1, None] + np.array([0.25, 0.5, 0.75]) * np.diff(y)[:, None]
+        PX, PY = np.meshgrid(px.ravel(), py.ravel(), indexing='ij')
+        cell = _locate(x, PX), _locate(y, PY)
+        err = np.zeros(PX.shape)
+        for c, table in enumerate(tables):
+            exact = np.broadcast_to(stress[c](PX, PY, *params), PX.shape)
+            err = np.maximum(err, np.abs(_hermite_2d((x, y), table, PX, PY, cell) - exact))
+        err = err.reshape(x.size - 1, 3, y.size - 1, 3).max(axis=(1, 3))
+        bad_x, bad_y = (err > tol).any(axis=1), (err > tol).any(axis=0)
+        if not (bad_x.any() or bad_y.any()):
+            break
+        if max(x.size + bad_x.sum(), y.size + bad_y.sum()) > max_knots:
+            warnings.warn(f"Surrogate reached max_knots={max_knots} before tol was met.")
+            break
+        x = np.sort(np.concatenate([x, 0.5 * (x[:-1] + x[1:])[bad_x]]))
+        y = np.sort(np.concatenate([y, 0.5 * (y[:-1] + y[1:])[bad_y]]))
+        tables = tabulate(x, y)
+    surrogate = spline_surrogate('biaxial', (x, y), tables)
+    surrogate.tol = tol
+    return surrogate
+
+
+def _locate(knots, points):
+    """Interval index of each point; raises outside the tabulated domain."""
+    points = np.asarray(points)
+    if np.any(points < knots[0]) or np.any(points > knots[-1]):
+        raise ValueError(f"Strain outside the surrogate domain [{knots[0]}, {knots[-1]}].")
+    return np.clip(np.searchsorted(knots, points, side='right') - 1, 0, knots.size - 2)
+
+
+def _hermite_basis(t):
+    """Cubic Hermite basis (h00, h10, h01, h11) at local coordinates t ∈ [0, 1]."""
+    t2 = t * t
+    t3 = t2 * t
+    return 2 * t3 - 3 * t2 + 1, t3 - 2 * t2 + t, -2 * t3 + 3 * t2, t3 - t2
+
+
+def _hermite_1d(knots, table, points, i):
+    """Evaluate a 1-D cubic Hermite interpolant."""
+    f, d = table
+    h = knots[i + 1] - knots[i]
+    h00, h10, h01, h11 = _hermite_basis((points - knots[i]) / h)
+    return h00 * f[i] + h10 * h * d[i] + h01 * f[i + 1] + h11 * h * d[i + 1]
+
+
+def _hermite_2d(knots, table, px, py, cell):
+    """Evaluate a tensor-product bicubic Hermite interpolant."""
+    (x, y), (f, fx, fy, fxy), (i, j) = knots, table, cell
+    hx, hy = x[i + 1] - x[i], y[j + 1] - y[j]
+    ax = _hermite_basis((px - x[i]) / hx)
+    ay = _hermite_basis((py - y[j]) / hy)
+    value = 0.0
+    for a, (bx0, bx1) in enumerate([(ax[0], ax[1]), (ax[2], ax[3])]):
+        for b, (by0, by1) in enumerate([(ay[0], ay[1]), (ay[2], ay[3])]):
+            ii, jj = i + a, j + b
+            value = value + (bx0 * by0 * f[ii, jj]
+                             + bx1 * hx * by0 * fx[ii, jj]
+                             + bx0 * by1 * hy * fy[ii, jj]
+                             + bx1 * hx * by1 * hy * fxy[ii, jj])
+    return value
@@ -0,0 +1,312 @@
+"""
+uncertainty.py
+==============
+
+Batched uncertainty quantification for fitted hyperelastic parameters.
+
+Both methods evaluate every resample or walker as one parameter array
+through the compiled kernels (the same broadcasting as
+:meth:`~libela.hyperelastic.operations.operations.stress_batch`), so
+hundreds of refits cost a handful of vectorized calls instead of hundreds
+of serial optimizations.
+
+* :func:`bootstrap` — residual or case (pairs) resampling, refitting all
+  resamples simultaneously with a batched Levenberg–Marquardt iteration
+  using :meth:`~libela.hyperelastic.operations.operations.jacobian_kernel`.
+* :func:`ensemble_mcmc` — affine-invariant ensemble sampler (Goodman–Weare
+  stretch move) with a Gaussian likelihood; each half-ensemble update is one
+  batched stress evaluation.
+
+Public API
+----------
+fit_batch        — batched Levenberg–Marquardt least squares
+bootstrap        — bootstrap confidence intervals
+ensemble_mcmc    — ensemble MCMC posterior samples
+summarize        — intervals, standard deviations and correlations of samples
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .operations import strain_converter
+
+
+def fit_batch(model, strain, stress, params0, *, protocol: str = 'uniaxial', stress_type: str = 'cauchy',
+              strain_type: str = 'stretch', weights=None, max_iter: int = 100, tol: float = 1e-10):
+    """
+    Fit many least-squares problems on the same strain points at once.
+
+    Parameters
+    ----------
+    model : operations
+        Hyperelastic model.
+    strain : array_like
+        Strain points, ``(N,)`` or ``(2, N)`` for biaxial.
+    stress : array_like
+        Data, ``(N_sets, M)`` or ``(M,)`` with ``M = N`` (``2N`` for biaxial,
+        σ₁₁ then σ₂₂).
+    params0 : array_like
+        Starting points, ``(N_sets, N_params)`` or ``(N_params,)``.
+    protocol, stress_type, strain_type : str, optional
+        As in :meth:`~libela.hyperelastic.operations.operations.stress`.
+    weights : array_like, optional
+        Non-negative weights broadcastable to ``(N_sets, M)``.
+    max_iter : int, optional
+        Maximum iterations. Default is 100.
+    tol : float, optional
+        Relative step tolerance. Default is 1e-10.
+
+    Returns
+    -------
+    np.ndarray
+        Fitted parameters, ``(N_sets, N_params)``.
+    """
+    lam = _stretch(strain, protocol, strain_type)
+    data = np.atleast_2d(np.asarray(stress, dtype=float))
+    theta = np.atleast_2d(np.asarray(params0, dtype=float)).copy()
+    theta = np.broadcast_to(theta, (max(theta.shape[0], data.shape[0]), theta.shape[1])).copy()
+    data = np.broadcast_to(data, (theta.shape[0], data.shape[-1]))
+    sqrt_w = np.sqrt(np.broadcast_to(1.0 if weights is None else np.asarray(weights, dtype=float), data.shape))
+
+    damping = np.full(theta.shape[0], 1e-3)
+    residual = sqrt_w * (_batch_stress(model, protocol, stress_type, lam, theta) - data)
+    cost = np.einsum('ij,ij->i', residual, residual)
+    eye = np.eye(theta.shape[1])
+    active = np.ones(theta.shape[0], dtype=bool)
+    for _ in range(max_iter):
+        J = sqrt_w[..., None] * _batch_jacobian(model, protocol, stress_type, lam, theta)
+        H = np.einsum('imp,imq->ipq', J, J)
+        g = np.einsum('imp,im->ip', J, residual)
+        scale = np.einsum('ipp->ip', H) + 1e-300
+        step = -np.linalg.solve(H + damping[:, None, None] * scale[:, :, None] * eye, g[..., None])[..., 0]
+        step[~active] = 0.0
+        trial = theta + step
+        with np.errstate(invalid='ignore', over='ignore'):
+            trial_residual = sqrt_w * (_batch_stress(model, protocol, stress_type, lam, trial) - data)
+            trial_cost = np.einsum('ij,ij->i', trial_residual, trial_residual)
+        better = active & (trial_cost <= cost)
+        theta[better], residual[better], cost[better] = trial[better], trial_residual[better], trial_cost[better]
+        damping = np.where(better, damping / 3.0, damping * 4.0)
+        small = np.linalg.norm(step, axis=1) <= tol * (1.0 + np.linalg.norm(theta, axis=1))
+        active &= ~(small | (damping > 1e12))
+        if not active.any():
+            break
+    return theta
+
+
+def bootstrap(model, strain, stress, params0=None, *, protocol: str = 'uniaxial', stress_type: str = 'cauchy',
+              strain_type: str = 'stretch', n_resamples: int = 500, method: str = 'residual',
+              level: float = 0.95, seed=None) -> dict:
+    """
+    Bootstrap confidence intervals by refitting all resamples in one batch.
+
+    Parameters
+    ----------
+    model : operations
+        Hyperelastic model.
+    strain, stress : array_like
+        Test data (``(2, N)`` each for biaxial).
+    params0 : array_like, optional
+        Starting point; defaults to ones.
+    protocol, stress_type, strain_type : str, optional
+        As in :meth:`~libela.hyperelastic.operations.operations.stress`.
+    n_resamples : int, optional
+        Number of bootstrap resamples. Default is 500.
+    method : {'residual', 'pairs'}, optional
+        Resample the residuals of the best fit, or resample the data points
+        (implemented as multinomial point weights). Default is 'residual'.
+    level : float, optional
+        Confidence level of the intervals. Default is 0.95.
+    seed : int or np.random.Generator, optional
+        Random seed.
+
+    Returns
+    -------
+    dict
+        :func:`summarize` of the resampled fits, plus ``'best'`` (the fit to
+        the original data).
+    """
+    if method not in ('residual', 'pairs'):
+        raise ValueError("Invalid method. Use 'residual' or 'pairs'.")
+    rng = np.random.default_rng(seed)
+    n_params = len(model.model_param_symbols())
+    params0 = np.ones(n_params) if params0 is None else np.asarray(params0, dtype=float)
+    data = np.asarray(stress, dtype=float).ravel()
+    kwargs = dict(protocol=protocol, stress_type=stress_type, strain_type=strain_type)
+
+    best = fit_batch(model, strain, data, params0, **kwargs)[0]
+    if method == 'residual':
+        fitted = _batch_stress(model, protocol, stress_type, _stretch(strain, protocol, strain_type), best[None])[0]
+        residual = data - fitted
+        samples = fitted + rng.choice(residual, size=(n_resamples, data.size), replace=True)
+        fits = fit_batch(model, strain, samples, best, **kwargs)
+    else:
+        weights = rng.multinomial(data.size, np.full(data.size, 1.0 / data.size), size=n_resamples)
+        fits = fit_batch(model, strain, np.broadcast_to(data, weights.shape), best,
+                         weights=weights, **kwargs)
+
+    result = summarize(fits, [s.name for s in model.model_param_symbols()], level=level)
+    result['best'] = best
+    return result
+
+
+def ensemble_mcmc(model, strain, stress, params0, *, protocol: str = 'uniaxial', stress_type: str = 'cauchy',
+                  strain_type: str = 'stretch', sigma: float | None = None, bounds=None,
+                  n_walkers: int = 64, n_steps: int = 2000, burn: int | None = None, a: float = 2.0,
+                  level: float = 0.95, seed=None) -> dict:
+    """
+    Sample the parameter posterior with an affine-invariant ensemble sampler.
+
+    Parameters
+    ----------
+    model : operations
+        Hyperelastic model.
+    strain, stress : array_like
+        Test data (``(2, N)`` each for biaxial).
+    params0 : array_like
+        Centre of the initial walker ball, usually a least-squares fit.
+    protocol, stress_type, strain_type : str, optional
+        As in :meth:`~libela.hyperelastic.operations.operations.stress`.
+    sigma : float, optional
+        Measurement noise standard deviation; estimated from the residuals
+        of the best fit if omitted.
+    bounds : tuple of array_like, optional
+        ``(lower, upper)`` of a uniform prior. Default is an improper flat prior.
+    n_walkers : int, optional
+        Ensemble size (even, at least twice the number of parameters). Default is 64.
+    n_steps : int, optional
+        Steps per walker. Default is 2000.
+    burn : int, optional
+        Discarded initial steps. Default is ``n_steps // 4``.
+    a : float, optional
+        Stretch-move scale. Default is 2.
+    level : float, optional
+        Credible-interval level. Default is 0.95.
+    seed : int or np.random.Generator, optional
+        Random seed.
+
+    Returns
+    -------
+    dict
+        :func:`summarize` of the post-burn-in chain, plus ``'chain'``
+        (``(n_steps, n_walkers, N_params)``), ``'acceptance'`` and ``'sigma'``.
+    """
+    rng = np.random.default_rng(seed)
+    lam = _stretch(strain, protocol, strain_type)
+    data = np.asarray(stress, dtype=float).ravel()
+    n_params = len(model.model_param_symbols())
+    if n_walkers % 2 or n_walkers < 2 * n_params:
+        raise ValueError("n_walkers must be even and at least twice the number of parameters.")
+    burn = n_steps // 4 if burn is None else burn
+    center = np.asarray(params0, dtype=float)
+    if sigma is None:
+        best = fit_batch(model, strain, data, center, protocol=protocol,
+                         stress_type=stress_type, strain_type=strain_type)[0]
+        residual = data - _batch_stress(model, protocol, stress_type, lam, best[None])[0]
+        sigma = float(np.sqrt(residual @ residual / max(data.size - n_params, 1)))
+        center = best
+    lower, upper = (np.full(n_params, -np.inf), np.full(n_params, np.inf)) if bounds is None else \
+        (np.asarray(bounds[0], dtype=float), np.asarray(bounds[1], dtype=float))
+
+    def log_prob(theta):
+        with np.errstate(invalid='ignore', over='ignore', divide='ignore'):
+            r = _batch_stress(model, protocol, stress_type, lam, theta) - data
+            lp = -0.5 * np.einsum('ij,ij->i', r, r) / sigma**2
+        inside = np.all((theta >= lower) & (theta <= upper), axis=1)
+        return np.where(inside & np.isfinite(lp), lp, -np.inf)
+
+    spread = 1e-4 * np.maximum(np.abs(center), 1e-8)
+    walkers = center + spread * rng.standard_normal((n_walkers, n_params))
+    walkers = np.clip(walkers, lower, upper)
+    lp = log_prob(walkers)
+    chain = np.empty((n_steps, n_walkers, n_params))
+    accepted = 0
+    half = n_walkers // 2
+    for step in range(n_steps):
+        for first in (slice(0, half), slice(half, None)):
+            other = slice(half, None) if first.start == 0 else slice(0, half)
+            moving, partners = walkers[first], walkers[other]
+            z = ((a - 1.0) * rng.random(half) + 1.0)**2 / a
+            j = rng.integers(half, size=half)
+            proposal = partners[j] + z[:, None] * (moving - partners[j])
+            lp_new = log_prob(proposal)
+            log_accept = (n_params - 1) * np.log(z) + lp_new - lp[first]
+            accept = np.log(rng.random(half)) < log_accept
+            moving[accept] = proposal[accept]
+            lp[first][accept] = lp_new[accept]
+            accepted += accept.sum()
+        chain[step] = walkers
+
+    result = summarize(chain[burn:].reshape(-1, n_params), [s.name for s in model.model_param_symbols()],
+                       level=level)
+    result.update(chain=chain, acceptance=accepted / (n_steps * n_walkers), sigma=sigma)
+    return result
+
+
+def summarize(samples, names=None, *, level: float = 0.95) -> dict:
+    """
+    Summarize parameter samples.
+
+    Parameters
+    ----------
+    samples : array_like
+        ``(N_samples, N_params)``.
+    names : list of str, optional
+        Parameter names.
+    level : float, optional
+        Central interval level. Default is 0.95.
+
+    Returns
+    -------
+    dict
+        ``'names'``, ``'samples'``, ``'mean'``, ``'std'``, ``'interval'``
+        (``(N_params, 2)`` lower/upper percentiles) and ``'correlation'``.
+    """
+    samples = np.asarray(samples, dtype=float)
+    alpha = 100.0 * (1.0 - level) / 2.0
+    std = samples.std(axis=0, ddof=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        correlation = np.corrcoef(samples, rowvar=False)
+    return {'names': list(names) if names is not None else None,
+            'samples': samples,
+            'mean': samples.mean(axis=0),
+            'std': std,
+            'interval': np.percentile(samples, [alpha, 100.0 - alpha], axis=0).T,
+            'correlation': np.atleast_2d(correlation)}
+
+
+# --------------------------------------------------------------------------
+# helper functions
+# --------------------------------------------------------------------------
+
+def _stretch(strain, protocol, strain_type):
+    """Stretch array, ``(2, N)`` for biaxial."""
+    lam = np.asarray(strain_converter(strain, strain_type), dtype=float)
+    return lam.reshape(2, -1) if protocol == 'biaxial' else lam.ravel()
+
+
+def _columns(theta):
+    """Parameter columns shaped ``(N_sets, 1)``."""
+    return [theta[:, j:j + 1] for j in range(theta.shape[1])]
+
+
+def _batch_stress(model, protocol, stress_type, lam, theta):
+    """Model stress for each parameter row, ``(N_sets, M)``."""
+    stress_fn = model.stress_kernel(protocol, stress_type)
+    shape = (theta.shape[0], lam.shape[-1])
+    if protocol == 'biaxial':
+        return np.concatenate([np.broadcast_to(f(lam[0], lam[1], *_columns(theta)), shape)
+                               for f in stress_fn], axis=1)
+    return np.broadcast_to(stress_fn(lam, *_columns(theta)), shape)
+
+
+def _batch_jacobian(model, protocol, stress_type, lam, theta):
+    """Parameter Jacobian for each parameter row, ``(N_sets, M, N_params)``."""
+    jacobian_fn = model.jacobian_kernel(protocol, stress_type)
+    shape = (theta.shape[0], lam.shape[-1])
+    if protocol == 'biaxial':
+        return np.concatenate([np.stack([np.broadcast_to(d(lam[0], lam[1], *_columns(theta)), shape)
+                                         for d in component], axis=-1)
+                               for component in jacobian_fn], axis=1)
+    return np.stack([np.broadcast_to(d(lam, *_columns(theta)), shape) for d in jacobian_fn], axis=-1)
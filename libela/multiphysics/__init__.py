@@ -1 +1,16 @@
+"""
+Multiphysics sub-package
+========================
+Constitutive models coupled to additional fields (temperature, …).
+"""
 
+# --- Re-export core symbols ------------------------------------
+from .thermoelastic import (
+    thermo_hyperelastic,
+    linear_dependence,
+    entropic_dependence,
+)
+
+__all__ = [
+    "thermo_hyperelastic", "linear_dependence", "entropic_dependence"
+]
@@ -0,0 +1,255 @@
+"""
+Thermo-elastic coupling
+=======================
+
+Thermo-hyperelastic wrapper around any :class:`~libela.hyperelastic.operations.operations`
+model, based on the multiplicative split of the deformation gradient into a
+mechanical and an isotropic thermal part,
+
+.. math::
+
+   \\mathbf F = \\mathbf F_m \\mathbf F_\\theta, \\qquad
+   \\mathbf F_\\theta = \\vartheta(T)\\,\\mathbf I, \\qquad
+   \\vartheta(T) = 1 + \\alpha\\,(T - T_{ref}),
+
+with temperature-dependent material parameters :math:`\\theta(T)`. The
+mechanical response is evaluated by the wrapped model's compiled kernels,
+which are derived once per model and shared by every temperature.
+
+Public API
+----------
+thermo_hyperelastic    — thermal-split wrapper for a hyperelastic model
+linear_dependence      — parameter law p(T) = p_ref (1 + c (T - T_ref))
+entropic_dependence    — parameter law p(T) = p_ref T / T_ref
+
+Notes
+-----
+* Stretches (uniaxial, biaxial) are measured from the unheated reference, so
+  the mechanical stretch is λ/ϑ. The amount of simple shear is unchanged by
+  the isotropic thermal part.
+* Stress measures scale as σ = σ_m, P = ϑ² P_m and S = ϑ S_m; the energy
+  per reference volume is ϑ³ W_m.
+* Stretch, temperature and parameter arrays broadcast against each other,
+  e.g. ``lam[None, :]`` and ``T[:, None]`` give a (temperature × stretch) grid.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ..hyperelastic.operations import strain_converter
+
+# Power of the thermal stretch ϑ that maps a mechanical stress measure to the total one.
+_STRESS_SCALING = {'cauchy': 0, 'piola': 2, '2nd-piola': 1}
+
+
+class thermo_hyperelastic:
+    """
+    Thermo-hyperelastic material with a multiplicative thermal split.
+
+    Parameters
+    ----------
+    model : operations
+        Hyperelastic model for the mechanical part, e.g.
+        :class:`~libela.hyperelastic.hyperelastic.neohookean`.
+    alpha : float
+        Linear coefficient of thermal expansion (1/K).
+    t_ref : float
+        Stress-free reference temperature.
+    param_laws : list of callable or None, optional
+        One entry per model parameter: ``law(p_ref, T, t_ref)`` returning the
+        parameter at temperature ``T``, or None for a constant parameter.
+        Default keeps all parameters constant.
+
+    Examples
+    --------
+    >>> from libela.hyperelastic import yeoh
+    >>> model = thermo_hyperelastic(yeoh(), alpha=2e-4, t_ref=293.15,
+    ...                             param_laws=[entropic_dependence, None, None])
+    >>> T = np.linspace(250.0, 400.0, 500)
+    >>> sigma = model.stress(lam[None, :], T[:, None], [0.5, 0.01, 0.001])
+    """
+    def __init__(self, model, *, alpha: float, t_ref: float, param_laws: list | None = None):
+        """
+        Initialize a thermo-hyperelastic wrapper.
+
+        Parameters
+        ----------
+        model : operations
+            Hyperelastic model.
+        alpha : float
+            Linear coefficient of thermal expansion.
+        t_ref : float
+            Reference temperature.
+        param_laws : list of callable or None, optional
+            Temperature laws of the model parameters.
+        """
+        self.model = model
+        self.alpha = float(alpha)
+        self.t_ref = float(t_ref)
+        self.param_laws = param_laws
+
+    def thermal_stretch(self, temperature) -> np.ndarray:
+        """
+        Return the isotropic thermal stretch :math:`\\vartheta(T)`.
+
+        Parameters
+        ----------
+        temperature : array_like or float
+            Temperatures.
+
+        Returns
+        -------
+        np.ndarray
+            :math:`1 + \\alpha (T - T_{ref})`.
+        """
+        return 1.0 + self.alpha * (np.asarray(temperature, dtype=float) - self.t_ref)
+
+    def parameters(self, params: list[float], temperature) -> list:
+        """
+        Evaluate the material parameters at the given temperatures.
+
+        Parameters
+        ----------
+        params : list of float
+            Parameters at the reference temperature.
+        temperature : array_like or float
+            Temperatures.
+
+        Returns
+        -------
+        list
+            One scalar or array per parameter, broadcastable with `temperature`.
+        """
+        if self.param_laws is None:
+            return list(params)
+        if len(self.param_laws) != len(params):
+            raise ValueError("param_laws needs one entry (or None) per parameter.")
+        T = np.asarray(temperature, dtype=float)
+        return [p if law is None else law(p, T, self.t_ref)
+                for p, law in zip(params, self.param_laws)]
+
+    def stress(self,
+               strain: np.ndarray | float,
+               temperature: np.ndarray | float,
+               params: list[float],
+               *,
+               protocol: str | None = None,
+               stress_type: str | None = None,
+               strain_type: str | None = None):
+        """
+        Compute stress over broadcasted stretch and temperature arrays.
+
+        Parameters
+        ----------
+        strain : array_like or float
+            Stretch (uniaxial/biaxial) or amount of shear, measured from the
+            reference temperature. For 'biaxial' the first axis holds λ₁, λ₂.
+        temperature : array_like or float
+            Temperatures, broadcast against `strain`.
+        params : list of float
+            Model parameters at the reference temperature.
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measure. Default is 'cauchy'.
+        strain_type : {'stretch', 'engineering'}, optional
+            Input strain type. Default is 'stretch'.
+
+        Returns
+        -------
+        np.ndarray or tuple of np.ndarray
+            Stress on the broadcast (temperature, stretch) shape; a pair
+            (σ₁₁, σ₂₂) for 'biaxial'.
+        """
+        protocol = protocol or 'uniaxial'
+        stress_type = stress_type or 'cauchy'
+        if stress_type not in _STRESS_SCALING:
+            raise ValueError(f"Unknown stress type: {stress_type}")
+        strain = strain_converter(strain, strain_type or 'stretch')
+        theta = self.thermal_stretch(temperature)
+        params_T = self.parameters(params, temperature)
+        scale = theta ** _STRESS_SCALING[stress_type]
+        stress_fn = self.model.stress_kernel(protocol, stress_type)
+
+        if protocol == 'biaxial':
+            lam1, lam2 = strain[0] / theta, strain[1] / theta
+            return tuple(scale * f(lam1, lam2, *params_T) for f in stress_fn)
+        lam = strain if protocol == 'simple_shear' else strain / theta
+        return scale * stress_fn(lam, *params_T)
+
+    def energy(self,
+               strain: np.ndarray | float,
+               temperature: np.ndarray | float,
+               params: list[float],
+               *,
+               protocol: str | None = None,
+               strain_type: str | None = None) -> np.ndarray:
+        """
+        Compute the mechanical strain energy per reference volume, :math:`\\vartheta^3 W(\\mathbf F_m)`.
+
+        Parameters
+        ----------
+        strain, temperature, params, protocol, strain_type
+            As in :meth:`stress`.
+
+        Returns
+        -------
+        np.ndarray
+            Energy density on the broadcast (temperature, stretch) shape.
+        """
+        protocol = protocol or 'uniaxial'
+        strain = strain_converter(strain, strain_type or 'stretch')
+        theta = self.thermal_stretch(temperature)
+        params_T = self.parameters(params, temperature)
+        energy_fn = self.model.energy_kernel(protocol)
+
+        if protocol == 'biaxial':
+            W = energy_fn(strain[0] / theta, strain[1] / theta, *params_T)
+        else:
+            W = energy_fn(strain if protocol == 'simple_shear' else strain / theta, *params_T)
+        return theta**3 * W
+
+
+# --------------------------------------------------------------------------
+# parameter laws
+# --------------------------------------------------------------------------
+
+def linear_dependence(coefficient: float):
+    """
+    Return the law :math:`p(T) = p_{ref}\\,(1 + c\\,(T - T_{ref}))`.
+
+    Parameters
+    ----------
+    coefficient : float
+        Relative temperature coefficient *c* (1/K).
+
+    Returns
+    -------
+    callable
+        ``law(p_ref, T, t_ref)`` for :class:`thermo_hyperelastic`.
+    """
+    def law(p_ref, temperature, t_ref):
+        return p_ref * (1.0 + coefficient * (temperature - t_ref))
+    return law
+
+
+def entropic_dependence(p_ref, temperature, t_ref):
+    """
+    Entropic-elasticity law :math:`p(T) = p_{ref}\\,T / T_{ref}` (absolute temperatures).
+
+    Parameters
+    ----------
+    p_ref : float
+        Parameter at the reference temperature.
+    temperature : array_like
+        Temperatures.
+    t_ref : float
+        Reference temperature.
+
+    Returns
+    -------
+    np.ndarray
+        Parameter at `temperature`.
+    """
+    return p_ref * np.asarray(temperature, dtype=float) / t_ref
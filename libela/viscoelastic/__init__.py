@@ -1 +1,36 @@
+"""
+Viscoelastic sub-package
+========================
+Time-dependent (linear and quasi-linear) constitutive models.
+"""
 
+# --- Re-export core symbols ------------------------------------
+from .viscoelastic import (
+    prony_series,
+    maxwell,
+)
+from .qlv import qlv
+from .prony_fit import (
+    tau_grid,
+    fit_prony_frequency,
+    fit_prony_relaxation,
+)
+from .tts import (
+    wlf_shift,
+    arrhenius_shift,
+    fit_wlf,
+    fit_arrhenius,
+    shift_factors,
+    master_curve,
+    fit_master_curve,
+    shift_prony,
+)
+# Convenience aliases
+generalized_maxwell = prony_series
+
+__all__ = [
+    "prony_series", "maxwell", "generalized_maxwell",
+    "qlv", "tau_grid", "fit_prony_frequency", "fit_prony_relaxation",
+    "wlf_shift", "arrhenius_shift", "fit_wlf", "fit_arrhenius",
+    "shift_factors", "master_curve", "fit_master_curve", "shift_prony"
+]
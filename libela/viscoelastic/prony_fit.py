@@ -0,0 +1,198 @@
+"""
+Prony-series fitting
+====================
+
+Linear least-squares fitting of Prony series to relaxation or dynamic
+(storage / loss modulus) data.
+
+The relaxation times are fixed on a log-spaced grid, which makes the moduli
+:math:`G_\\infty, G_1, …, G_N` enter the model linearly. The fit is then a
+single (non-negative) least-squares solve instead of a nonlinear optimization
+over :math:`2N + 1` parameters, and stays fast for many-term series.
+
+Public API
+----------
+tau_grid                 — log-spaced relaxation-time grid
+fit_prony_frequency      — fit to storage and/or loss moduli
+fit_prony_relaxation     — fit to a relaxation modulus G(t)
+
+Notes
+-----
+* ``method='nnls'`` (default) keeps every modulus non-negative, which
+  guarantees a thermodynamically admissible series. It requires SciPy.
+* ``weighting='relative'`` divides each residual by the measured value, so
+  data spanning several decades are fitted evenly.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .viscoelastic import prony_series, storage_kernel, loss_kernel
+
+
+def tau_grid(tau_min: float, tau_max: float, *, terms_per_decade: float = 1.0) -> np.ndarray:
+    """
+    Return a log-spaced grid of relaxation times covering ``[tau_min, tau_max]``.
+
+    Parameters
+    ----------
+    tau_min, tau_max : float
+        Smallest and largest relaxation time.
+    terms_per_decade : float, optional
+        Grid density. Default is one term per decade.
+
+    Returns
+    -------
+    np.ndarray
+        Relaxation times in increasing order.
+    """
+    if tau_min <= 0 or tau_max < tau_min:
+        raise ValueError("Need 0 < tau_min <= tau_max.")
+    decades = np.log10(tau_max / tau_min)
+    n_terms = max(int(np.ceil(decades * terms_per_decade)) + 1, 1)
+    return np.logspace(np.log10(tau_min), np.log10(tau_max), n_terms)
+
+
+def fit_prony_frequency(omega,
+                        storage=None,
+                        loss=None,
+                        *,
+                        tau=None,
+                        terms_per_decade: float = 1.0,
+                        method: str = "nnls",
+                        weighting: str = "relative") -> prony_series:
+    """
+    Fit a Prony series to dynamic (DMA) storage and/or loss moduli.
+
+    Parameters
+    ----------
+    omega : array_like
+        Angular frequencies (rad/s).
+    storage : array_like, optional
+        Measured storage modulus :math:`G'` at `omega`.
+    loss : array_like, optional
+        Measured loss modulus :math:`G''` at `omega`.
+    tau : array_like, optional
+        Relaxation-time grid. Default is :func:`tau_grid` spanning
+        ``1/max(omega)`` to ``1/min(omega)``.
+    terms_per_decade : float, optional
+        Grid density used when `tau` is not given.
+    method : {'nnls', 'lstsq'}, optional
+        Non-negative or unconstrained linear least squares.
+    weighting : {'relative', 'absolute'}, optional
+        Residual weighting.
+
+    Returns
+    -------
+    prony_series
+        Fitted model on the relaxation-time grid.
+
+    Examples
+    --------
+    >>> model = fit_prony_frequency(omega, storage, loss, terms_per_decade=2)
+    """
+    omega = np.asarray(omega, dtype=float).ravel()
+    if storage is None and loss is None:
+        raise ValueError("Provide storage and/or loss moduli.")
+    if tau is None:
+        tau = tau_grid(1.0 / omega.max(), 1.0 / omega.min(), terms_per_decade=terms_per_decade)
+    tau = np.asarray(tau, dtype=float)
+
+    blocks, targets = [], []
+    if storage is not None:
+        blocks.append(np.column_stack([np.ones_like(omega), storage_kernel(omega, tau)]))
+        targets.append(np.asarray(storage, dtype=float).ravel())
+    if loss is not None:
+        blocks.append(np.column_stack([np.zeros_like(omega), loss_kernel(omega, tau)]))
+        targets.append(np.asarray(loss, dtype=float).ravel())
+
+    coeffs = _solve_prony(np.vstack(blocks), np.concatenate(targets), method, weighting)
+    return prony_series(coeffs[0], coeffs[1:], tau)
+
+
+def fit_prony_relaxation(time,
+                         modulus,
+                         *,
+                         tau=None,
+                         terms_per_decade: float = 1.0,
+                         method: str = "nnls",
+                         weighting: str = "relative") -> prony_series:
+    """
+    Fit a Prony series to a measured relaxation modulus :math:`G(t)`.
+
+    Parameters
+    ----------
+    time : array_like
+        Sample times.
+    modulus : array_like
+        Measured relaxation modulus at `time`.
+    tau : array_like, optional
+        Relaxation-time grid. Default is :func:`tau_grid` spanning the
+        positive sample times.
+    terms_per_decade : float, optional
+        Grid density used when `tau` is not given.
+    method : {'nnls', 'lstsq'}, optional
+        Non-negative or unconstrained linear least squares.
+    weighting : {'relative', 'absolute'}, optional
+        Residual weighting.
+
+    Returns
+    -------
+    prony_series
+        Fitted model on the relaxation-time grid.
+    """
+    time = np.asarray(time, dtype=float).ravel()
+    if tau is None:
+        positive = time[time > 0]
+        tau = tau_grid(positive.min(), positive.max(), terms_per_decade=terms_per_decade)
+    tau = np.asarray(tau, dtype=float)
+
+    design = np.column_stack([np.ones_like(time), np.exp(-time[:, None] / tau)])
+    coeffs = _solve_prony(design, np.asarray(modulus, dtype=float).ravel(), method, weighting)
+    return prony_series(coeffs[0], coeffs[1:], tau)
+
+
+# --------------------------------------------------------------------------
+# helper functions
+# --------------------------------------------------------------------------
+
+def _solve_prony(design, target, method, weighting):
+    """
+    Solve the weighted linear least-squares problem ``design @ x ≈ target``.
+
+    Parameters
+    ----------
+    design : np.ndarray
+        Design matrix, shape ``(N_data, 1 + N_terms)``.
+    target : np.ndarray
+        Measured values, shape ``(N_data,)``.
+    method : {'nnls', 'lstsq'}
+        Solver.
+    weighting : {'relative', 'absolute'}
+        Residual weighting.
+
+    Returns
+    -------
+    np.ndarray
+        ``[G_inf, G_1, …, G_N]``.
+    """
+    if design.shape[0] != target.shape[0]:
+        raise ValueError("Data arrays must have the same length as omega/time.")
+    if weighting == "relative":
+        scale = np.abs(target)
+        scale = 1.0 / np.where(scale > 0, scale, 1.0)
+    elif weighting == "absolute":
+        scale = np.ones_like(target)
+    else:
+        raise ValueError("Invalid weighting. Use 'relative' or 'absolute'")
+    A = design * scale[:, None]
+    b = target * scale
+
+    if method == "nnls":
+        from scipy.optimize import nnls
+        return nnls(A, b)[0]
+    elif method == "lstsq":
+        return np.linalg.lstsq(A, b, rcond=None)[0]
+    else:
+        raise ValueError("Invalid method. Use 'nnls' or 'lstsq'")
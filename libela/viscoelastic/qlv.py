@@ -0,0 +1,263 @@
+"""
+Quasi-linear viscoelasticity
+============================
+
+Fung's quasi-linear viscoelastic (QLV) model: the instantaneous elastic
+response of a hyperelastic model from :mod:`libela.hyperelastic`, convolved
+with a reduced relaxation function
+
+.. math::
+
+   \\sigma(t) = \\int_{0}^{t} G(t - s) \\, \\frac{d\\sigma^{e}(\\lambda(s))}{ds} \\, ds,
+   \\qquad
+   G(t) = g_\\infty + \\sum_{i=1}^{N} g_i \\, e^{-t/\\tau_i}
+
+The elastic stress :math:`\\sigma^e` comes from the model's compiled stress
+kernel (see :meth:`~libela.hyperelastic.operations.operations.stress_kernel`)
+and the convolution uses the same recursive Prony update as
+:class:`~libela.viscoelastic.viscoelastic.prony_series`, streamed through the
+time series in chunks.
+
+Public API
+----------
+qlv          — quasi-linear viscoelastic wrapper around a hyperelastic model
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .viscoelastic import prony_series, prony_history
+from ..hyperelastic.operations import strain_converter
+
+
+class qlv:
+    """
+    Quasi-linear viscoelastic material built on a hyperelastic model.
+
+    Parameters
+    ----------
+    elastic : operations
+        Hyperelastic model providing the instantaneous elastic response,
+        e.g. :class:`~libela.hyperelastic.hyperelastic.yeoh`.
+    relaxation : prony_series
+        Reduced relaxation function, normally with :math:`G(0) = 1`.
+
+    Examples
+    --------
+    >>> from libela.hyperelastic import yeoh
+    >>> model = qlv(yeoh(), prony_series(0.6, [0.3, 0.1], [1.0, 100.0]))
+    >>> sigma = model.stress(lam, t, [0.1, 0.01, 0.001])
+    """
+    def __init__(self, elastic, relaxation: prony_series):
+        """
+        Initialize a QLV model.
+
+        Parameters
+        ----------
+        elastic : operations
+            Hyperelastic model.
+        relaxation : prony_series
+            Reduced relaxation function.
+        """
+        self.elastic = elastic
+        self.relaxation = relaxation
+
+    def elastic_stress(self,
+                       strain: np.ndarray,
+                       params: list[float],
+                       *,
+                       protocol: str | None = None,
+                       stress_type: str | None = None,
+                       strain_type: str | None = None) -> np.ndarray:
+        """
+        Evaluate the instantaneous elastic stress :math:`\\sigma^e(\\lambda)`.
+
+        Parameters
+        ----------
+        strain : array_like
+            Stretch (or strain) samples. For 'biaxial' the first axis has
+            length 2 and holds λ₁ and λ₂.
+        params : list of float
+            Hyperelastic parameters, in the order of the elastic model.
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measure. Default is 'cauchy'.
+        strain_type : {'stretch', 'engineering'}, optional
+            Input strain type. Default is 'stretch'.
+
+        Returns
+        -------
+        np.ndarray
+            Elastic stress with the shape of `strain`.
+        """
+        protocol = protocol or 'uniaxial'
+        lam = strain_converter(strain, strain_type or 'stretch')
+        stress_fn = self.elastic.stress_kernel(protocol, stress_type or 'cauchy')
+        if protocol == 'biaxial':
+            return np.stack([np.broadcast_to(f(lam[0], lam[1], *params), lam.shape[1:])
+                             for f in stress_fn])
+        return np.broadcast_to(stress_fn(lam, *params), lam.shape)
+
+    def stress(self,
+               strain: np.ndarray,
+               time: np.ndarray,
+               params: list[float],
+               *,
+               protocol: str | None = None,
+               stress_type: str | None = None,
+               strain_type: str | None = None,
+               state: tuple | None = None,
+               chunk_size: int = 16384,
+               return_state: bool = False):
+        """
+        Compute the QLV stress history.
+
+        Parameters
+        ----------
+        strain : array_like
+            Stretch (or strain) history with time along the last axis. Other
+            leading axes are independent histories; for 'biaxial' the first
+            axis holds λ₁ and λ₂.
+        time : array_like
+            1-D, non-decreasing sample times.
+        params : list of float
+            Hyperelastic parameters, in the order of the elastic model.
+        protocol : {'uniaxial', 'simple_shear', 'biaxial'}, optional
+            Deformation protocol. Default is 'uniaxial'.
+        stress_type : {'cauchy', 'piola', '2nd-piola'}, optional
+            Stress measure. Default is 'cauchy'.
+        strain_type : {'stretch', 'engineering'}, optional
+            Input strain type. Default is 'stretch'.
+        state : tuple, optional
+            ``(h, elastic_stress, time)`` from a previous call with
+            ``return_state=True``, to continue a streamed record. By default
+            the material starts stress-free at ``time[0]``.
+        chunk_size : int, optional
+            Number of time steps processed at once; bounds the working memory.
+        return_state : bool, optional
+            If True, also return the state after the last sample.
+
+        Returns
+        -------
+        np.ndarray or tuple
+            Stress history with the shape of `strain`, and the final state if
+            `return_state` is True.
+        """
+        if int(chunk_size) < 1:
+            raise ValueError("chunk_size must be positive.")
+        t = np.asarray(time, dtype=float)
+        strain = np.asarray(strain, dtype=float)
+        if t.ndim != 1 or strain.shape[-1:] != t.shape:
+            raise ValueError("time must be 1-D and match the last axis of strain.")
+        g, tau = self.relaxation.g, self.relaxation.tau
+        batch_shape = strain.shape[:-1] if protocol != 'biaxial' else (2,) + strain.shape[1:-1]
+
+        if state is None:
+            h = np.zeros(batch_shape + (tau.shape[0],))
+            s_prev = np.zeros(batch_shape)
+            t_prev = t[0] if t.size else 0.0
+        else:
+            h, s_prev, t_prev = state
+
+        sigma = np.empty(strain.shape)
+        step = int(chunk_size)
+        for start in range(0, t.shape[0], step):
+            stop = min(start + step, t.shape[0])
+            s_e = self.elastic_stress(strain[..., start:stop], params,
+                                      protocol=protocol,
+                                      stress_type=stress_type,
+                                      strain_type=strain_type)
+            h_c = prony_history(g, tau, s_e, t[start:stop], h, s_prev, t_prev)
+            sigma[..., start:stop] = self.relaxation.g_inf * s_e + h_c.sum(axis=-1)
+            h, s_prev, t_prev = h_c[..., -1, :], s_e[..., -1], t[stop - 1]
+
+        if return_state:
+            return sigma, (h, s_prev, t_prev)
+        return sigma
+
+    def fit(self,
+            strain: np.ndarray,
+            time: np.ndarray,
+            stress_data: np.ndarray,
+            params0: list[float],
+            *,
+            protocol: str | None = None,
+            stress_type: str | None = None,
+            strain_type: str | None = None,
+            fit_relaxation: bool = True):
+        """
+        Fit the hyperelastic parameters and reduced relaxation moduli.
+
+        The relaxation times stay fixed. The reduced moduli are fitted
+        through stick-breaking fractions :math:`v_i \\in [0, 1]`,
+        :math:`g_i = v_i \\prod_{j<i} (1 - v_j)`, so that :math:`g_i \\ge 0`
+        and :math:`g_\\infty = 1 - \\sum g_i = \\prod_i (1 - v_i) \\ge 0`.
+        Every residual evaluation is a single recursive pass, linear in the
+        record length.
+
+        Parameters
+        ----------
+        strain, time : array_like
+            Loading history, as in :meth:`stress`.
+        stress_data : array_like
+            Measured stress with the shape of `strain`.
+        params0 : list of float
+            Initial hyperelastic parameters.
+        protocol, stress_type, strain_type : str, optional
+            As in :meth:`stress`.
+        fit_relaxation : bool, optional
+            If False, only the hyperelastic parameters are fitted.
+
+        Returns
+        -------
+        scipy.optimize.OptimizeResult
+            Optimizer result; ``x`` holds the hyperelastic parameters followed
+            by the fitted :math:`g_i`. :attr:`relaxation` is updated in place.
+        """
+        from scipy.optimize import least_squares
+
+        stress_data = np.asarray(stress_data, dtype=float)
+        n_elastic = len(params0)
+        tau = self.relaxation.tau
+        x0 = list(params0) + (list(_stick_fractions(self.relaxation.g)) if fit_relaxation else [])
+        lower = [-np.inf] * n_elastic + [0.0] * (len(x0) - n_elastic)
+        upper = [np.inf] * n_elastic + [1.0] * (len(x0) - n_elastic)
+
+        def residual(x):
+            if fit_relaxation:
+                g = _stick_breaking(x[n_elastic:])
+                self.relaxation = prony_series(max(1.0 - g.sum(), 0.0), g, tau)
+            predicted = self.stress(strain, time, x[:n_elastic],
+                                    protocol=protocol,
+                                    stress_type=stress_type,
+                                    strain_type=strain_type)
+            return (predicted - stress_data).ravel()
+
+        result = least_squares(residual, x0, bounds=(lower, upper))
+        residual(result.x)
+        if fit_relaxation:
+            result.x = np.concatenate([result.x[:n_elastic], _stick_breaking(result.x[n_elastic:])])
+        return result
+
+
+# --------------------------------------------------------------------------
+# helper functions
+# --------------------------------------------------------------------------
+
+def _stick_breaking(v):
+    """Reduced moduli g_i = v_i Π_{j<i} (1 − v_j) from fractions v ∈ [0, 1]."""
+    v = np.asarray(v, dtype=float)
+    remaining = np.concatenate([[1.0], np.cumprod(1.0 - v)[:-1]])
+    return v * remaining
+
+
+def _stick_fractions(g):
+    """Inverse of :func:`_stick_breaking`, with g rescaled if Σg exceeds 1."""
+    g = np.clip(np.asarray(g, dtype=float), 0.0, None)
+    if g.sum() > 1.0:
+        g = g / g.sum()
+    remaining = 1.0 - np.concatenate([[0.0], np.cumsum(g)[:-1]])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.clip(np.where(remaining > 0, g / remaining, 0.0), 0.0, 1.0)
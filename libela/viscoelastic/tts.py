@@ -0,0 +1,362 @@
+"""
+Time–temperature superposition
+==============================
+
+Shift-factor laws and master-curve construction for thermorheologically
+simple materials. Isothermal segments are shifted along the log-frequency
+axis onto a reference temperature,
+
+.. math::
+
+   \\omega_r = a_T \\, \\omega, \\qquad \\tau_i(T) = a_T \\, \\tau_i(T_{ref}),
+
+and a single Prony series is fitted to the resulting master curve.
+
+Public API
+----------
+wlf_shift            — Williams–Landel–Ferry shift factor log10 a_T
+arrhenius_shift      — Arrhenius shift factor log10 a_T
+fit_wlf              — fit C1, C2 to measured shift factors
+fit_arrhenius        — fit the activation energy to measured shift factors
+shift_factors        — optimal shift factors of all segments at once
+master_curve         — shifted, merged master curve
+fit_master_curve     — master curve plus one Prony-series fit
+shift_prony          — Prony series at another temperature
+
+Notes
+-----
+* Optimal shifts are found for all adjacent segment pairs simultaneously on a
+  grid of candidate shifts (coarse, then fine), minimising the mean squared
+  difference of log-modulus in the overlap; they are then chained outward
+  from the reference temperature.
+* Temperatures are absolute (K) for :func:`arrhenius_shift`.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .viscoelastic import prony_series
+from .prony_fit import fit_prony_frequency
+
+GAS_CONSTANT = 8.314462618  # J / (mol K)
+
+
+def wlf_shift(temperature, t_ref: float, c1: float = 17.44, c2: float = 51.6) -> np.ndarray:
+    """
+    Williams–Landel–Ferry shift factor.
+
+    .. math::
+
+       \\log_{10} a_T = -\\frac{C_1 (T - T_{ref})}{C_2 + T - T_{ref}}
+
+    Parameters
+    ----------
+    temperature : array_like or float
+        Temperatures.
+    t_ref : float
+        Reference temperature.
+    c1, c2 : float, optional
+        WLF constants. Defaults are the "universal" values for :math:`T_{ref} = T_g`.
+
+    Returns
+    -------
+    np.ndarray
+        :math:`\\log_{10} a_T` with the shape of `temperature`.
+    """
+    dT = np.asarray(temperature, dtype=float) - t_ref
+    return -c1 * dT / (c2 + dT)
+
+
+def arrhenius_shift(temperature, t_ref: float, e_a: float) -> np.ndarray:
+    """
+    Arrhenius shift factor.
+
+    .. math::
+
+       \\log_{10} a_T = \\frac{E_a}{R \\ln 10}\\left(\\frac{1}{T} - \\frac{1}{T_{ref}}\\right)
+
+    Parameters
+    ----------
+    temperature : array_like or float
+        Absolute temperatures (K).
+    t_ref : float
+        Absolute reference temperature (K).
+    e_a : float
+        Activation energy (J/mol).
+
+    Returns
+    -------
+    np.ndarray
+        :math:`\\log_{10} a_T` with the shape of `temperature`.
+    """
+    T = np.asarray(temperature, dtype=float)
+    return e_a / (GAS_CONSTANT * np.log(10.0)) * (1.0 / T - 1.0 / t_ref)
+
+
+def fit_wlf(temperature, log_a, t_ref: float) -> tuple[float, float]:
+    """
+    Fit the WLF constants to measured shift factors.
+
+    Rearranged as :math:`C_1 \\Delta T + C_2 \\log a_T = -\\Delta T \\log a_T`,
+    the fit is a linear least-squares solve.
+
+    Parameters
+    ----------
+    temperature : array_like
+        Segment temperatures.
+    log_a : array_like
+        Measured :math:`\\log_{10} a_T`.
+    t_ref : float
+        Reference temperature.
+
+    Returns
+    -------
+    tuple of float
+        ``(c1, c2)``.
+    """
+    dT = np.asarray(temperature, dtype=float) - t_ref
+    log_a = np.asarray(log_a, dtype=float)
+    A = np.column_stack([dT, log_a])
+    c1, c2 = np.linalg.lstsq(A, -dT * log_a, rcond=None)[0]
+    return float(c1), float(c2)
+
+
+def fit_arrhenius(temperature, log_a, t_ref: float) -> float:
+    """
+    Fit the Arrhenius activation energy to measured shift factors.
+
+    Parameters
+    ----------
+    temperature : array_like
+        Absolute segment temperatures (K).
+    log_a : array_like
+        Measured :math:`\\log_{10} a_T`.
+    t_ref : float
+        Absolute reference temperature (K).
+
+    Returns
+    -------
+    float
+        Activation energy :math:`E_a` (J/mol).
+    """
+    x = arrhenius_shift(temperature, t_ref, 1.0)
+    log_a = np.asarray(log_a, dtype=float)
+    return float(x @ log_a / (x @ x))
+
+
+def shift_factors(omega, modulus, temperature, t_ref: float | None = None,
+                  *,
+                  shift_range: tuple[float, float] = (-20.0, 20.0),
+                  resolution: float = 1e-3) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute optimal horizontal shift factors for all isothermal segments.
+
+    Parameters
+    ----------
+    omega : sequence of array_like
+        Angular frequencies of each segment.
+    modulus : sequence of array_like
+        Modulus (e.g. storage modulus) of each segment, same lengths as `omega`.
+    temperature : array_like
+        Temperature of each segment.
+    t_ref : float, optional
+        Reference temperature; its shift is zero. Values between segment
+        temperatures are interpolated. Default is the median temperature.
+    shift_range : tuple of float, optional
+        Range of candidate pairwise shifts in decades.
+    resolution : float, optional
+        Final resolution of the shifts in decades.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        ``(temperature, log_a)`` sorted by temperature.
+    """
+    temperature = np.asarray(temperature, dtype=float)
+    if len(omega) != temperature.shape[0] or len(modulus) != temperature.shape[0]:
+        raise ValueError("Need one omega and one modulus array per temperature.")
+    order = np.argsort(temperature)
+    temperature = temperature[order]
+    log_w, log_g = _pad_segments([omega[k] for k in order], [modulus[k] for k in order])
+
+    if temperature.shape[0] == 1:
+        return temperature, np.zeros(1)
+
+    # pairwise shifts of segment k+1 onto segment k, all pairs at once
+    lo, hi = shift_range
+    coarse = max(resolution, 0.05)
+    candidates = np.arange(lo, hi + coarse, coarse)
+    pair_shift = _best_shift(log_w, log_g, np.broadcast_to(candidates, (temperature.shape[0] - 1,) + candidates.shape))
+    if resolution < coarse:
+        fine = np.arange(-coarse, coarse + resolution, resolution)
+        pair_shift = _best_shift(log_w, log_g, pair_shift[:, None] + fine)
+
+    log_a = np.concatenate([[0.0], np.cumsum(pair_shift)])
+    if t_ref is None:
+        t_ref = float(np.median(temperature))
+    log_a -= np.interp(t_ref, temperature, log_a)
+    return temperature, log_a
+
+
+def master_curve(omega, modulus, temperature, t_ref: float | None = None,
+                 *,
+                 loss=None,
+                 shift_range: tuple[float, float] = (-20.0, 20.0),
+                 resolution: float = 1e-3):
+    """
+    Build a master curve from isothermal segments.
+
+    Shift factors are found from `modulus` (see :func:`shift_factors`) and
+    applied to every segment; the merged curve is sorted by reduced frequency.
+
+    Parameters
+    ----------
+    omega, modulus, temperature, t_ref
+        As in :func:`shift_factors`.
+    loss : sequence of array_like, optional
+        Loss modulus of each segment, shifted with the same factors.
+    shift_range, resolution
+        As in :func:`shift_factors`.
+
+    Returns
+    -------
+    dict
+        ``omega`` (reduced frequencies), ``modulus``, ``loss`` (or None),
+        ``temperature`` and ``log_a`` (per segment, sorted by temperature).
+    """
+    T_sorted, log_a = shift_factors(omega, modulus, temperature, t_ref,
+                                    shift_range=shift_range, resolution=resolution)
+    order = np.argsort(np.asarray(temperature, dtype=float))
+    w_r = np.concatenate([np.asarray(omega[k], dtype=float).ravel() * 10.0**s
+                          for k, s in zip(order, log_a)])
+    idx = np.argsort(w_r)
+    g = np.concatenate([np.asarray(modulus[k], dtype=float).ravel() for k in order])[idx]
+    gl = None
+    if loss is not None:
+        gl = np.concatenate([np.asarray(loss[k], dtype=float).ravel() for k in order])[idx]
+    return {"omega": w_r[idx], "modulus": g, "loss": gl,
+            "temperature": T_sorted, "log_a": log_a}
+
+
+def fit_master_curve(omega, storage, temperature, t_ref: float | None = None,
+                     *,
+                     loss=None,
+                     terms_per_decade: float = 1.0,
+                     method: str = "nnls",
+                     shift_range: tuple[float, float] = (-20.0, 20.0),
+                     resolution: float = 1e-3):
+    """
+    Build the master curve and fit one Prony series to it.
+
+    Parameters
+    ----------
+    omega, storage, temperature, t_ref
+        Segments as in :func:`shift_factors`, using the storage modulus.
+    loss : sequence of array_like, optional
+        Loss modulus of each segment, included in the fit.
+    terms_per_decade : float, optional
+        Relaxation-time grid density over the reduced-frequency range.
+    method : {'nnls', 'lstsq'}, optional
+        Linear least-squares solver, see :func:`fit_prony_frequency`.
+    shift_range, resolution
+        As in :func:`shift_factors`.
+
+    Returns
+    -------
+    tuple
+        ``(model, curve)``: the fitted :class:`prony_series` at `t_ref` and
+        the :func:`master_curve` dictionary.
+    """
+    curve = master_curve(omega, storage, temperature, t_ref, loss=loss,
+                         shift_range=shift_range, resolution=resolution)
+    model = fit_prony_frequency(curve["omega"], curve["modulus"], curve["loss"],
+                                terms_per_decade=terms_per_decade, method=method)
+    return model, curve
+
+
+def shift_prony(model: prony_series, log_a) -> prony_series:
+    """
+    Return the Prony series at another temperature, :math:`\\tau_i \\to a_T \\tau_i`.
+
+    Parameters
+    ----------
+    model : prony_series
+        Series at the reference temperature.
+    log_a : float
+        :math:`\\log_{10} a_T` of the target temperature.
+
+    Returns
+    -------
+    prony_series
+        Shifted series with the same moduli.
+    """
+    return prony_series(model.g_inf, model.g, model.tau * 10.0**float(log_a))
+
+
+# --------------------------------------------------------------------------
+# helper functions
+# --------------------------------------------------------------------------
+
+def _pad_segments(omega, modulus):
+    """
+    Stack segments into NaN-padded (segment × point) arrays of log10 values,
+    each row sorted by frequency.
+    """
+    n_pts = max(np.size(w) for w in omega)
+    log_w = np.full((len(omega), n_pts), np.nan)
+    log_g = np.full((len(omega), n_pts), np.nan)
+    for k, (w, g) in enumerate(zip(omega, modulus)):
+        w = np.asarray(w, dtype=float).ravel()
+        g = np.asarray(g, dtype=float).ravel()
+        if w.shape != g.shape:
+            raise ValueError("omega and modulus segments must have the same length.")
+        idx = np.argsort(w)
+        log_w[k, :w.size] = np.log10(w[idx])
+        log_g[k, :w.size] = np.log10(g[idx])
+    return log_w, log_g
+
+
+def _best_shift(log_w, log_g, candidates):
+    """
+    Pick, for every adjacent pair (k, k+1), the candidate shift of segment k+1
+    that best overlays segment k.
+
+    Parameters
+    ----------
+    log_w, log_g : np.ndarray
+        Padded log-frequency and log-modulus, shape ``(N_seg, N_pts)``.
+    candidates : np.ndarray
+        Candidate shifts per pair, shape ``(N_seg - 1, N_cand)``.
+
+    Returns
+    -------
+    np.ndarray
+        Best shift per pair, shape ``(N_seg - 1,)``.
+    """
+    x_ref, y_ref = log_w[:-1], log_g[:-1]             # (P, M)
+    x_new = log_w[1:, None, :] + candidates[..., None]  # (P, C, M)
+    y_new = log_g[1:, None, :]
+
+    # batched linear interpolation of each reference row
+    n_valid = np.sum(~np.isnan(x_ref), axis=1)
+    x_fill = np.where(np.isnan(x_ref), np.inf, x_ref)
+    idx = np.empty(x_new.shape, dtype=int)
+    for p in range(x_ref.shape[0]):
+        idx[p] = np.searchsorted(x_fill[p, :n_valid[p]], x_new[p])
+    last = (n_valid - 1)[:, None, None]
+    inside = (idx > 0) & (idx <= last) & ~np.isnan(x_new)
+    i1 = np.clip(idx, 1, np.maximum(last, 1))
+    rows = np.arange(x_ref.shape[0])[:, None, None]
+    x0, x1 = x_ref[rows, i1 - 1], x_ref[rows, i1]
+    y0, y1 = y_ref[rows, i1 - 1], y_ref[rows, i1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        y_interp = y0 + (y1 - y0) * (x_new - x0) / (x1 - x0)
+        sq = np.where(inside, (y_interp - y_new) ** 2, 0.0)
+    count = inside.sum(axis=-1)
+    cost = np.where(count >= 2, sq.sum(axis=-1) / np.maximum(count, 1), np.inf)
+
+    if np.any(np.all(np.isinf(cost), axis=1)):
+        k = int(np.flatnonzero(np.all(np.isinf(cost), axis=1))[0])
+        raise ValueError(f"Segments {k} and {k + 1} cannot be overlapped within shift_range.")
+    return candidates[np.arange(cost.shape[0]), np.argmin(cost, axis=1)]
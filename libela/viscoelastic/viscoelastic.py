@@ -0,0 +1,434 @@
+"""
+Viscoelastic material models
+============================
+
+Linear viscoelastic models described by a Prony-series (generalized Maxwell)
+relaxation modulus
+
+.. math::
+
+   G(t) = G_\\infty + \\sum_{i=1}^{N} G_i \\, e^{-t/\\tau_i}
+
+Stress histories are evaluated with the recursive internal-variable update
+instead of the direct hereditary-integral convolution, so that a history of
+*N_t* time steps costs *O(N_t · N_terms)* rather than *O(N_t²)*.
+
+.. note::
+   See :doc:`/theory/viscoelastic/viscoelastic` for mathematical background.
+
+Public API
+----------
+prony_series     — generalized Maxwell model with N relaxation terms
+maxwell          — single-arm Maxwell model (spring and dashpot in series)
+
+Notes
+-----
+* The strain is assumed to vary linearly between two samples, which makes the
+  recursive update exact for piecewise-linear histories.
+* Leading axes of the strain array are treated as independent load histories
+  sharing one time vector; the last axis is time.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+class prony_series:
+    """
+    Generalized Maxwell (Prony-series) linear viscoelastic model.
+
+    Parameters
+    ----------
+    g_inf : float
+        Long-term (equilibrium) modulus :math:`G_\\infty`.
+    g : array_like
+        Moduli :math:`G_i` of the Maxwell arms.
+    tau : array_like
+        Relaxation times :math:`\\tau_i`, same length as `g`.
+
+    Examples
+    --------
+    >>> model = prony_series(1.0, [2.0, 0.5], [0.1, 10.0])
+    >>> t = np.linspace(0.0, 100.0, 1_000_001)
+    >>> sigma = model.stress(np.full_like(t, 0.01), t)
+    """
+    def __init__(self, g_inf: float, g, tau):
+        """
+        Initialize a Prony-series model.
+
+        Parameters
+        ----------
+        g_inf : float
+            Long-term modulus.
+        g : array_like
+            Moduli of the Maxwell arms.
+        tau : array_like
+            Relaxation times of the Maxwell arms.
+        """
+        self.g_inf = float(g_inf)
+        self.g = np.atleast_1d(np.asarray(g, dtype=float))
+        self.tau = np.atleast_1d(np.asarray(tau, dtype=float))
+        if self.g.ndim != 1 or self.g.shape != self.tau.shape:
+            raise ValueError("g and tau must be 1-D arrays of the same length.")
+        if np.any(self.tau <= 0):
+            raise ValueError("Relaxation times tau must be positive.")
+
+    @property
+    def n_terms(self) -> int:
+        """Number of Maxwell arms."""
+        return self.g.shape[0]
+
+    @property
+    def g_0(self) -> float:
+        """Instantaneous (glassy) modulus :math:`G_0 = G_\\infty + \\sum G_i`."""
+        return self.g_inf + float(self.g.sum())
+
+    def relaxation_modulus(self, time: np.ndarray | float) -> np.ndarray:
+        """
+        Evaluate the relaxation modulus :math:`G(t)`.
+
+        Parameters
+        ----------
+        time : array_like or float
+            Times at which to evaluate the modulus.
+
+        Returns
+        -------
+        np.ndarray
+            :math:`G(t)` with the shape of `time`.
+        """
+        t = np.asarray(time, dtype=float)
+        return self.g_inf + np.exp(-t[..., None] / self.tau) @ self.g
+
+    def storage_modulus(self, omega: np.ndarray | float) -> np.ndarray:
+        """
+        Evaluate the storage modulus :math:`G'(\\omega)`.
+
+        .. math::
+
+           G'(\\omega) = G_\\infty + \\sum_i G_i \\frac{\\omega^2\\tau_i^2}{1 + \\omega^2\\tau_i^2}
+
+        Parameters
+        ----------
+        omega : array_like or float
+            Angular frequencies (rad/s).
+
+        Returns
+        -------
+        np.ndarray
+            :math:`G'(\\omega)` with the shape of `omega`.
+        """
+        return self.g_inf + storage_kernel(omega, self.tau) @ self.g
+
+    def loss_modulus(self, omega: np.ndarray | float) -> np.ndarray:
+        """
+        Evaluate the loss modulus :math:`G''(\\omega)`.
+
+        .. math::
+
+           G''(\\omega) = \\sum_i G_i \\frac{\\omega\\tau_i}{1 + \\omega^2\\tau_i^2}
+
+        Parameters
+        ----------
+        omega : array_like or float
+            Angular frequencies (rad/s).
+
+        Returns
+        -------
+        np.ndarray
+            :math:`G''(\\omega)` with the shape of `omega`.
+        """
+        return loss_kernel(omega, self.tau) @ self.g
+
+    def complex_modulus(self, omega: np.ndarray | float) -> np.ndarray:
+        """
+        Evaluate the complex modulus :math:`G^* = G' + iG''`.
+
+        Parameters
+        ----------
+        omega : array_like or float
+            Angular frequencies (rad/s).
+
+        Returns
+        -------
+        np.ndarray
+            Complex array with the shape of `omega`.
+        """
+        return self.storage_modulus(omega) + 1j * self.loss_modulus(omega)
+
+    def loss_tangent(self, omega: np.ndarray | float) -> np.ndarray:
+        """
+        Evaluate the loss factor :math:`\\tan\\delta = G''/G'`.
+
+        Parameters
+        ----------
+        omega : array_like or float
+            Angular frequencies (rad/s).
+
+        Returns
+        -------
+        np.ndarray
+            :math:`\\tan\\delta` with the shape of `omega`.
+        """
+        return self.loss_modulus(omega) / self.storage_modulus(omega)
+
+    def stress(self,
+               strain: np.ndarray,
+               time: np.ndarray,
+               *,
+               strain_type: str | None = None,
+               state: tuple | None = None,
+               chunk_size: int = 16384,
+               return_state: bool = False):
+        """
+        Compute the stress history for one or many strain histories.
+
+        Parameters
+        ----------
+        strain : array_like
+            Strain history with time along the last axis. Leading axes are
+            independent histories evaluated in parallel.
+        time : array_like
+            1-D, non-decreasing sample times shared by all histories.
+        strain_type : {'engineering', 'stretch'}, optional
+            Input strain type. Default is 'engineering'.
+        state : tuple, optional
+            ``(h, strain, time)`` returned by a previous call with
+            ``return_state=True``. Continues that history, so long records can
+            be streamed through in consecutive pieces. By default the material
+            starts unstrained at ``time[0]``.
+        chunk_size : int, optional
+            Number of time steps processed at once; bounds the working memory.
+        return_state : bool, optional
+            If True, also return the state after the last sample.
+
+        Returns
+        -------
+        np.ndarray or tuple
+            Stress history with the shape of `strain`, and the final state if
+            `return_state` is True.
+        """
+        if int(chunk_size) < 1:
+            raise ValueError("chunk_size must be positive.")
+        chunk_size = int(chunk_size)
+        eps = _to_strain(strain, strain_type or "engineering")
+        t = np.asarray(time, dtype=float)
+        if t.ndim != 1 or eps.shape[-1:] != t.shape:
+            raise ValueError("time must be 1-D and match the last axis of strain.")
+
+        if state is None:
+            h = np.zeros(eps.shape[:-1] + (self.n_terms,))
+            eps_prev = np.zeros(eps.shape[:-1])
+            t_prev = t[0] if t.size else 0.0
+        else:
+            h, eps_prev, t_prev = state
+            h = np.broadcast_to(h, eps.shape[:-1] + (self.n_terms,))
+            eps_prev = np.broadcast_to(eps_prev, eps.shape[:-1])
+
+        sigma = np.empty(eps.shape)
+        for start in range(0, t.shape[0], chunk_size):
+            stop = min(start + chunk_size, t.shape[0])
+            eps_c, t_c = eps[..., start:stop], t[start:stop]
+            h_c = prony_history(self.g, self.tau, eps_c, t_c, h, eps_prev, t_prev)
+            sigma[..., start:stop] = self.g_inf * eps_c + h_c.sum(axis=-1)
+            h, eps_prev, t_prev = h_c[..., -1, :], eps_c[..., -1], t_c[-1]
+
+        if return_state:
+            return sigma, (h, eps_prev, t_prev)
+        return sigma
+
+
+class maxwell(prony_series):
+    """
+    Single-arm Maxwell model: a spring of modulus *E* in series with a dashpot.
+
+    Equivalent to a :class:`prony_series` with :math:`G_\\infty = 0` and one
+    term of relaxation time :math:`\\tau = \\eta / E`.
+
+    Parameters
+    ----------
+    e : float
+        Spring modulus *E*.
+    tau : float
+        Relaxation time :math:`\\tau`.
+
+    Examples
+    --------
+    >>> model = maxwell(e=1.0, tau=2.0)
+    >>> G = model.relaxation_modulus([0.0, 2.0])
+    """
+    def __init__(self, e: float, tau: float):
+        """
+        Initialize a Maxwell model.
+
+        Parameters
+        ----------
+        e : float
+            Spring modulus.
+        tau : float
+            Relaxation time.
+        """
+        super().__init__(0.0, [e], [tau])
+
+
+# --------------------------------------------------------------------------
+# helper functions
+# --------------------------------------------------------------------------
+
+def storage_kernel(omega, tau):
+    """
+    Storage-modulus basis :math:`\\omega^2\\tau_i^2 / (1 + \\omega^2\\tau_i^2)`.
+
+    Parameters
+    ----------
+    omega : array_like
+        Angular frequencies, any shape.
+    tau : np.ndarray
+        Relaxation times, shape ``(N_terms,)``.
+
+    Returns
+    -------
+    np.ndarray
+        Basis values on the (frequency × term) grid, shape ``omega.shape + (N_terms,)``.
+    """
+    wt = np.asarray(omega, dtype=float)[..., None] * tau
+    wt2 = wt * wt
+    return wt2 / (1.0 + wt2)
+
+
+def loss_kernel(omega, tau):
+    """
+    Loss-modulus basis :math:`\\omega\\tau_i / (1 + \\omega^2\\tau_i^2)`.
+
+    Parameters
+    ----------
+    omega : array_like
+        Angular frequencies, any shape.
+    tau : np.ndarray
+        Relaxation times, shape ``(N_terms,)``.
+
+    Returns
+    -------
+    np.ndarray
+        Basis values on the (frequency × term) grid, shape ``omega.shape + (N_terms,)``.
+    """
+    wt = np.asarray(omega, dtype=float)[..., None] * tau
+    return wt / (1.0 + wt * wt)
+
+
+def prony_history(g, tau, strain, time, h0, strain_prev, time_prev):
+    """
+    Advance the Prony-series internal variables through a strain history.
+
+    Each arm carries the internal stress
+
+    .. math::
+
+       h_i^{n} = e^{-\\Delta t/\\tau_i} h_i^{n-1}
+               + G_i \\frac{1 - e^{-\\Delta t/\\tau_i}}{\\Delta t/\\tau_i} \\Delta\\varepsilon^{n},
+
+    which is the exact hereditary integral for a strain that is linear
+    between samples. A zero time step is an instantaneous jump.
+
+    Parameters
+    ----------
+    g, tau : np.ndarray
+        Arm moduli and relaxation times, shape ``(N_terms,)``.
+    strain : np.ndarray
+        Strain history, shape ``(..., N_t)``.
+    time : np.ndarray
+        Sample times, shape ``(N_t,)``.
+    h0 : np.ndarray
+        Internal variables before the first sample, shape ``(..., N_terms)``.
+    strain_prev, time_prev : np.ndarray or float
+        Strain and time of the sample preceding `strain`.
+
+    Returns
+    -------
+    np.ndarray
+        Internal variables at every sample, shape ``(..., N_t, N_terms)``.
+    """
+    dt = np.diff(time, prepend=time_prev)
+    if np.any(dt < 0):
+        raise ValueError("time must be non-decreasing.")
+    d_eps = np.diff(strain, axis=-1, prepend=np.asarray(strain_prev)[..., None])
+
+    x = dt[:, None] / tau
+    decay = np.exp(-x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = np.where(x > 0, -np.expm1(-x) / x, 1.0)
+    forcing = (g * weight) * d_eps[..., None]
+    return linear_recurrence(decay, forcing, h0)
+
+
+def linear_recurrence(decay, forcing, h0):
+    """
+    Solve :math:`h^n = a^n h^{n-1} + c^n` along the time axis.
+
+    Uses :func:`scipy.signal.lfilter` (one call per term, vectorized over all
+    histories) when the decay factors are constant in time, i.e. for uniform
+    time steps, and a loop over time steps vectorized over histories and terms
+    otherwise.
+
+    Parameters
+    ----------
+    decay : np.ndarray
+        Decay factors :math:`a^n`, shape ``(N_t, N_terms)``.
+    forcing : np.ndarray
+        Forcing :math:`c^n`, shape ``(..., N_t, N_terms)``.
+    h0 : np.ndarray
+        Initial value, shape ``(..., N_terms)``.
+
+    Returns
+    -------
+    np.ndarray
+        :math:`h^n` with the shape of `forcing`.
+    """
+    h = np.empty(np.broadcast_shapes(forcing.shape, np.shape(h0)[:-1] + forcing.shape[-2:]))
+    n_t = decay.shape[0]
+    if n_t == 0:
+        return h
+    h[..., 0, :] = decay[0] * h0 + forcing[..., 0, :]
+    if n_t == 1:
+        return h
+
+    uniform = np.allclose(decay[1:], decay[1], rtol=1e-12, atol=0.0)
+    try:
+        from scipy.signal import lfilter
+    except ImportError:
+        uniform = False
+
+    if uniform:
+        for j, a in enumerate(decay[1]):
+            h[..., 1:, j] = lfilter([1.0], [1.0, -a], forcing[..., 1:, j], axis=-1,
+                                    zi=a * h[..., 0, j:j + 1])[0]
+    else:
+        for n in range(1, n_t):
+            h[..., n, :] = decay[n] * h[..., n - 1, :] + forcing[..., n, :]
+    return h
+
+
+def _to_strain(strain, strain_type):
+    """
+    Convert input strain into small (engineering) strain ε.
+
+    Parameters
+    ----------
+    strain : array_like
+        Input strain or stretch.
+    strain_type : {'engineering', 'stretch'}
+        Type of input strain; stretches are converted with ε = λ - 1.
+
+    Returns
+    -------
+    np.ndarray
+        Engineering strain as a float array.
+    """
+    strain = np.asarray(strain, dtype=float)
+    if strain_type == "engineering":
+        return strain
+    elif strain_type == "stretch":
+        return strain - 1.0
+    else:
+        raise ValueError("Invalid strain type. Use 'engineering' or 'stretch'")
@@ -0,0 +1,29 @@
+"""evaluate() agrees with stress() for fiber-reinforced models."""
+
+import numpy as np
+import pytest
+
+from libela.hyperelastic import hgo
+
+
+STRAIN = np.vstack([np.linspace(0.8, 1.6, 4), np.linspace(1.1, 1.3, 4)])
+
+
+@pytest.mark.parametrize("compressible, params", [(False, [0.01, 1.0, 5.0, 0.6]),
+                                                  (True, [50.0, 0.2, 1.0, 2.0, 0.6])])
+@pytest.mark.parametrize("stress_type", ["cauchy", "piola", "2nd-piola"])
+def test_evaluate_matches_stress_biaxial(compressible, params, stress_type):
+    model = hgo(compressible=compressible)
+    expected = model.stress(STRAIN, params, protocol="biaxial", stress_type=stress_type)
+    result = model.evaluate({"biaxial": STRAIN}, params, protocols=["biaxial"],
+                            stress_types=[stress_type])["biaxial"]["stress"][stress_type]
+    for component, reference in zip(result, expected):
+        np.testing.assert_allclose(component, reference, rtol=1e-9)
+
+
+def test_evaluate_uniaxial_solves_lateral_stretches():
+    model = hgo()
+    params = [0.01, 1.0, 5.0, np.radians(40)]
+    lam = np.array([1.1, 1.3])
+    result = model.evaluate(lam, params, protocols=["uniaxial"])["uniaxial"]["stress"]["cauchy"]
+    np.testing.assert_allclose(result, model.stress(lam, params), rtol=1e-9)
@@ -0,0 +1,54 @@
+"""Stress measures of compressible models agree between the symbolic and numeric paths."""
+
+import numpy as np
+import pytest
+
+from libela.hyperelastic import neohookean, volumetric, yeoh
+
+
+LAM = np.linspace(0.7, 2.0, 5)
+
+
+@pytest.mark.parametrize("stress_type", ["cauchy", "piola", "2nd-piola"])
+def test_stress_matches_evaluate_uniaxial(stress_type):
+    model = neohookean(compressible=True)
+    params = [100.0, 0.5]
+    expected = model.evaluate(LAM, params, protocols=["uniaxial"],
+                              stress_types=[stress_type])["uniaxial"]["stress"][stress_type]
+    np.testing.assert_allclose(model.stress(LAM, params, stress_type=stress_type), expected, rtol=1e-12)
+
+
+def test_compressible_piola_closed_form():
+    # F = diag(λ, 1, 1): P₁₁ = μλ + K(λ − 1)
+    K, mu = 100.0, 0.5
+    piola = neohookean(compressible=True).stress(LAM, [K, mu], stress_type="piola")
+    np.testing.assert_allclose(piola, mu * LAM + K * (LAM - 1), rtol=1e-12)
+
+
+@pytest.mark.parametrize("stress_type", ["cauchy", "piola", "2nd-piola"])
+def test_stress_matches_evaluate_biaxial(stress_type):
+    model = neohookean(compressible=True)
+    params = [50.0, 1.0]
+    strain = np.vstack([np.linspace(0.8, 1.6, 4), np.linspace(1.1, 1.3, 4)])
+    expected = model.evaluate({"biaxial": strain}, params, protocols=["biaxial"],
+                              stress_types=[stress_type])["biaxial"]["stress"][stress_type]
+    result = model.stress(strain, params, protocol="biaxial", stress_type=stress_type)
+    for component, reference in zip(result, expected):
+        np.testing.assert_allclose(component, reference, rtol=1e-10)
+
+
+def test_piola_is_energy_derivative():
+    model = neohookean(compressible=True)
+    params = [100.0, 0.5]
+    energy = model.energy_kernel("uniaxial")
+    h = 1e-6
+    derivative = (energy(LAM + h, *params) - energy(LAM - h, *params)) / (2 * h)
+    np.testing.assert_allclose(model.stress(LAM, params, stress_type="piola"), derivative, rtol=1e-6)
+
+
+def test_composite_isochoric_part_is_stress_free_at_rest():
+    model = yeoh() + volumetric()
+    params = [0.5, 0.01, 0.001, 100.0]
+    np.testing.assert_allclose(model.stress(np.array([1.0]), params), 0.0, atol=1e-12)
+    s11, s22 = model.stress(np.ones((2, 1)), params, protocol="biaxial")
+    np.testing.assert_allclose([s11, s22], 0.0, atol=1e-12)